@@ -0,0 +1,219 @@
+"""Load test of many accounts against the local stand-in of LMS
+
+Every account signs in and calls the getters of the scenario. The report is printed as JSON:
+requests per second, p50 and p99 latency of getter calls, and CPU time of the client per account.
+
+    python benchmarks/load.py --accounts 100 --concurrency 16 --mode pool --latency 20
+    python benchmarks/load.py --accounts 100 --mode async --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Process
+from time import perf_counter, process_time, sleep
+from typing import List, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import server
+
+SCENARIO: Tuple[str, ...] = (
+    "get_info", "get_schedule", "get_news", "get_notify", "get_unread_messages", "get_marks", "get_events",
+)
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_server(port: int, options: server.StandInOptions) -> None:
+    server.serve(port, options).serve_forever()
+
+
+def wait_server(port: int, timeout: float = 10.0) -> None:
+    start: float = perf_counter()
+
+    while perf_counter() - start < timeout:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.1).close()
+            return
+        except OSError:
+            sleep(0.05)
+
+    raise TimeoutError("Stand-in did not start on port %d" % port)
+
+
+def percentile(values: List[float], share: float) -> float:
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+
+    return values[min(int(len(values) * share), len(values) - 1)]
+
+
+def run_scenario(client, scenario: Tuple[str, ...]) -> dict:
+    """Calls getters of scenario, returns latencies of calls, amount of requests and errors"""
+
+    latencies: List[float] = []
+    errors: List[str] = []
+
+    for getter in scenario:
+        start: float = perf_counter()
+        try:
+            getattr(client, getter)()
+        except Exception as error:
+            errors.append("%s: %s: %s" % (getter, type(error).__name__, error))
+        latencies.append((perf_counter() - start) * 1000)
+
+    return {"latencies": latencies, "requests": client.amount_requests, "errors": errors}
+
+
+def run_lms(accounts: List[Tuple[str, str]], concurrency: int, scenario: Tuple[str, ...], options: dict) -> List[dict]:
+    from lms_synergy_library import LMS
+
+    def run(account: Tuple[str, str]) -> dict:
+        try:
+            client = LMS(login=account[0], password=account[1], **options)
+        except Exception as error:
+            return {"latencies": [], "requests": 0, "errors": ["sign: %s: %s" % (type(error).__name__, error)]}
+
+        try:
+            return run_scenario(client, scenario)
+        finally:
+            client.close()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(run, accounts))
+
+
+def run_pool(accounts: List[Tuple[str, str]], concurrency: int, scenario: Tuple[str, ...], options: dict) -> List[dict]:
+    from lms_synergy_library import LMSPool
+
+    # max_workers of LMSPool is the amount of accounts served at once, pages of one account are fetched one by one
+    options = {name: value for name, value in options.items() if name != "max_workers"}
+
+    with LMSPool(max_workers=concurrency, **options) as pool:
+        results: List[dict] = pool.run(lambda client: run_scenario(client, scenario), accounts)
+
+    return [
+        result["result"] if result["error"] is None
+        else {"latencies": [], "requests": 0, "errors": ["sign: %s" % result["error"]]}
+        for result in results
+    ]
+
+
+def run_async(accounts: List[Tuple[str, str]], concurrency: int, scenario: Tuple[str, ...], options: dict) -> List[dict]:
+    from lms_synergy_library import AsyncLMS
+
+    async def run(account: Tuple[str, str], semaphore: asyncio.Semaphore) -> dict:
+        latencies: List[float] = []
+        errors: List[str] = []
+
+        async with semaphore:
+            client = AsyncLMS(login=account[0], password=account[1], **options)
+            try:
+                await client.sign()
+
+                for getter in scenario:
+                    start: float = perf_counter()
+                    try:
+                        await getattr(client, getter)()
+                    except Exception as error:
+                        errors.append("%s: %s: %s" % (getter, type(error).__name__, error))
+                    latencies.append((perf_counter() - start) * 1000)
+            except Exception as error:
+                errors.append("sign: %s: %s" % (type(error).__name__, error))
+            finally:
+                await client.close()
+
+        return {"latencies": latencies, "requests": client.amount_requests if client.session else 0, "errors": errors}
+
+    async def main() -> List[dict]:
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(run(account, semaphore) for account in accounts))
+
+    return asyncio.run(main())
+
+
+MODES: dict = {
+    "lms": run_lms,
+    "pool": run_pool,
+    "async": run_async,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--mode", choices=list(MODES), default="lms", help="Client of accounts")
+    parser.add_argument("--accounts", type=int, default=20, help="Amount of simulated accounts")
+    parser.add_argument("--concurrency", type=int, default=8, help="Accounts served at once")
+    parser.add_argument("--max-workers", type=int, default=4, help="Pages of one account fetched at once")
+    parser.add_argument("--getter", action="append", help="Getter of scenario, the default scenario if none")
+    parser.add_argument("--url", help="Running server instead of a new stand-in")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency of the stand-in in milliseconds")
+    parser.add_argument("--rows", type=int, default=10, help="Rows per page of the stand-in")
+    parser.add_argument("--pages", type=int, default=3, help="Pages of paginated lists of the stand-in")
+    parser.add_argument("--disciplines", type=int, default=8, help="Disciplines of the stand-in")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of failed responses of the stand-in")
+    parser.add_argument("--max-page-size", type=int, default=100, help="Largest pageSize of notifications of the stand-in")
+    args = parser.parse_args()
+
+    process: Process = None
+
+    if args.url:
+        os.environ["LMS_SYNERGY_URL"] = args.url
+    else:
+        port: int = get_free_port()
+        options = server.StandInOptions(
+            args.latency, args.rows, args.pages, args.disciplines, args.error_rate, max_page_size=args.max_page_size
+        )
+        process = Process(target=run_server, args=(port, options), daemon=True)
+        process.start()
+        wait_server(port)
+        os.environ["LMS_SYNERGY_URL"] = "http://127.0.0.1:%d" % port
+
+    accounts: List[Tuple[str, str]] = [("user%d" % i, "password") for i in range(args.accounts)]
+    scenario: Tuple[str, ...] = tuple(args.getter) if args.getter else SCENARIO
+
+    cpu: float = process_time()
+    start: float = perf_counter()
+
+    try:
+        results: List[dict] = MODES[args.mode](accounts, args.concurrency, scenario, {"max_workers": args.max_workers})
+    finally:
+        if process is not None:
+            process.terminate()
+
+    seconds: float = perf_counter() - start
+    cpu = process_time() - cpu
+    latencies: List[float] = [latency for result in results for latency in result["latencies"]]
+    errors: List[str] = [error for result in results for error in result["errors"]]
+    requests: int = sum(result["requests"] for result in results)
+
+    print(json.dumps({
+        "mode": args.mode,
+        "accounts": args.accounts,
+        "concurrency": args.concurrency,
+        "scenario": scenario,
+        "seconds": round(seconds, 3),
+        "requests": requests,
+        "requests_per_second": round(requests / seconds, 1),
+        "calls": len(latencies),
+        "p50_ms": round(percentile(latencies, 0.5), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "cpu_ms_per_account": round(cpu * 1000 / args.accounts, 3),
+        "failed_calls": len(errors),
+        "errors": errors[:10],
+    }, indent=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Anonymized pages of LMS built with the markup of the real site, sized by amount of rows"""
+
+SIZES: dict = {
+    "small": 2,
+    "typical": 10,
+    "large": 500,
+}
+
+TITLES: dict = {
+    "ru": {
+        "messages": "Личные сообщения",
+        "notifications": "Уведомления",
+        "unverified_work": "Требуют проверки",
+        "roles": {"student": "Студент", "teacher": "Преподаватель"},
+    },
+    "en": {
+        "messages": "Private messages",
+        "notifications": "Notifications",
+        "unverified_work": "Require verification",
+        "roles": {"student": "Student", "teacher": "Teacher"},
+    },
+}
+
+
+def header(language: str = "en", type_user: str = "student", amount: int = 3) -> str:
+    """Returns header of page: user name, counters and role switcher"""
+
+    titles: dict = TITLES[language]
+    role: str = titles["roles"][type_user]
+    roles: str = "".join(
+        '<li><b>%s</b></li><li><a href="/user/role/%s">%s</a></li>' % (name.lower(), key, key)
+        for key, name in titles["roles"].items()
+    )
+    unverified_work: str = (
+        '<a class="counter" title="%s" href="/teacher/works"> %d </a>' % (titles["unverified_work"], amount)
+        if type_user == "teacher" else ""
+    )
+
+    return (
+        '<div class="header"><a class="logo" href="/"><img src="/img/logo.png" alt=""></a>'
+        '<div class="user-name">  Ivanov   Ivan  Ivanovich </div>'
+        '<a class="counter" title="%s" href="/messages/listing"> %d </a>'
+        '<a class="counter" title="%s" href="/student/notifications"> %d </a>%s'
+        '<div id="switch-accounts"><div class="drop-menu-label"><span class="title">%s</span></div>'
+        '<div class="drop-menu drop-select small"><ul>%s</ul></div></div></div>'
+        % (titles["messages"], amount, titles["notifications"], amount * 2, unverified_work, role.lower(), roles)
+    )
+
+
+def layout(body: str, language: str = "en", type_user: str = "student") -> str:
+    """Returns page with head, menu and footer of the site around body"""
+
+    head: str = "".join(
+        '<link rel="stylesheet" href="/css/style%d.css"><script src="/js/app%d.js"></script>' % (i, i)
+        for i in range(20)
+    )
+    script: str = "<script>var menu = {%s};</script>" % ",".join('"item%d": "/page/%d"' % (i, i) for i in range(200))
+    menu: str = "".join(
+        '<li class="menu-item"><a href="/section/%d"><i class="icon-%d"></i><span> Section %d </span></a></li>'
+        % (i, i, i)
+        for i in range(60)
+    )
+    footer: str = "".join('<p class="copyright"> Footer text %d </p>' % i for i in range(10))
+
+    return (
+        '<!DOCTYPE html><html lang="%s"><head><meta charset="utf-8"><title>LMS</title>%s%s</head><body>'
+        '%s<div class="layout"><ul class="left-menu">%s</ul><div class="content">%s</div></div>'
+        '<div class="footer">%s</div></body></html>'
+        % (language, head, script, header(language, type_user), menu, body, footer)
+    )
+
+
+def paginator(url: str, page: int, pages: int, separator: str = "?page=") -> str:
+    """Returns paginator of page, the last link leads to the next page"""
+
+    if pages <= 1:
+        return ""
+
+    links: str = "".join('<a href="%s%s%d">%d</a>' % (url, separator, i, i) for i in range(1, pages + 1))
+    next_link: str = "%s%s%d" % (url, separator, page + 1) if page < pages else "javascript:void(0);"
+
+    return '<div class="paginator">%s<a href="%s">&raquo;</a></div>' % (links, next_link)
+
+
+def curators(block_id: str, amount: int) -> str:
+    items: str = "".join(
+        '<li><span class="curatorName">Curator %d</span><i class="icon-helpdesk"></i> +7 900 000-00-%02d '
+        '<i class="icon-mail"></i><a href="mailto:curator%d@example.com">curator%d@example.com</a></li>'
+        % (i, i % 100, i, i)
+        for i in range(amount)
+    )
+
+    return '<div id="%s"><ul class="curatorList">%s</ul></div>' % (block_id, items)
+
+
+def schedule(rows: int, language: str = "en", type_user: str = "student") -> str:
+    """Returns schedule page with rows lessons, two lessons a day"""
+
+    trs: list = []
+
+    for i in range(rows):
+        if i % 2 == 0:
+            trs.append("<tr><th> %02d.02.23, Tue </th></tr>" % (i // 2 % 28 + 1))
+
+        if type_user == "teacher":
+            cells: tuple = ("%02d:%02d - 11:40" % (9 + i % 2, i % 60), "Discipline %d" % i, "group-%d" % (i % 7),
+                            "D-%d" % (100 + i % 50), "lecture")
+        else:
+            cells: tuple = ("%02d:%02d - 11:40" % (9 + i % 2, i % 60), "Discipline %d" % i, "D-%d" % (100 + i % 50),
+                            "lecture", "Teacher %d" % (i % 13))
+
+        trs.append("<tr>%s</tr>" % "".join("<td> %s </td>" % cell for cell in cells))
+
+    body: str = '<table class="table-list v-scrollable"><tbody>%s</tbody></table>%s%s' % (
+        "".join(trs), curators("curatorMain", 2), curators("curators", 3)
+    )
+
+    return layout(body, language, type_user)
+
+
+def news(rows: int, language: str = "en") -> str:
+    """Returns announce page with rows news"""
+
+    items: str = "".join(
+        '<div class="item"><h3> News %d </h3><div class="awrap"><p> Description of news %d </p></div>'
+        '<div class="meta"> %02d.01.23 </div><a class="more" href="/announce/%d">more</a></div>'
+        % (i, i, i % 28 + 1, i)
+        for i in range(rows)
+    )
+
+    return layout('<div class="events-list rssNews">%s</div>' % items, language)
+
+
+def education(rows: int, language: str = "en") -> str:
+    """Returns study plan page with rows disciplines"""
+
+    trs: str = "".join(
+        '<tr><td>%d</td><td><a href="/student/disciplines/%d"> Discipline %d </a></td><td> exam </td>'
+        "<td> %d </td><td></td></tr>" % (i, i, i, i % 100)
+        for i in range(rows)
+    )
+
+    return layout('<table class="table-list"><tbody class="expanded">%s</tbody></table>' % trs, language)
+
+
+def notify(
+    rows: int, page: int = 1, pages: int = 1, url: str = "/student/notifications", language: str = "en",
+    total: int = None
+) -> str:
+    """Returns notifications page with rows notifications, the last page is shorter if total is given"""
+
+    trs: str = "".join(
+        "<tr><td>Discipline %d</td><td>Teacher %d</td><td>Event %d</td><td>%d</td><td>Message %d score %d</td></tr>"
+        % (i, i % 13, i, i % 100, i, i % 9 + 1)
+        for i in range((page - 1) * rows, page * rows if total is None else min(page * rows, total))
+    )
+
+    return layout(
+        '<table class="table-list dataTable"><tbody>%s</tbody></table>%s' % (trs, paginator(url, page, pages)),
+        language
+    )
+
+
+def unread(rows: int, page: int = 1, pages: int = 1, language: str = "en") -> str:
+    """Returns unread messages page with rows messages"""
+
+    trs: str = "".join(
+        '<tr><td><input type="checkbox"></td><td> Sender %d </td><td><a href="/messages/view/%d"> Subject %d </a></td>'
+        "<td></td><td> %02d.02.23 </td></tr>" % (i, i, i, i % 28 + 1)
+        for i in range((page - 1) * rows, page * rows)
+    )
+
+    return layout(
+        '<table class="dataTable decorateTable table-list"><tbody>%s</tbody></table>%s'
+        % (trs, paginator("/messages/listing/status/unread", page, pages, "/page/")),
+        language
+    )
+
+
+def journal(rows: int, language: str = "en") -> str:
+    """Returns journal page with rows marks"""
+
+    trs: str = "".join(
+        '<tr id="entryId"><td> Discipline %d </td><td> lecture </td><td> Teacher %d </td><td> %02d.02.23 </td>'
+        "<td> 09:55 </td><td> %d </td><td> 2 </td></tr>" % (i % 20, i % 13, i % 28 + 1, i % 5 + 1)
+        for i in range(rows)
+    )
+
+    return layout('<table class="table-list dataTable"><tbody>%s</tbody></table>' % trs, language)
+
+
+def events(rows: int, language: str = "en") -> str:
+    """Returns discipline page with rows events"""
+
+    trs: str = "".join(
+        '<tr><td><a href="/student/events/%d"> Event %d </a></td><td> open </td><td> 10 </td><td> %d </td></tr>'
+        % (i, i, i % 10)
+        for i in range(rows)
+    )
+
+    return layout(
+        '<table class="table-list"><tbody>%s</tbody><tfoot><tr><td>Total</td><td> %d </td></tr></tfoot></table>'
+        % (trs, rows),
+        language
+    )
@@ -0,0 +1,209 @@
+"""Fetch-free benchmarks of parsing for every getter of LMS and every installed parser backend
+
+Every result is printed as a JSON line. With --baseline the medians are compared with a previous run
+and the exit code is 1 if any benchmark is slower than the baseline by more than --tolerance.
+
+    python benchmarks/parse.py --output results.jsonl
+    python benchmarks/parse.py --baseline results.jsonl --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pages
+from lms_synergy_library.constants import PARSERS
+from lms_synergy_library.exceptions import ParserNotFoundError
+from lms_synergy_library.utils import SoupLms, LmsSession, Fragment, FRAGMENT_HEADER, FRAGMENT_NEWS,\
+     FRAGMENT_DISCIPLINES, FRAGMENT_NOTIFY, FRAGMENT_MESSAGES_UNREAD, FRAGMENT_JOURNAL, FRAGMENT_EVENTS
+
+
+# getter: (fixture, builder of page, fragment parsed by the getter, extraction from soup)
+BENCHMARKS: Dict[str, Tuple[str, Callable[..., str], Fragment, Callable]] = {
+    "sign": ("schedule", pages.schedule, FRAGMENT_HEADER, SoupLms.get_type_user_from_soup),
+    "get_info": ("schedule", pages.schedule, None, lambda soup: (
+        SoupLms.get_name_from_soup(soup),
+        SoupLms.get_amount_messages_from_soup(soup, "en"),
+        SoupLms.get_amount_notify_from_soup(soup, "en"),
+    )),
+    "get_schedule_student": ("schedule", pages.schedule, None, SoupLms.get_student_schedule_from_soup),
+    "get_schedule_teacher": (
+        "schedule_teacher", lambda rows: pages.schedule(rows, type_user="teacher"), None,
+        SoupLms.get_teacher_schedule_from_soup
+    ),
+    "get_pesonal_curators": (
+        "schedule", pages.schedule, None, lambda soup: SoupLms.get_curators_from_soup(soup, "curatorMain")
+    ),
+    "get_news": ("announce", pages.news, FRAGMENT_NEWS, SoupLms.get_news_from_soup),
+    "get_disciplines": ("education", pages.education, FRAGMENT_DISCIPLINES, SoupLms.get_disciplines_from_soup),
+    "get_notify": ("notifications", pages.notify, FRAGMENT_NOTIFY, SoupLms.get_notify_from_soup),
+    "get_notify_archive": (
+        "notifications_archive", lambda rows: pages.notify(rows, url="/student/notifications/archive"),
+        FRAGMENT_NOTIFY, SoupLms.get_notify_from_soup
+    ),
+    "get_unread_messages": (
+        "messages_unread", pages.unread, FRAGMENT_MESSAGES_UNREAD, SoupLms.get_unread_messages_from_soup
+    ),
+    "get_marks": ("journal", pages.journal, FRAGMENT_JOURNAL, SoupLms.get_marks_from_soup),
+    "get_events": ("events", pages.events, FRAGMENT_EVENTS, SoupLms.get_events_from_soup),
+}
+
+
+def get_parsers() -> List[str]:
+    """Returns installed parser backends"""
+
+    parsers: List[str] = []
+
+    for parser in PARSERS:
+        if parser == "auto":
+            continue
+        try:
+            builder: str = SoupLms.get_parser(parser)
+        except ParserNotFoundError:
+            continue
+        if builder == parser:
+            parsers.append(parser)
+
+    return parsers
+
+
+def get_markup(fixture: str, size: str, build: Callable[..., str], fixtures: str) -> str:
+    """Returns recorded page from directory of fixtures if there is one, the built page otherwise"""
+
+    if fixtures:
+        path: str = os.path.join(fixtures, "%s.%s.html" % (fixture, size))
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                return file.read()
+
+    return build(pages.SIZES[size])
+
+
+def measure(function: Callable[[], object], rounds: int) -> List[float]:
+    """Returns times of rounds of function in milliseconds"""
+
+    times: List[float] = []
+
+    for _ in range(rounds):
+        start: float = perf_counter()
+        function()
+        times.append((perf_counter() - start) * 1000)
+
+    return times
+
+
+def run_parse(parsers: List[str], sizes: List[str], rounds: int, fixtures: str) -> Iterator[dict]:
+    for name, (fixture, build, fragment, get_from_soup) in BENCHMARKS.items():
+        for size in sizes:
+            markup: str = get_markup(fixture, size, build, fixtures)
+
+            for parser in parsers:
+                session: LmsSession = LmsSession(parser)
+
+                def parse() -> None:
+                    soup = SoupLms.make_soup(session, markup, fragment)
+                    get_from_soup(soup)
+                    soup.decompose()
+
+                times: List[float] = measure(parse, rounds)
+                session.close()
+
+                yield {
+                    "benchmark": name,
+                    "size": size,
+                    "parser": parser,
+                    "bytes": len(markup.encode()),
+                    "rounds": rounds,
+                    "min_ms": round(min(times), 4),
+                    "median_ms": round(median(times), 4),
+                }
+
+
+def run_import(rounds: int) -> dict:
+    """Returns time of import of the package and construction of a lazy client in a new interpreter"""
+
+    code: str = (
+        "from time import perf_counter; start = perf_counter(); from lms_synergy_library import LMS; "
+        "LMS(lazy=True); print((perf_counter() - start) * 1000)"
+    )
+    root: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    times: List[float] = [
+        float(subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True).stdout)
+        for _ in range(rounds)
+    ]
+
+    return {
+        "benchmark": "import_construct",
+        "size": "-",
+        "parser": "-",
+        "bytes": 0,
+        "rounds": rounds,
+        "min_ms": round(min(times), 4),
+        "median_ms": round(median(times), 4),
+    }
+
+
+def compare(results: List[dict], baseline: str, tolerance: float) -> List[str]:
+    """Returns descriptions of benchmarks which are slower than baseline by more than tolerance"""
+
+    with open(baseline, encoding="utf-8") as file:
+        previous: dict = {
+            (row["benchmark"], row["size"], row["parser"]): row for row in map(json.loads, file) if row
+        }
+
+    regressions: List[str] = []
+
+    for row in results:
+        old: dict = previous.get((row["benchmark"], row["size"], row["parser"]))
+        if old and row["median_ms"] > old["median_ms"] * (1 + tolerance):
+            regressions.append(
+                "%s %s %s: %.3f ms -> %.3f ms"
+                % (row["benchmark"], row["size"], row["parser"], old["median_ms"], row["median_ms"])
+            )
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--parser", action="append", help="Parser backend, every installed one by default")
+    parser.add_argument("--size", action="append", choices=list(pages.SIZES), help="Size of pages, all by default")
+    parser.add_argument("--rounds", type=int, default=20, help="Rounds of every benchmark")
+    parser.add_argument("--fixtures", help="Directory with recorded pages named <fixture>.<size>.html")
+    parser.add_argument("--output", help="File for JSON lines of results")
+    parser.add_argument("--baseline", help="JSON lines of previous results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown against baseline")
+    args = parser.parse_args()
+
+    results: List[dict] = []
+
+    for row in run_parse(args.parser or get_parsers(), args.size or list(pages.SIZES), args.rounds, args.fixtures):
+        results.append(row)
+        print(json.dumps(row), flush=True)
+
+    row: dict = run_import(max(args.rounds // 4, 3))
+    results.append(row)
+    print(json.dumps(row), flush=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.writelines(json.dumps(row) + "\n" for row in results)
+
+    if args.baseline:
+        regressions: List[str] = compare(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print("REGRESSION %s" % regression, file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
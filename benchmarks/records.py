@@ -0,0 +1,96 @@
+"""Memory of records of the typed getters against the dicts of the plain getters
+
+Rows are extracted from built pages, then the memory held by the list of dicts and by the list of
+records is measured with tracemalloc. Every result is printed as a JSON line.
+
+    python benchmarks/records.py --rows 5000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pages
+from lms_synergy_library.utils import SoupLms, LmsSession
+from lms_synergy_library.records import Mark, Notification, Message, Discipline, get_events_from_disciplines,\
+     get_lessons_from_schedule, get_records_from_rows
+
+
+def get_records(record: type) -> Callable[[list], list]:
+    return lambda rows: get_records_from_rows(record, rows)
+
+
+# record: (builder of page, extraction of plain rows from soup, conversion of plain rows to records)
+BENCHMARKS: Dict[str, Tuple[Callable[[int], str], Callable, Callable[[object], list]]] = {
+    "Mark": (pages.journal, SoupLms.get_marks_from_soup, get_records(Mark)),
+    "Notification": (pages.notify, SoupLms.get_notify_from_soup, get_records(Notification)),
+    "Message": (pages.unread, SoupLms.get_unread_messages_from_soup, get_records(Message)),
+    "Discipline": (pages.education, SoupLms.get_disciplines_from_soup, get_records(Discipline)),
+    "Event": (
+        pages.events, lambda soup: [{"Discipline": SoupLms.get_events_from_soup(soup)}], get_events_from_disciplines
+    ),
+    "Lesson": (pages.schedule, SoupLms.get_student_schedule_from_soup, get_lessons_from_schedule),
+}
+
+
+def measure(build: Callable[[], object]) -> Tuple[object, int]:
+    """Returns result of build and bytes which are still held by it"""
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return result, size
+
+
+def copy_rows(rows: object) -> object:
+    """Returns rows built again from JSON, so the strings of rows are not shared with the soup"""
+
+    return json.loads(json.dumps(rows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=pages.SIZES["large"], help="Rows of every page")
+    args = parser.parse_args()
+
+    session: LmsSession = LmsSession(SoupLms.get_parser("auto"))
+
+    for name, (build, get_from_soup, to_records) in BENCHMARKS.items():
+        soup = SoupLms.make_soup(session, build(args.rows))
+        plain: object = copy_rows(get_from_soup(soup))
+        soup.decompose()
+
+        dicts, dicts_bytes = measure(lambda: copy_rows(plain))
+        records, records_bytes = measure(lambda: to_records(copy_rows(plain)))
+
+        start: float = perf_counter()
+        converted: List[dict] = [record.to_dict() for record in records]
+        to_dict_ms: float = (perf_counter() - start) * 1000
+
+        print(json.dumps({
+            "record": name,
+            "records": len(records),
+            "dict_bytes_per_record": round(dicts_bytes / len(records), 1),
+            "record_bytes_per_record": round(records_bytes / len(records), 1),
+            "saved": round(1 - records_bytes / dicts_bytes, 3),
+            "to_dict_us_per_record": round(to_dict_ms * 1000 / len(converted), 3),
+        }), flush=True)
+
+        del dicts, records, converted
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
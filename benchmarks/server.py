@@ -0,0 +1,196 @@
+"""Local stand-in of LMS which serves built pages for every url of constants.py
+
+Latency, amount of rows and pages, the largest honored pageSize of notifications
+and the share of failed responses are configurable.
+The client is pointed at the stand-in with the environment variable LMS_SYNERGY_URL:
+
+    python benchmarks/server.py --port 8080 --latency 50 --pages 5 --error-rate 0.01
+    LMS_SYNERGY_URL=http://127.0.0.1:8080 python -c "from lms_synergy_library import LMS; print(LMS().get_name())"
+"""
+
+import argparse
+import random
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Lock
+from time import sleep
+from typing import Callable, Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pages
+
+
+class StandInOptions:
+    """Options of stand-in: latency in milliseconds, rows per page, pages of paginated lists,
+    disciplines of study plan, share of responses which fail with 500 and the largest pageSize of notifications,
+    with a larger pageSize the same notifications take fewer pages"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rows: int = pages.SIZES["typical"],
+        pages_amount: int = 3,
+        disciplines: int = 8,
+        error_rate: float = 0.0,
+        type_user: str = "student",
+        max_page_size: int = 100,
+    ) -> None:
+        self.latency = latency
+        self.rows = rows
+        self.pages = pages_amount
+        self.disciplines = disciplines
+        self.error_rate = error_rate
+        self.type_user = type_user
+        self.max_page_size = max_page_size
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    options: StandInOptions = StandInOptions()
+    sessions: Dict[str, str] = {}
+    tokens = count(1)
+    lock: Lock = Lock()
+    # requests received by the stand-in, read by tests
+    amount_requests: int = 0
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def get_session(self) -> str:
+        cookies: str = self.headers.get("Cookie", "")
+        match = re.search(r"PHPSESSID=([^;\s]+)", cookies)
+
+        if match and match.group(1) in self.sessions:
+            return match.group(1)
+
+        return None
+
+    def send_page(self, status: int, body: str, cookie: str = None) -> None:
+        content: bytes = body.encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        if cookie:
+            self.send_header("Set-Cookie", "PHPSESSID=%s; Path=/" % cookie)
+        self.end_headers()
+
+        try:
+            self.wfile.write(content)
+        except (BrokenPipeError, ConnectionResetError):
+            # the client has gone, e.g. after its timeout or deadline
+            self.close_connection = True
+
+    def route(self, path: str, query: dict, language: str) -> Tuple[int, str]:
+        options: StandInOptions = self.options
+        page: int = int(query.get("page", ["1"])[0])
+        routes: Tuple[Tuple[str, Callable[..., str]], ...] = (
+            (r"/user/lng/\d$", lambda: pages.schedule(options.rows, language, options.type_user)),
+            (r"/schedule/academ$", lambda: pages.schedule(options.rows, language, options.type_user)),
+            (r"/announce$", lambda: pages.news(options.rows, language)),
+            (r"/student/up$", lambda: pages.education(options.disciplines, language)),
+            (r"/messages/listing/status/unread/page/(\d+)$", lambda number: pages.unread(
+                options.rows, int(number), options.pages, language
+            )),
+            (r"/student/journal$", lambda: pages.journal(options.rows * options.pages, language)),
+            (r"/student/disciplines/\d+$", lambda: pages.events(options.rows, language)),
+        )
+
+        match = re.match(r"/student/notifications(/archive)?$", path)
+        if match:
+            total: int = options.rows * options.pages
+            size: int = min(int(query.get("pageSize", [str(options.rows)])[0]), options.max_page_size)
+            amount: int = max(-(-total // size), 1)
+            if page < 1 or page > amount:
+                return 404, "<html><body>Page not found</body></html>"
+            return 200, pages.notify(size, page, amount, path, language, total)
+
+        for pattern, build in routes:
+            match = re.match(pattern, path)
+            if match:
+                if page < 1 or page > options.pages:
+                    return 404, "<html><body>Page not found</body></html>"
+                return 200, build(*match.groups())
+
+        return 404, "<html><body>Page not found</body></html>"
+
+    def handle_request(self) -> None:
+        with self.lock:
+            type(self).amount_requests += 1
+
+        length: int = int(self.headers.get("Content-Length") or 0)
+        body: str = self.rfile.read(length).decode() if length else ""
+        url = urlsplit(self.path)
+
+        if self.options.latency:
+            sleep(self.options.latency / 1000)
+
+        if self.options.error_rate and random.random() < self.options.error_rate:
+            return self.send_page(500, "<html><body>Internal Server Error</body></html>")
+
+        if url.path == "/user/login":
+            if not parse_qs(body).get("popupUsername"):
+                return self.send_page(200, pages.layout("<form></form>").replace('class="user-name"', 'class="login"'))
+
+            with self.lock:
+                token: str = "standin%d" % next(self.tokens)
+                self.sessions[token] = "ru"
+
+            return self.send_page(200, pages.schedule(self.options.rows, "ru", self.options.type_user), token)
+
+        token: str = self.get_session()
+        if token is None:
+            return self.send_page(200, pages.layout("<form></form>").replace('class="user-name"', 'class="login"'))
+
+        match = re.match(r"/user/lng/(\d)$", url.path)
+        if match:
+            self.sessions[token] = "ru" if match.group(1) == "1" else "en"
+
+        status, page = self.route(url.path, parse_qs(url.query), self.sessions[token])
+        self.send_page(status, page)
+
+    do_GET = handle_request
+    do_POST = handle_request
+
+
+def serve(port: int = 8080, options: StandInOptions = None, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Returns stand-in server bound to port, run it with serve_forever()"""
+
+    handler: type = type("Handler", (StandInHandler,), {
+        "options": options if options else StandInOptions(),
+        "sessions": {},
+    })
+    server: ThreadingHTTPServer = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency of every response in milliseconds")
+    parser.add_argument("--rows", type=int, default=pages.SIZES["typical"], help="Rows per page")
+    parser.add_argument("--pages", type=int, default=3, help="Pages of notifications, archive and messages")
+    parser.add_argument("--disciplines", type=int, default=8, help="Disciplines of study plan")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of responses which fail with 500")
+    parser.add_argument("--type-user", choices=["student", "teacher"], default="student")
+    parser.add_argument("--max-page-size", type=int, default=100, help="Largest honored pageSize of notifications")
+    args = parser.parse_args()
+
+    options: StandInOptions = StandInOptions(
+        args.latency, args.rows, args.pages, args.disciplines, args.error_rate, args.type_user, args.max_page_size
+    )
+    server: ThreadingHTTPServer = serve(args.port, options, args.host)
+    print("Serving on http://%s:%d" % server.server_address[:2], flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,32 @@
-from .lms_synergy_library import LMS
\ No newline at end of file
+from importlib import import_module
+
+__all__ = ["LMS", "AsyncLMS", "LMSPool", "SessionStore", "FileSessionStore", "SQLiteSessionStore", "Mirror",
+           "TokenBucket", "RetryPolicy"]
+
+_MODULES: dict = {
+    "LMS": ".lms_synergy_library",
+    "AsyncLMS": ".async_lms",
+    "LMSPool": ".pool",
+    "SessionStore": ".store",
+    "FileSessionStore": ".store",
+    "SQLiteSessionStore": ".store",
+    "Mirror": ".mirror",
+    "TokenBucket": ".limits",
+    "RetryPolicy": ".limits",
+}
+
+
+def __getattr__(name: str):
+    """Import classes on first access, so requests, bs4 and aiohttp are loaded only when they are used"""
+
+    if name not in _MODULES:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
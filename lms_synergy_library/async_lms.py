@@ -0,0 +1,1073 @@
+from asyncio import Semaphore, TimeoutError, ensure_future, gather, sleep
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Callable, Iterable, Iterator, List, Mapping, Set, Tuple, Union
+from random import choice
+from bs4 import BeautifulSoup as bs
+from .utils import SoupLms, PageSnapshots, Fragment, FRAGMENT_HEADER, FRAGMENT_NEWS, FRAGMENT_DISCIPLINES, FRAGMENT_NOTIFY,\
+     FRAGMENT_MESSAGES_UNREAD, FRAGMENT_JOURNAL, FRAGMENT_EVENTS
+from . import limits, tracing
+from .records import Mark, Notification, Message, Event, Lesson, Discipline, Curator, get_curators_from_rows,\
+     get_events_from_disciplines, get_lessons_from_schedule, get_records_from_rows
+from .limits import TokenBucket, RetryPolicy, RETRY_DEFAULT, check_deadline, get_content_length
+from .exceptions import LanguageNotFoundError, UserIsNotTeacherError, UserIsNotStudentError, ServerError,\
+     DeadlineExceededError
+from .constants import URL, URL_LOGIN, URL_SCHEDULE, URL_NEWS, URL_EDUCATION, URL_JOURNAL, URLS_LANGUAGES, USER_AGENTS,\
+     TIMEOUT, PAGE_SIZE_NOTIFY, PAGE_SIZE_NOTIFY_PROBE
+
+try:
+    from aiohttp import ClientSession, CookieJar, BaseConnector, ClientConnectionError, ClientPayloadError,\
+         ClientTimeout
+except ImportError:
+    ClientSession = CookieJar = BaseConnector = ClientTimeout = None
+    ClientConnectionError = ClientPayloadError = OSError
+
+
+class AsyncLmsSession:
+    """aiohttp session which remembers the language of the server session and counts requests"""
+
+    language: str = None
+    parser: str = "html.parser"
+    amount_requests: int = 0
+
+    def __init__(
+        self,
+        headers: dict,
+        proxies: dict = None,
+        connector: "BaseConnector" = None,
+        parser: str = "html.parser",
+        limiters: Tuple[TokenBucket, ...] = (),
+        retry: RetryPolicy = None,
+        timeout: Union[float, Tuple[float, float]] = TIMEOUT,
+    ) -> None:
+        """Init async session
+
+        :param headers: Headers
+        :param proxies: Proxies in the requests format, the https proxy is preferred
+        :param connector: Connector shared between sessions, the session owns its own if None
+        :param parser: Tree builder of BeautifulSoup used for pages of the session
+        :param limiters: Rate limiters every request waits for, e.g. of the account and of all accounts
+        :param retry: Retry policy of a request, error pages are returned as they are if None
+        :param timeout: Timeout of every request, seconds or seconds of connect and read
+
+        :type headers: dict
+        :type proxies: dict
+        :type connector: aiohttp.BaseConnector
+        :type parser: str
+        :type limiters: Tuple[TokenBucket, ...]
+        :type retry: RetryPolicy
+        :type timeout: Union[float, Tuple[float, float]]
+
+        :return: None
+        :rtype: None
+        """
+
+        if ClientSession is None:
+            raise ImportError("AsyncLMS requires aiohttp: pip install lms_synergy_library[async]")
+
+        proxies = proxies if proxies else {}
+
+        self.parser = parser
+        self.limiters = limiters
+        self.retry = retry
+        self.timeout = timeout
+
+        self.proxy: str = proxies.get("https") or proxies.get("http")
+        self.session = ClientSession(
+            headers=headers,
+            cookie_jar=CookieJar(unsafe=True),
+            connector=connector,
+            connector_owner=connector is None
+        )
+
+    async def request(self, method: str, url: str, **kwargs) -> str:
+        """Sends request after rate limiters allow it, retries idempotent requests by the retry policy,
+        counts every attempt and returns text of response, timeouts are shortened to the deadline of the current call
+
+        :param method: Method
+        :param url: Url
+
+        :type method: str
+        :type url: str
+
+        :return: Text of response
+        :rtype: str
+
+        :raises ServerError: Error page or connection error after the last attempt
+        :raises DeadlineExceededError: The deadline of the current call is over
+        """
+
+        attempts: int = self.retry.get_attempts(method) if self.retry else 1
+        attempt: int = 0
+
+        while True:
+            for limiter in self.limiters:
+                delay: float = limiter.reserve()
+                if delay > 0:
+                    check_deadline(delay)
+                    await sleep(delay)
+
+            try:
+                status, headers, received, text = await self._send(
+                    method, url, timeout=self._get_timeout(), **kwargs
+                )
+            except (ClientConnectionError, ClientPayloadError, TimeoutError) as error:
+                check_deadline()
+                if self.retry is None:
+                    raise
+                if attempt + 1 >= attempts:
+                    raise ServerError("%s %s: %s" % (method.upper(), url, error)) from error
+                delay = self.retry.get_delay(attempt)
+            else:
+                if self.retry is None:
+                    return text
+
+                page_error: str = self.retry.get_error(
+                    status, headers.get("Content-Type"), text[-512:].encode(), get_content_length(headers), received
+                )
+                if page_error is None:
+                    return text
+                if attempt + 1 >= attempts:
+                    raise ServerError("%s %s: %s" % (method.upper(), url, page_error))
+                delay = self.retry.get_delay(attempt, headers.get("Retry-After"))
+
+            attempt += 1
+            check_deadline(delay)
+            await sleep(delay)
+
+    def _get_timeout(self) -> "ClientTimeout":
+        """Returns timeout of request, the total is the time left until the deadline of the current call"""
+
+        remaining: float = check_deadline()
+        connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+
+        return ClientTimeout(total=remaining, connect=connect, sock_read=read)
+
+    async def _send(self, method: str, url: str, **kwargs) -> Tuple[int, Mapping[str, str], int, str]:
+        """Returns status, headers, received bytes of body and text of response"""
+
+        self.amount_requests += 1
+
+        if not tracing.subscribers:
+            async with self.session.request(method, url, proxy=self.proxy, **kwargs) as response:
+                body: bytes = await response.read()
+                return response.status, response.headers, len(body), await response.text()
+
+        with tracing.Span(method.upper(), "http", url=url) as span:
+            async with self.session.request(method, url, proxy=self.proxy, **kwargs) as response:
+                body: bytes = await response.read()
+                text: str = await response.text()
+                span.attributes["status"] = response.status
+                span.attributes["bytes"] = len(body)
+
+        return response.status, response.headers, len(body), text
+
+    async def get(self, url: str, **kwargs) -> str:
+        """Sends GET request and returns text of response
+
+        :param url: Url
+        :type url: str
+
+        :return: Text of response
+        :rtype: str
+        """
+
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> str:
+        """Sends POST request and returns text of response
+
+        :param url: Url
+        :type url: str
+
+        :return: Text of response
+        :rtype: str
+        """
+
+        return await self.request("POST", url, **kwargs)
+
+    @property
+    def cookies(self) -> dict:
+        """Returns cookies
+
+        :return: Cookies
+        :rtype: dict
+        """
+
+        return {cookie.key: cookie.value for cookie in self.session.cookie_jar}
+
+    async def close(self) -> None:
+        """Close session
+
+        :return: None
+        :rtype: None
+        """
+
+        await self.session.close()
+
+
+class AsyncSoupLms:
+    @staticmethod
+    async def set_language(session: AsyncLmsSession, language: str) -> str:
+        """Switches language of the server session if it differs, returns page of the switch or None
+
+        :param session: Session
+        :param language: Language
+
+        :type session: AsyncLmsSession
+        :type language: str
+
+        :return: Page
+        :rtype: str
+        """
+
+        if session.language == language:
+            return None
+
+        text: str = await session.get(URLS_LANGUAGES[language])
+        session.language = language
+
+        return text
+
+    @classmethod
+    async def get_soup(cls, session: AsyncLmsSession, language: str, url: str, fragment: Fragment = None) -> bs:
+        """Returns soup of page
+
+        :param session: Session
+        :param language: Language
+        :param url: Url
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
+
+        :type session: AsyncLmsSession
+        :type language: str
+        :type url: str
+        :type fragment: Fragment
+
+        :return: Soup page
+        :rtype: bs4.BeautifulSoup
+        """
+
+        await cls.set_language(session, language)
+
+        return SoupLms.make_soup(session, await session.get(url), fragment)
+
+    @classmethod
+    async def get_soup_schedule(
+        cls, session: AsyncLmsSession, language: str, snapshots: PageSnapshots = None
+    ) -> bs:
+        """Returns soup schedule
+
+        :param session: Session
+        :param language: Language
+        :param snapshots: Page snapshots, the page is fetched again if None
+
+        :type session: AsyncLmsSession
+        :type language: str
+        :type snapshots: PageSnapshots
+
+        :return: Soup schedule
+        :rtype: bs4.BeautifulSoup
+        """
+
+        if snapshots is not None:
+            soup: bs = snapshots.get(URL_SCHEDULE, language)
+            if soup is not None:
+                return soup
+
+        soup: bs = await cls.get_soup(session, language, URL_SCHEDULE)
+
+        if snapshots is not None:
+            snapshots.put(URL_SCHEDULE, language, soup)
+
+        return soup
+
+    @classmethod
+    async def get_soup_header(
+        cls, session: AsyncLmsSession, language: str, snapshots: PageSnapshots = None
+    ) -> bs:
+        """Returns soup with header of pages: name, role switcher and counters,
+        the landing page of login while its snapshot is fresh and the schedule otherwise
+
+        :param session: Session
+        :param language: Language
+        :param snapshots: Page snapshots, the schedule is fetched again if None
+
+        :type session: AsyncLmsSession
+        :type language: str
+        :type snapshots: PageSnapshots
+
+        :return: Soup header
+        :rtype: bs4.BeautifulSoup
+        """
+
+        if snapshots is not None:
+            soup: bs = snapshots.get(URL, language)
+            if soup is not None:
+                return soup
+
+        return await cls.get_soup_schedule(session, language, snapshots)
+
+    @classmethod
+    async def iter_soup_messages_unread(cls, session: AsyncLmsSession, language: str) -> AsyncIterator[bs]:
+        """Yields soup of every unread messages page following the paginator, each page is fetched once
+
+        :param session: Session
+        :param language: Language
+
+        :type session: AsyncLmsSession
+        :type language: str
+
+        :return: Soup unread messages of every page
+        :rtype: AsyncIterator[bs4.BeautifulSoup]
+        """
+
+        soup: bs = await cls.get_soup(
+            session, language, SoupLms.get_url_messages_unread(1), FRAGMENT_MESSAGES_UNREAD
+        )
+
+        if SoupLms.get_amount_messages_from_soup(soup, language) < 1:
+            return
+
+        next_link: str = SoupLms.get_next_link_from_soup(soup)
+
+        yield soup
+
+        while next_link:
+            soup = SoupLms.make_soup(session, await session.get(next_link), FRAGMENT_MESSAGES_UNREAD)
+            next_link = SoupLms.get_next_link_from_soup(soup)
+
+            yield soup
+
+
+class AsyncLMS:
+    """Async client of one account of LMS
+
+    Every public method also takes the keyword argument deadline: seconds for the whole call, including
+    retries, waits of rate limiters and concurrent pages. Async generators are bounded until exhausted.
+    DeadlineExceededError is raised when it is over.
+    """
+
+    session: AsyncLmsSession = None
+    _page_size_notify: int = None
+    type_user: str = None
+
+    def __init__(
+        self,
+        login: str = "demo",
+        password: str = "demo",
+        proxy: dict = None,
+        headers: dict = None,
+        language: str = "en",
+        snapshot_ttl: float = 5.0,
+        max_workers: int = 4,
+        parser: str = "auto",
+        connector: "BaseConnector" = None,
+        rate_limit: float = None,
+        limiter: TokenBucket = None,
+        retry: RetryPolicy = RETRY_DEFAULT,
+        timeout: Union[float, Tuple[float, float]] = TIMEOUT,
+        page_size: int = None,
+    ) -> None:
+        """Init AsyncLMS, the login happens in sign() or on entering the context
+
+        :param login: Login
+        :param password: Login
+        :param proxy: Proxy
+        :param headers: Headers
+        :param language: Language
+        :param snapshot_ttl: Seconds during which getters of one page share a single fetch, 0 disables it
+        :param max_workers: Maximum amount of pages fetched concurrently
+        :param parser: Parser backend, "auto" picks lxml if it is installed and html.parser otherwise
+        :param connector: aiohttp connector shared between clients, each client owns its own if None
+        :param rate_limit: Maximum requests per second of this client, unlimited if None
+        :param limiter: Rate limiter shared with other clients, e.g. of all accounts
+        :param retry: Retry policy of every request, None disables retries and detection of error pages
+        :param timeout: Timeout of every request, seconds or seconds of connect and read
+        :param page_size: Notifications per page, if None a large page is requested and the size of the server is kept
+
+        :type login: str
+        :type password: str
+        :type proxy: dict
+        :type headers: dict
+        :type language: str
+        :type snapshot_ttl: float
+        :type max_workers: int
+        :type parser: str
+        :type connector: aiohttp.BaseConnector
+        :type rate_limit: float
+        :type limiter: TokenBucket
+        :type retry: RetryPolicy
+        :type timeout: Union[float, Tuple[float, float]]
+        :type page_size: int
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> import asyncio
+        >>> from lms_synergy_library import AsyncLMS
+        >>> async def main():
+        ...     async with AsyncLMS(login="demo", password="demo") as lms:
+        ...         return await lms.get_name()
+        >>> asyncio.run(main())
+        'Student Demonstratsionnyiy'
+        """
+
+        self.login = login
+        self.password = password
+        self.proxy = proxy
+        self.headers = headers
+        self.connector = connector
+
+        if language not in URLS_LANGUAGES:
+            raise LanguageNotFoundError("No such language %s" % language)
+        self.language = language
+        self.snapshots = PageSnapshots(snapshot_ttl)
+        self.max_workers = max_workers
+        self.parser = SoupLms.get_parser(parser)
+        self.limiters: Tuple[TokenBucket, ...] = tuple(
+            bucket for bucket in (TokenBucket(rate_limit) if rate_limit else None, limiter) if bucket is not None
+        )
+        self.retry = retry
+        self.timeout = timeout
+        self.page_size = page_size
+
+    async def __aenter__(self) -> "AsyncLMS":
+        await self.sign()
+
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def sign(self) -> None:
+        """Auth, type of user, name and counters are read from the landing page of login
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> import asyncio
+        >>> from lms_synergy_library import AsyncLMS
+        >>> async def main():
+        ...     lms = AsyncLMS(login="demo", password="demo")
+        ...     await lms.sign()
+        ...     await lms.close()
+        >>> asyncio.run(main())
+        """
+
+        headers: dict = (
+            self.headers if self.headers else {"User-Agent": choice(USER_AGENTS)}
+        )
+
+        data: dict = {"popupUsername": self.login, "popupPassword": self.password}
+
+        await self.close()
+        self.snapshots.clear()
+        self.type_user = None
+        self.session = AsyncLmsSession(
+            headers, self.proxy, self.connector, self.parser, self.limiters, self.retry, self.timeout
+        )
+        text: str = await self.session.post(URL_LOGIN, data=data)
+        text = await AsyncSoupLms.set_language(self.session, self.language) or text
+
+        soup: bs = SoupLms.make_soup(self.session, text, FRAGMENT_HEADER)
+        self.snapshots.put(URL, self.language, soup)
+        self.type_user = SoupLms.get_type_user_from_soup(soup)
+
+    async def close(self) -> None:
+        """Close session
+
+        :return: None
+        :rtype: None
+        """
+
+        if self.session:
+            await self.session.close()
+
+    @property
+    def cookies(self) -> dict:
+        """Returns cookies
+
+        :return: Cookies
+        :rtype: dict
+        """
+
+        return self.session.cookies
+
+    @property
+    def amount_requests(self) -> int:
+        """Returns amount of HTTP requests sent by the current session
+
+        :return: Amount requests
+        :rtype: int
+        """
+
+        return self.session.amount_requests
+
+    async def _get_soup_schedule(self) -> bs:
+        return await AsyncSoupLms.get_soup_schedule(self.session, self.language, self.snapshots)
+
+    async def _get_soup_header(self) -> bs:
+        return await AsyncSoupLms.get_soup_header(self.session, self.language, self.snapshots)
+
+    def _get_page_size(self, page_size: int = None, watermark: Union[str, Iterable[str]] = None) -> int:
+        """Returns notifications per page: the given size, the size of client, the size of the site for syncs
+        with watermark which usually stop on the first page, or the size the server gave before
+
+        :param page_size: Notifications per page
+        :param watermark: Watermark of sync
+
+        :type page_size: int
+        :type watermark: Union[str, Iterable[str]]
+
+        :return: Notifications per page
+        :rtype: int
+        """
+
+        if page_size:
+            return page_size
+        if self.page_size:
+            return self.page_size
+        if watermark:
+            return PAGE_SIZE_NOTIFY
+
+        return self._page_size_notify if self._page_size_notify else PAGE_SIZE_NOTIFY_PROBE
+
+    async def _iter_pages(
+        self, get_url: Callable[..., str], get_from_soup: Callable[[bs], list], fragment: Fragment = None,
+        max_workers: int = None, page_size: int = None
+    ) -> AsyncIterator[dict]:
+        """Yields rows of all pages in order of pages, the amount of pages is read from the first page
+        and up to max_workers next pages are fetched ahead by tasks
+
+        :param get_url: Method of SoupLms which returns url of page
+        :param get_from_soup: Method of SoupLms which returns rows from soup
+        :param fragment: Fragment of pages to parse
+        :param max_workers: Maximum amount of pages fetched concurrently, max_workers of client if None
+        :param page_size: Rows per page requested from the server, a smaller full first page is the size it gives
+
+        :type get_url: Callable
+        :type get_from_soup: Callable
+        :type fragment: Fragment
+        :type max_workers: int
+        :type page_size: int
+
+        :return: Rows
+        :rtype: AsyncIterator[dict]
+        """
+
+        def get_page_url(page: int) -> str:
+            return get_url(page, page_size) if page_size else get_url(page)
+
+        async def get_page(page: int) -> list:
+            soup: bs = await AsyncSoupLms.get_soup(self.session, self.language, get_page_url(page), fragment)
+            rows: list = get_from_soup(soup)
+            soup.decompose()
+
+            return rows
+
+        soup: bs = await AsyncSoupLms.get_soup(self.session, self.language, get_page_url(1), fragment)
+        amount_pages: int = SoupLms.get_amount_pages_from_soup(soup)
+        pages: Iterator[int] = iter(range(2, amount_pages + 1))
+        amount_rows: int = SoupLms.get_amount_rows_from_soup(soup) if page_size and amount_pages > 1 else None
+        rows: list = get_from_soup(soup)
+        soup.decompose()
+
+        if amount_rows and amount_rows < page_size:
+            self._page_size_notify = amount_rows
+
+        for row in rows:
+            yield row
+
+        max_workers = max_workers if max_workers else self.max_workers
+
+        if max_workers <= 1:
+            for page in pages:
+                for row in await get_page(page):
+                    yield row
+            return
+
+        tasks: deque = deque(ensure_future(get_page(page)) for page in islice(pages, max_workers))
+
+        try:
+            while tasks:
+                rows = await tasks.popleft()
+                page: int = next(pages, None)
+
+                if page is not None:
+                    tasks.append(ensure_future(get_page(page)))
+
+                for row in rows:
+                    yield row
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def _sync_notify(notify: AsyncIterator[dict], watermark: Union[str, Iterable[str]]) -> dict:
+        """Returns notifications until the first seen one and the new watermark, the rest pages are not fetched
+
+        :param notify: Notifications newest first
+        :param watermark: Key of the newest seen notification or keys of seen notifications
+
+        :type notify: AsyncIterator[dict]
+        :type watermark: Union[str, Iterable[str]]
+
+        :return: New notifications and key of the newest notification
+        :rtype: dict
+        """
+
+        seen: Set[str] = SoupLms.get_seen_keys(watermark)
+        new: list = []
+        newest: str = None
+
+        try:
+            async for row in notify:
+                key: str = SoupLms.get_key_notify(row)
+
+                if newest is None:
+                    newest = key
+                if key in seen:
+                    break
+
+                new.append(row)
+        finally:
+            await notify.aclose()
+
+        return {"notify": new, "watermark": newest if newest else watermark}
+
+    async def _get_events_discipline(self, discipline: dict, semaphore: Semaphore) -> dict:
+        """Returns events of discipline, errors are returned instead of raised
+
+        :param discipline: Discipline from get_disciplines
+        :param semaphore: Semaphore which bounds concurrent fetches
+
+        :type discipline: dict
+        :type semaphore: asyncio.Semaphore
+
+        :return: Events of discipline
+        :rtype: dict
+        """
+
+        try:
+            async with semaphore:
+                soup: bs = await AsyncSoupLms.get_soup(
+                    self.session, self.language, discipline["url"], FRAGMENT_EVENTS
+                )
+
+            events: dict = SoupLms.get_events_from_soup(soup)
+        except DeadlineExceededError:
+            raise
+        except Exception as error:
+            events: dict = {
+                "current_grade": "-",
+                "events": [],
+                "error": "%s: %s" % (type(error).__name__, error)
+            }
+
+        return {discipline["title"]: events}
+
+    async def get_type_user(self) -> str:
+        """Returns type user
+
+        :return: Type user
+        :rtype: str
+        """
+
+        if not self.type_user:
+            self.type_user = SoupLms.get_type_user_from_soup(await self._get_soup_header())
+
+        return self.type_user
+
+    @property
+    def metrics(self) -> dict:
+        """Returns metrics of the current session
+
+        :return: Metrics
+        :rtype: dict
+        """
+
+        return {
+            "amount_requests": self.session.amount_requests,
+            "parser": self.session.parser,
+        }
+
+    async def verify(self) -> bool:
+        """Verify auth
+
+        :return: True or False
+        :rtype: bool
+        """
+
+        soup: bs = await AsyncSoupLms.get_soup(self.session, self.language, URL_SCHEDULE)
+
+        return SoupLms.is_auth_from_soup(soup)
+
+    async def get_name(self) -> str:
+        """Returns name
+
+        :return: Name
+        :rtype: str
+        """
+
+        return SoupLms.get_name_from_soup(await self._get_soup_header())
+
+    async def get_amount_messages(self) -> int:
+        """Returns amount messages
+
+        :return: Amount messages
+        :rtype: int
+        """
+
+        return SoupLms.get_amount_messages_from_soup(
+            await self._get_soup_header(), self.language
+        )
+
+    async def get_amount_notifications(self) -> int:
+        """Returns amount notifications
+
+        :return: Amount notifications
+        :rtype: int
+        """
+
+        return SoupLms.get_amount_notify_from_soup(
+            await self._get_soup_header(), self.language
+        )
+
+    async def get_amount_unverified_work(self) -> int:
+        """Returns amount unverified work
+
+        :return: Amount unverified work
+        :rtype: int
+        """
+
+        if self.type_user not in ["teacher", "преподаватель"]:
+            raise UserIsNotTeacherError("User is not teacher")
+
+        return SoupLms.get_amount_unverified_work_from_soup(
+            await self._get_soup_header(), self.language
+        )
+
+    async def get_info(self) -> dict:
+        """Returns information about user
+
+        :return: Information about user
+        :rtype: dict
+        """
+
+        return {
+            "name": await self.get_name(),
+            "amount_messages": await self.get_amount_messages(),
+            "amount_notifications": await self.get_amount_notifications(),
+        }
+
+    async def get_schedule(self) -> dict:
+        """Returns schedule
+
+        :return: Schedule
+        :rtype: dict
+        """
+
+        soup: bs = await self._get_soup_schedule()
+
+        if self.type_user in ["teacher", "преподаватель"]:
+            return SoupLms.get_teacher_schedule_from_soup(soup)
+
+        return SoupLms.get_student_schedule_from_soup(soup)
+
+    async def get_news(self) -> list:
+        """Returns news
+
+        :return: News
+        :rtype: list
+        """
+
+        soup: bs = await AsyncSoupLms.get_soup(self.session, self.language, URL_NEWS, FRAGMENT_NEWS)
+
+        return SoupLms.get_news_from_soup(soup)
+
+    async def get_disciplines(self) -> list:
+        """Returns disciplines
+
+        :return: Disciplines
+        :rtype: list
+        """
+
+        soup: bs = await AsyncSoupLms.get_soup(
+            self.session, self.language, URL_EDUCATION, FRAGMENT_DISCIPLINES
+        )
+
+        return SoupLms.get_disciplines_from_soup(soup)
+
+    async def get_pesonal_curators(self) -> list:
+        """Returns personal curators
+
+        :return: Personal curators
+        :rtype: list
+        """
+
+        if self.type_user not in ["student", "студент"]:
+            raise UserIsNotStudentError("User is not student")
+
+        return SoupLms.get_curators_from_soup(await self._get_soup_schedule(), "curatorMain")
+
+    async def get_tutors(self) -> list:
+        """Returns tutors
+
+        :return: Tutors
+        :rtype: list
+        """
+
+        if self.type_user not in ["student", "студент"]:
+            raise UserIsNotStudentError("User is not student")
+
+        return SoupLms.get_curators_from_soup(await self._get_soup_schedule(), "curators")
+
+    def iter_notify(self, page_size: int = None) -> AsyncIterator[dict]:
+        """Yields notifications as pages are parsed, stopping early does not fetch the rest pages
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications
+        :rtype: AsyncIterator[dict]
+        """
+
+        return self._iter_pages(
+            SoupLms.get_url_notify, SoupLms.get_notify_from_soup, FRAGMENT_NOTIFY,
+            page_size=self._get_page_size(page_size)
+        )
+
+    async def get_notify(self, page_size: int = None) -> list:
+        """Returns notifications
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications
+        :rtype: list
+        """
+
+        return [notify async for notify in self.iter_notify(page_size)]
+
+    async def sync_notify(self, watermark: Union[str, Iterable[str]] = None, page_size: int = None) -> dict:
+        """Returns notifications newer than watermark and the new watermark,
+        pages are read newest first and reading stops at the first seen notification
+
+        :param watermark: Key of the newest seen notification or keys of seen notifications, all are new if None
+        :param page_size: Notifications per page, the size of the site if None and watermark is given
+
+        :type watermark: Union[str, Iterable[str]]
+        :type page_size: int
+
+        :return: New notifications in order of pages and key of the newest notification
+        :rtype: dict
+        """
+
+        notify: AsyncIterator[dict] = self._iter_pages(
+            SoupLms.get_url_notify, SoupLms.get_notify_from_soup, FRAGMENT_NOTIFY, 1 if watermark else None,
+            self._get_page_size(page_size, watermark)
+        )
+
+        return await self._sync_notify(notify, watermark)
+
+    def iter_notify_archive(self, page_size: int = None) -> AsyncIterator[dict]:
+        """Yields notifications archive as pages are parsed, stopping early does not fetch the rest pages
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications archive
+        :rtype: AsyncIterator[dict]
+        """
+
+        return self._iter_pages(
+            SoupLms.get_url_notify_archive, SoupLms.get_notify_from_soup, FRAGMENT_NOTIFY,
+            page_size=self._get_page_size(page_size)
+        )
+
+    async def get_notify_archive(self, page_size: int = None) -> list:
+        """Returns notifications archive
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications archive
+        :rtype: list
+        """
+
+        return [notify async for notify in self.iter_notify_archive(page_size)]
+
+    async def sync_notify_archive(self, watermark: Union[str, Iterable[str]] = None, page_size: int = None) -> dict:
+        """Returns notifications archive newer than watermark and the new watermark,
+        pages are read newest first and reading stops at the first seen notification
+
+        :param watermark: Key of the newest seen notification or keys of seen notifications, all are new if None
+        :param page_size: Notifications per page, the size of the site if None and watermark is given
+
+        :type watermark: Union[str, Iterable[str]]
+        :type page_size: int
+
+        :return: New notifications archive in order of pages and key of the newest notification
+        :rtype: dict
+        """
+
+        notify: AsyncIterator[dict] = self._iter_pages(
+            SoupLms.get_url_notify_archive, SoupLms.get_notify_from_soup, FRAGMENT_NOTIFY, 1 if watermark else None,
+            self._get_page_size(page_size, watermark)
+        )
+
+        return await self._sync_notify(notify, watermark)
+
+    async def iter_unread_messages(self) -> AsyncIterator[dict]:
+        """Yields unread messages as pages are parsed, stopping early does not fetch the rest pages
+
+        :return: Unread messages
+        :rtype: AsyncIterator[dict]
+        """
+
+        async for soup in AsyncSoupLms.iter_soup_messages_unread(self.session, self.language):
+            messages: list = SoupLms.get_unread_messages_from_soup(soup)
+            soup.decompose()
+
+            for message in messages:
+                yield message
+
+    async def get_unread_messages(self) -> list:
+        """Returns unread messages
+
+        :return: Unread messages
+        :rtype: list
+        """
+
+        return [message async for message in self.iter_unread_messages()]
+
+    async def iter_marks(self) -> AsyncIterator[dict]:
+        """Yields marks, the journal page is freed before the first mark
+
+        :return: Marks
+        :rtype: AsyncIterator[dict]
+        """
+
+        soup: bs = await AsyncSoupLms.get_soup(self.session, self.language, URL_JOURNAL, FRAGMENT_JOURNAL)
+        marks: list = SoupLms.get_marks_from_soup(soup)
+        soup.decompose()
+
+        for mark in marks:
+            yield mark
+
+    async def get_marks(self) -> list:
+        """Returns marks
+
+        :return: Marks
+        :rtype: list
+        """
+
+        return [mark async for mark in self.iter_marks()]
+
+    async def get_events(self) -> list:
+        """Returns events
+
+        :return: Events
+        :rtype: list
+        """
+
+        semaphore: Semaphore = Semaphore(max(self.max_workers, 1))
+
+        return await gather(*(
+            self._get_events_discipline(discipline, semaphore)
+            for discipline in await self.get_disciplines() if discipline["url"] != "-"
+        ))
+
+    async def get_schedule_records(self) -> List[Lesson]:
+        """Returns schedule as lessons as records
+
+        :return: Lessons
+        :rtype: List[Lesson]
+        """
+
+        return get_lessons_from_schedule(await self.get_schedule())
+
+    async def get_disciplines_records(self) -> List[Discipline]:
+        """Returns disciplines as records
+
+        :return: Disciplines
+        :rtype: List[Discipline]
+        """
+
+        return get_records_from_rows(Discipline, await self.get_disciplines())
+
+    async def get_pesonal_curators_records(self) -> List[Curator]:
+        """Returns personal curators as records
+
+        :return: Personal curators
+        :rtype: List[Curator]
+        """
+
+        return get_curators_from_rows(await self.get_pesonal_curators())
+
+    async def get_tutors_records(self) -> List[Curator]:
+        """Returns tutors as records
+
+        :return: Tutors
+        :rtype: List[Curator]
+        """
+
+        return get_curators_from_rows(await self.get_tutors())
+
+    async def get_notify_records(self, page_size: int = None) -> List[Notification]:
+        """Returns notifications as records
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications
+        :rtype: List[Notification]
+        """
+
+        return get_records_from_rows(Notification, await self.get_notify(page_size))
+
+    async def get_notify_archive_records(self, page_size: int = None) -> List[Notification]:
+        """Returns notifications archive as records
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications archive
+        :rtype: List[Notification]
+        """
+
+        return get_records_from_rows(Notification, await self.get_notify_archive(page_size))
+
+    async def get_unread_messages_records(self) -> List[Message]:
+        """Returns unread messages as records
+
+        :return: Unread messages
+        :rtype: List[Message]
+        """
+
+        return get_records_from_rows(Message, await self.get_unread_messages())
+
+    async def get_marks_records(self) -> List[Mark]:
+        """Returns marks as records
+
+        :return: Marks
+        :rtype: List[Mark]
+        """
+
+        return get_records_from_rows(Mark, await self.get_marks())
+
+    async def get_events_records(self) -> List[Event]:
+        """Returns events of all disciplines as records, a discipline whose page failed has no events
+
+        :return: Events
+        :rtype: List[Event]
+        """
+
+        return get_events_from_disciplines(await self.get_events())
+
+
+tracing.trace_methods(limits.bound_methods(AsyncLMS))
@@ -0,0 +1,324 @@
+"""Console command lms-synergy: export of datasets of many accounts
+
+Accounts are read from a CSV file of login and password (a header line with "login" is skipped)
+or from JSON lines with keys login and password. Rows are written as they arrive, as JSON lines
+or as Parquet files, one per dataset, and the report of throughput and failures is printed to stderr.
+
+    lms-synergy accounts.csv --dataset marks --dataset events --concurrency 16 --output marks.jsonl
+    lms-synergy accounts.jsonl --format parquet --output dump/
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, TextIO, Tuple
+from .pool import LMSPool
+from .limits import bounded
+from .lms_synergy_library import LMS
+from .store import SQLiteSessionStore
+from .records import Mark, Notification, Message, Event, Lesson, get_events_from_disciplines,\
+     get_lessons_from_schedule
+from .constants import URLS_LANGUAGES, PARSERS
+
+
+def _iter_events(client: LMS, errors: List[str]) -> Iterator[dict]:
+    """Yields events of all disciplines, errors of disciplines are added to errors"""
+
+    disciplines: List[dict] = client.get_events()
+
+    for discipline in disciplines:
+        for title, events in discipline.items():
+            if "error" in events:
+                errors.append("%s: %s" % (title, events["error"]))
+
+    for event in get_events_from_disciplines(disciplines):
+        yield event.to_dict()
+
+
+def _iter_schedule(client: LMS, errors: List[str]) -> Iterator[dict]:
+    for lesson in get_lessons_from_schedule(client.get_schedule()):
+        yield lesson.to_dict()
+
+
+# dataset: (record whose fields are the columns, rows of client)
+DATASETS: Dict[str, Tuple[type, Callable[[LMS, List[str]], Iterable[dict]]]] = {
+    "marks": (Mark, lambda client, errors: client.iter_marks()),
+    "events": (Event, _iter_events),
+    "notify": (Notification, lambda client, errors: client.iter_notify()),
+    "archive": (Notification, lambda client, errors: client.iter_notify_archive()),
+    "schedule": (Lesson, _iter_schedule),
+    "messages": (Message, lambda client, errors: client.iter_unread_messages()),
+}
+
+
+def read_accounts(path: str) -> Iterator[Tuple[str, str]]:
+    """Yields logins and passwords from CSV file or from JSON lines if the file name ends with .jsonl or .json
+
+    :param path: Path of file
+    :type path: str
+
+    :return: Logins and passwords
+    :rtype: Iterator[Tuple[str, str]]
+    """
+
+    with open(path, encoding="utf-8", newline="") as file:
+        if path.endswith((".jsonl", ".json")):
+            for line in file:
+                if line.strip():
+                    account: dict = json.loads(line)
+                    yield account["login"], account["password"]
+            return
+
+        for row in csv.reader(file):
+            if len(row) < 2 or not row[0].strip() or row[0].startswith("#") or row[0].strip() == "login":
+                continue
+            yield row[0].strip(), row[1]
+
+
+class Writer:
+    """Base of writers, counts rows written of every dataset of every account"""
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._amounts: Dict[Tuple[str, str], int] = {}
+
+    def _count(self, dataset: str, login: str) -> None:
+        """Counts a written row, called under the lock"""
+
+        self._amounts[dataset, login] = self._amounts.get((dataset, login), 0) + 1
+
+    def get_amount(self, dataset: str, login: str) -> int:
+        """Returns amount of rows written of dataset of account, also of a write which failed partway"""
+
+        with self._lock:
+            return self._amounts.get((dataset, login), 0)
+
+
+class JsonLinesWriter(Writer):
+    """Writes rows as lines of JSON with login and dataset"""
+
+    def __init__(self, file: TextIO) -> None:
+        super().__init__()
+        self.file = file
+
+    def write(self, dataset: str, login: str, rows: Iterable[dict]) -> int:
+        """Writes rows of dataset of account, returns amount of rows"""
+
+        amount: int = 0
+
+        try:
+            for row in rows:
+                line: str = json.dumps({"login": login, "dataset": dataset, **row}, ensure_ascii=False)
+                with self._lock:
+                    self.file.write(line + "\n")
+                    self._count(dataset, login)
+                amount += 1
+        finally:
+            with self._lock:
+                self.file.flush()
+
+        return amount
+
+    def close(self) -> None:
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+class ParquetWriter(Writer):
+    """Writes rows into a Parquet file of every dataset in directory, in row groups of batch_size rows"""
+
+    def __init__(self, directory: str, batch_size: int = 10000) -> None:
+        super().__init__()
+
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output requires pyarrow: pip install lms_synergy_library[arrow]")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.pyarrow = pyarrow
+        self.directory = directory
+        self.batch_size = batch_size
+        self._writers: Dict[str, "pyarrow.parquet.ParquetWriter"] = {}
+        self._batches: Dict[str, Dict[str, list]] = {}
+
+    def _flush(self, dataset: str) -> None:
+        batch: Dict[str, list] = self._batches.pop(dataset, None)
+
+        if not batch or not batch["login"]:
+            return
+
+        table = self.pyarrow.table({
+            name: self.pyarrow.array(values, self.pyarrow.string()) for name, values in batch.items()
+        })
+        writer = self._writers.get(dataset)
+
+        if writer is None:
+            writer = self._writers[dataset] = self.pyarrow.parquet.ParquetWriter(
+                os.path.join(self.directory, "%s.parquet" % dataset), table.schema
+            )
+
+        writer.write_table(table)
+
+    def write(self, dataset: str, login: str, rows: Iterable[dict]) -> int:
+        """Writes rows of dataset of account, returns amount of rows"""
+
+        fields: Tuple[str, ...] = ("login",) + DATASETS[dataset][0]._fields
+        amount: int = 0
+
+        for row in rows:
+            with self._lock:
+                batch: Dict[str, list] = self._batches.get(dataset)
+                if batch is None:
+                    batch = self._batches[dataset] = {name: [] for name in fields}
+
+                batch["login"].append(login)
+                for name in fields[1:]:
+                    batch[name].append(row.get(name))
+                self._count(dataset, login)
+
+                if len(batch["login"]) >= self.batch_size:
+                    self._flush(dataset)
+            amount += 1
+
+        return amount
+
+    def close(self) -> None:
+        with self._lock:
+            for dataset in list(self._batches):
+                self._flush(dataset)
+            for writer in self._writers.values():
+                writer.close()
+
+
+def export_account(client: LMS, datasets: Iterable[str], writer: Writer, deadline: float = None) -> dict:
+    """Writes datasets of account, a failed dataset does not stop the rest
+
+    :param client: Client of account
+    :param datasets: Names of datasets
+    :param writer: JsonLinesWriter or ParquetWriter, rows written before an error of a dataset are counted too
+    :param deadline: Seconds for every dataset, unlimited if None
+
+    :type client: LMS
+    :type datasets: Iterable[str]
+    :type writer: Writer
+    :type deadline: float
+
+    :return: Amount of rows, amount of requests and errors by dataset
+    :rtype: dict
+    """
+
+    rows: int = 0
+    errors: Dict[str, List[str]] = {}
+
+    for dataset in datasets:
+        dataset_errors: List[str] = []
+        get_rows: Callable[[LMS, List[str]], Iterable[dict]] = DATASETS[dataset][1]
+
+        try:
+            rows += writer.write(dataset, client.login, bounded(get_rows)(client, dataset_errors, deadline=deadline))
+        except Exception as error:
+            rows += writer.get_amount(dataset, client.login)
+            dataset_errors.append("%s: %s" % (type(error).__name__, error))
+
+        if dataset_errors:
+            errors[dataset] = dataset_errors
+
+    return {"rows": rows, "requests": client.amount_requests, "errors": errors}
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="lms-synergy", description=__doc__.split("\n")[0])
+    parser.add_argument("accounts", help="CSV file of login,password or JSON lines of login and password")
+    parser.add_argument(
+        "--dataset", "-d", action="append", choices=list(DATASETS), help="Dataset to export, all by default"
+    )
+    parser.add_argument("--output", "-o", default="-", help="File of JSON lines, - for stdout, or directory of Parquet")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl", help="Format of output")
+    parser.add_argument("--concurrency", "-c", type=int, default=8, help="Accounts exported at once")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second of every account")
+    parser.add_argument("--total-rate-limit", type=float, help="Requests per second of all accounts together")
+    parser.add_argument("--deadline", type=float, help="Seconds for every dataset of an account")
+    parser.add_argument("--language", choices=list(URLS_LANGUAGES), default="en", help="Language of LMS")
+    parser.add_argument("--parser", choices=list(PARSERS), default="auto", help="Parser backend")
+    parser.add_argument("--store", help="SQLite file of saved sessions, accounts sign in again only when they expire")
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """Runs the export, returns 0 if every dataset of every account is exported and 1 otherwise
+
+    :param argv: Arguments, arguments of the command line if None
+    :type argv: List[str]
+
+    :return: Exit code
+    :rtype: int
+    """
+
+    args = get_parser().parse_args(argv)
+    datasets: List[str] = args.dataset if args.dataset else list(DATASETS)
+
+    if args.format == "parquet":
+        if args.output == "-":
+            get_parser().error("--format parquet needs --output DIRECTORY")
+        writer = ParquetWriter(args.output)
+    else:
+        writer = JsonLinesWriter(sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8"))
+
+    store: SQLiteSessionStore = SQLiteSessionStore(args.store) if args.store else None
+    options: dict = {"language": args.language, "parser": args.parser, "store": store}
+    if args.rate_limit:
+        options["rate_limit"] = args.rate_limit
+
+    start: float = perf_counter()
+
+    try:
+        with LMSPool(max_workers=args.concurrency, total_rate_limit=args.total_rate_limit, **options) as pool:
+            def export(client: LMS) -> dict:
+                try:
+                    return export_account(client, datasets, writer, args.deadline)
+                finally:
+                    pool.release(client.login)
+
+            results: List[dict] = pool.run(export, read_accounts(args.accounts))
+    finally:
+        writer.close()
+        if store is not None:
+            store.close()
+
+    seconds: float = perf_counter() - start
+    failures: List[dict] = []
+
+    for result in results:
+        if result["error"] is not None:
+            failures.append({"login": result["login"], "dataset": None, "errors": [result["error"]]})
+            continue
+        for dataset, errors in result["result"]["errors"].items():
+            failures.append({"login": result["login"], "dataset": dataset, "errors": errors})
+
+    rows: int = sum(result["result"]["rows"] for result in results if result["error"] is None)
+    requests: int = sum(result["result"]["requests"] for result in results if result["error"] is None)
+
+    print(json.dumps({
+        "accounts": len(results),
+        "failed_accounts": len({failure["login"] for failure in failures}),
+        "datasets": datasets,
+        "rows": rows,
+        "requests": requests,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(rows / seconds, 1) if seconds else None,
+        "requests_per_second": round(requests / seconds, 1) if seconds else None,
+        "failures": failures,
+    }, ensure_ascii=False, indent=1), file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
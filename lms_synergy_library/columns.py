@@ -0,0 +1,362 @@
+"""Columnar export of marks and events of one or many accounts for vectorized analytics
+
+Grades and hours are parsed into float arrays with NaN for values which are not numbers,
+dates into datetime64[D] with NaT, and logins, disciplines, teachers and other repeated
+strings into int32 codes of categories. NumPy is required, Arrow and Parquet output need pyarrow.
+
+    >>> from lms_synergy_library import LMS, columns
+    >>> lms = LMS(login="demo", password="demo")
+    >>> marks = columns.get_columns_marks(lms.get_marks())
+    >>> averages = columns.get_averages(marks, "mark", "discipline")
+"""
+
+from datetime import date
+from typing import Dict, Iterable, List, Tuple, Union
+from .records import Event
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+# kinds of columns: category is int32 code, number is float64 with NaN, date is datetime64[D] with NaT
+DTYPES: Dict[str, str] = {"category": "int32", "number": "float64", "date": "datetime64[D]", "text": "object"}
+MARKS_COLUMNS: Dict[str, str] = {
+    "login": "category",
+    "discipline": "category",
+    "type_discipline": "category",
+    "teacher": "category",
+    "date": "date",
+    "time": "text",
+    "mark": "number",
+    "hours": "number",
+}
+EVENTS_COLUMNS: Dict[str, str] = {
+    "login": "category",
+    "discipline": "category",
+    "name": "text",
+    "access": "category",
+    "current_grade": "number",
+    "max_grade": "number",
+    "result": "number",
+}
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Columnar export requires numpy: pip install lms_synergy_library[numpy]")
+
+
+def _require_pyarrow() -> None:
+    if pyarrow is None:
+        raise ImportError("Arrow and Parquet output require pyarrow: pip install lms_synergy_library[arrow]")
+
+
+class Columns:
+    """Typed column arrays of equal length, categorical columns are int32 codes into categories[name]"""
+
+    def __init__(self, arrays: Dict[str, "np.ndarray"], categories: Dict[str, List[str]] = None) -> None:
+        """Init columns
+
+        :param arrays: Arrays by name of column
+        :param categories: Categories of categorical columns by name of column
+
+        :type arrays: Dict[str, numpy.ndarray]
+        :type categories: Dict[str, List[str]]
+
+        :return: None
+        :rtype: None
+        """
+
+        self.arrays = arrays
+        self.categories = categories if categories else {}
+
+    def __len__(self) -> int:
+        return len(next(iter(self.arrays.values()))) if self.arrays else 0
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.arrays[name]
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.arrays)
+
+    def decode(self, name: str) -> "np.ndarray":
+        """Returns values of categorical column as an array of strings
+
+        :param name: Name of column
+        :type name: str
+
+        :return: Values
+        :rtype: numpy.ndarray
+        """
+
+        return np.asarray(self.categories[name], dtype=object)[self.arrays[name]]
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Returns Arrow table, categorical columns are dictionary arrays
+
+        :return: Table
+        :rtype: pyarrow.Table
+        """
+
+        _require_pyarrow()
+
+        return pyarrow.table({
+            name: pyarrow.DictionaryArray.from_arrays(array, self.categories[name])
+            if name in self.categories else pyarrow.array(array)
+            for name, array in self.arrays.items()
+        })
+
+    def to_parquet(self, path: str) -> None:
+        """Writes columns to Parquet file
+
+        :param path: Path of file
+        :type path: str
+
+        :return: None
+        :rtype: None
+        """
+
+        _require_pyarrow()
+
+        pyarrow.parquet.write_table(self.to_arrow(), path)
+
+
+class _Encoder:
+    """Codes of categories and parsed values, every distinct string is parsed once"""
+
+    def __init__(self) -> None:
+        self.codes: Dict[str, Dict[str, int]] = {}
+        self.numbers: Dict[str, float] = {}
+        self.dates: Dict[str, "np.datetime64"] = {}
+
+    def code(self, name: str, value: str) -> int:
+        codes: Dict[str, int] = self.codes.setdefault(name, {})
+        code: int = codes.get(value)
+
+        if code is None:
+            code = codes[value] = len(codes)
+
+        return code
+
+    def number(self, value: str) -> float:
+        number: float = self.numbers.get(value)
+
+        if number is None:
+            try:
+                number = float(value.replace(",", "."))
+            except (AttributeError, ValueError):
+                number = float("nan")
+            self.numbers[value] = number
+
+        return number
+
+    def date(self, value: str) -> "np.datetime64":
+        parsed: "np.datetime64" = self.dates.get(value)
+
+        if parsed is None:
+            try:
+                day, month, year = (int(part) for part in value.split(".")[:3])
+                parsed = np.datetime64(date(year + 2000 if year < 100 else year, month, day), "D")
+            except (AttributeError, ValueError):
+                parsed = np.datetime64("NaT", "D")
+            self.dates[value] = parsed
+
+        return parsed
+
+    def columns(self, values: Dict[str, list], types: Dict[str, str]) -> Columns:
+        arrays: Dict[str, "np.ndarray"] = {}
+        categories: List[str] = [name for name, kind in types.items() if kind == "category"]
+
+        for name, column in values.items():
+            arrays[name] = np.array(column, dtype=DTYPES[types.get(name, "text")])
+
+        return Columns(arrays, {name: list(self.codes.get(name, {})) for name in categories})
+
+
+def _get_accounts(rows: Union[Iterable, Dict[str, Iterable]]) -> Iterable[Tuple[str, Iterable]]:
+    """Returns pairs of login and rows, rows of one account get an empty login"""
+
+    return rows.items() if isinstance(rows, dict) else (("", rows),)
+
+
+def get_columns_marks(marks: Union[Iterable, Dict[str, Iterable]]) -> Columns:
+    """Returns columns of marks: login, discipline, type_discipline and teacher are categorical,
+    date is datetime64[D], mark and hours are float
+
+    :param marks: Marks from get_marks or get_marks_records of one account, or marks by login
+    :type marks: Union[Iterable, Dict[str, Iterable]]
+
+    :return: Columns
+    :rtype: Columns
+    """
+
+    _require_numpy()
+
+    encoder: _Encoder = _Encoder()
+    values: Dict[str, list] = {name: [] for name in MARKS_COLUMNS}
+
+    for login, rows in _get_accounts(marks):
+        for row in rows:
+            row = row if isinstance(row, dict) else row.to_dict()
+            values["login"].append(encoder.code("login", login))
+            values["discipline"].append(encoder.code("discipline", row["discipline"]))
+            values["type_discipline"].append(encoder.code("type_discipline", row["type_discipline"]))
+            values["teacher"].append(encoder.code("teacher", row["teacher"]))
+            values["date"].append(encoder.date(row["date_discipline"]))
+            values["time"].append(row["time_discipline"])
+            values["mark"].append(encoder.number(row["mark"]))
+            values["hours"].append(encoder.number(row["hours"]))
+
+    return encoder.columns(values, MARKS_COLUMNS)
+
+
+def get_columns_events(events: Union[Iterable, Dict[str, Iterable]]) -> Columns:
+    """Returns columns of events: login, discipline and access are categorical,
+    current_grade of discipline, max_grade and result are float, disciplines whose page failed are left out
+
+    :param events: Events from get_events or get_events_records of one account, or events by login
+    :type events: Union[Iterable, Dict[str, Iterable]]
+
+    :return: Columns
+    :rtype: Columns
+    """
+
+    _require_numpy()
+
+    encoder: _Encoder = _Encoder()
+    values: Dict[str, list] = {name: [] for name in EVENTS_COLUMNS}
+
+    def add(login: str, discipline: str, current_grade: str, event: dict) -> None:
+        values["login"].append(encoder.code("login", login))
+        values["discipline"].append(encoder.code("discipline", discipline))
+        values["name"].append(event["name"])
+        values["access"].append(encoder.code("access", event["access"]))
+        values["current_grade"].append(encoder.number(current_grade))
+        values["max_grade"].append(encoder.number(event["max_grade"]))
+        values["result"].append(encoder.number(event["result"]))
+
+    for login, rows in _get_accounts(events):
+        for row in rows:
+            if isinstance(row, Event):
+                add(login, row.discipline, row.current_grade, row.to_dict())
+                continue
+
+            for discipline, discipline_events in row.items():
+                if "error" in discipline_events:
+                    continue
+                for event in discipline_events["events"]:
+                    add(login, discipline, discipline_events["current_grade"], event)
+
+    return encoder.columns(values, EVENTS_COLUMNS)
+
+
+def get_aggregates(columns: Columns, value: str, by: str) -> Columns:
+    """Returns count of numbers, sum, mean, min and max of column value for every category of column by,
+    NaN values are skipped
+
+    :param columns: Columns
+    :param value: Name of float column
+    :param by: Name of categorical column
+
+    :type columns: Columns
+    :type value: str
+    :type by: str
+
+    :return: Columns with column by, one row for every category, and count, sum, mean, min and max
+    :rtype: Columns
+    """
+
+    codes: "np.ndarray" = columns[by]
+    values: "np.ndarray" = columns[value]
+    size: int = len(columns.categories[by])
+    present: "np.ndarray" = ~np.isnan(values)
+
+    count: "np.ndarray" = np.bincount(codes[present], minlength=size).astype(np.float64)
+    total: "np.ndarray" = np.bincount(codes[present], weights=values[present], minlength=size)
+    minimum: "np.ndarray" = np.full(size, np.inf)
+    maximum: "np.ndarray" = np.full(size, -np.inf)
+    np.minimum.at(minimum, codes[present], values[present])
+    np.maximum.at(maximum, codes[present], values[present])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean: "np.ndarray" = total / count
+
+    empty: "np.ndarray" = count == 0
+    minimum[empty] = np.nan
+    maximum[empty] = np.nan
+
+    return Columns(
+        {
+            by: np.arange(size, dtype=np.int32),
+            "count": count,
+            "sum": total,
+            "mean": mean,
+            "min": minimum,
+            "max": maximum,
+        },
+        {by: columns.categories[by]},
+    )
+
+
+def get_averages(columns: Columns, value: str, by: str) -> Dict[str, float]:
+    """Returns mean of column value for every category of column by, NaN values are skipped
+
+    :param columns: Columns
+    :param value: Name of float column
+    :param by: Name of categorical column
+
+    :type columns: Columns
+    :type value: str
+    :type by: str
+
+    :return: Mean by category
+    :rtype: Dict[str, float]
+    """
+
+    aggregates: Columns = get_aggregates(columns, value, by)
+
+    return dict(zip(aggregates.categories[by], aggregates["mean"].tolist()))
+
+
+def get_completion_ratios(events: Columns, by: str = "discipline") -> Dict[str, Dict[str, float]]:
+    """Returns for every category of column by of events the share of events with a numeric result
+    and the share of the maximum grade which is reached
+
+    :param events: Columns of events
+    :param by: Name of categorical column
+
+    :type events: Columns
+    :type by: str
+
+    :return: Ratios "completed" and "score" by category
+    :rtype: Dict[str, Dict[str, float]]
+    """
+
+    codes: "np.ndarray" = events[by]
+    size: int = len(events.categories[by])
+    result: "np.ndarray" = events["result"]
+    max_grade: "np.ndarray" = events["max_grade"]
+    graded: "np.ndarray" = ~np.isnan(max_grade)
+
+    amount: "np.ndarray" = np.bincount(codes, minlength=size)
+    completed: "np.ndarray" = np.bincount(codes[~np.isnan(result)], minlength=size)
+    reached: "np.ndarray" = np.bincount(codes, weights=np.where(graded, np.nan_to_num(result), 0.0), minlength=size)
+    possible: "np.ndarray" = np.bincount(codes, weights=np.where(graded, max_grade, 0.0), minlength=size)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        completed_ratio: "np.ndarray" = completed / amount
+        score_ratio: "np.ndarray" = reached / possible
+
+    return {
+        category: {"completed": completed_ratio[code].item(), "score": score_ratio[code].item()}
+        for code, category in enumerate(events.categories[by])
+    }
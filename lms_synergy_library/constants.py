@@ -1,7 +1,9 @@
+from os import environ
 from typing import Final
 
 
-URL: Final[str] = "https://lms.synergy.ru"
+# the environment variable points the client at another server, e.g. a local stand-in for load tests
+URL: Final[str] = environ.get("LMS_SYNERGY_URL", "https://lms.synergy.ru").rstrip("/")
 URL_LOGIN: Final[str] = "%s/user/login" % URL
 URL_SCHEDULE: Final[str] = "%s/schedule/academ" % URL
 URL_NEWS: Final[str] = "%s/announce" % URL
@@ -15,3 +17,27 @@ URLS_LANGUAGES: Final[dict] = {
         "ru": "%s/user/lng/1" % URL,
         "en": "%s/user/lng/2" % URL,
 }
+# notifications per page: the size of the site and the size requested first to learn how many rows the server gives
+PAGE_SIZE_NOTIFY: Final[int] = 10
+PAGE_SIZE_NOTIFY_PROBE: Final[int] = 100
+# seconds of connect and read of every request
+TIMEOUT: Final[tuple] = (10.0, 30.0)
+USER_AGENTS: Final[tuple] = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 14.4; rv:125.0) Gecko/20100101 Firefox/125.0",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0",
+)
+# tree builders of parser backends in order of preference, html5lib is left out: it is slower than html.parser
+# and ignores parse_only, so it would parse whole pages instead of fragments
+PARSERS: Final[dict] = {
+        "auto": ("lxml", "html.parser"),
+        "lxml": ("lxml", "html.parser"),
+        "html.parser": ("html.parser",),
+}
+# datasets which LMS.sync_mirror and Mirror.start sync by default
+MIRROR_DATASETS: Final[tuple] = ("marks", "notify", "notify_archive", "unread_messages", "events", "schedule")
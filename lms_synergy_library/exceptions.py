@@ -1,6 +1,12 @@
 class LanguageNotFoundError(Exception):
     pass
 
+class ParserNotFoundError(Exception):
+    pass
+
+class DatasetNotFoundError(Exception):
+    pass
+
 class UserIsNotTeacherError(Exception):
     pass
 
@@ -9,3 +15,12 @@ class UserIsNotStudentError(Exception):
 
 class PageNotExist(Exception):
     pass
+
+class ServerError(Exception):
+    pass
+
+class DeadlineExceededError(Exception):
+    pass
+
+class PasswordMismatchError(Exception):
+    pass
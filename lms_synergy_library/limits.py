@@ -0,0 +1,399 @@
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+from inspect import Parameter, Signature, isasyncgenfunction, iscoroutinefunction, signature as _signature
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+from types import AsyncGeneratorType, GeneratorType
+from typing import Callable, Mapping, Tuple, Union
+from .exceptions import DeadlineExceededError
+
+
+_deadline: ContextVar = ContextVar("lms_synergy_library_deadline", default=None)
+
+
+class TokenBucket:
+    """Rate limiter of requests: rate tokens per second, up to burst tokens are saved while idle"""
+
+    def __init__(self, rate: float, burst: float = None) -> None:
+        """Init token bucket
+
+        :param rate: Requests per second
+        :param burst: Requests which may be sent at once after idle time, rate if None and at least 1
+
+        :type rate: float
+        :type burst: float
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS, TokenBucket
+        >>> limiter = TokenBucket(rate=10)
+        >>> lms = LMS(login="demo", password="demo", limiter=limiter)
+        """
+
+        self.rate = rate
+        self.burst = burst if burst else max(rate, 1)
+        self._tokens: float = self.burst
+        self._updated: float = monotonic()
+        self._lock: Lock = Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, returns seconds to wait before the request
+
+        :return: Seconds
+        :rtype: float
+        """
+
+        with self._lock:
+            now: float = monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """Waits for a token
+
+        :return: None
+        :rtype: None
+        """
+
+        delay: float = self.reserve()
+
+        if delay > 0:
+            sleep(delay)
+
+
+def get_content_length(headers: Mapping[str, str]) -> int:
+    """Returns Content-Length of response, None if it is missing, invalid or counts encoded bytes
+
+    :param headers: Headers of response
+    :type headers: Mapping[str, str]
+
+    :return: Length of body in bytes
+    :rtype: int
+    """
+
+    length: str = headers.get("Content-Length")
+
+    if not length or not length.isdigit() or headers.get("Content-Encoding", "identity") != "identity":
+        return None
+
+    return int(length)
+
+
+class RetryPolicy:
+    """Retries of one request on connection errors, statuses of overload and truncated pages,
+    with exponential backoff and full jitter, Retry-After of response is honored"""
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.5,
+        max_delay: float = 30.0,
+        statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        methods: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS"),
+        truncated_html: bool = False,
+    ) -> None:
+        """Init retry policy
+
+        :param attempts: Attempts of request including the first one
+        :param backoff: Upper bound of delay before the first retry in seconds, it doubles every retry
+        :param max_delay: Upper bound of any delay in seconds, also of Retry-After
+        :param statuses: Statuses of response which are retried
+        :param methods: Idempotent methods which are retried, requests of other methods such as the login POST
+            are sent once and their error pages raise at once
+        :param truncated_html: Also retry HTML pages without </html> in their last 512 bytes, for servers which cut
+            pages without breaking the connection, pages shorter than their Content-Length are always retried
+
+        :type attempts: int
+        :type backoff: float
+        :type max_delay: float
+        :type statuses: Tuple[int, ...]
+        :type methods: Tuple[str, ...]
+        :type truncated_html: bool
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS, RetryPolicy
+        >>> lms = LMS(login="demo", password="demo", retry=RetryPolicy(attempts=5))
+        """
+
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.statuses = statuses
+        self.methods = methods
+        self.truncated_html = truncated_html
+
+    def get_attempts(self, method: str) -> int:
+        """Returns attempts of request of method
+
+        :param method: Method
+        :type method: str
+
+        :return: Attempts
+        :rtype: int
+        """
+
+        return self.attempts if method.upper() in self.methods else 1
+
+    def get_error(
+        self, status: int, content_type: str, tail: bytes, length: int = None, received: int = None
+    ) -> str:
+        """Returns description of error page or None if the page can be parsed
+
+        :param status: Status of response
+        :param content_type: Content-Type of response
+        :param tail: Last bytes of body
+        :param length: Content-Length of response, None if unknown
+        :param received: Bytes of body received
+
+        :type status: int
+        :type content_type: str
+        :type tail: bytes
+        :type length: int
+        :type received: int
+
+        :return: Error
+        :rtype: str
+        """
+
+        if status in self.statuses:
+            return "Status %d" % status
+        if status != 200:
+            return None
+        if length is not None and received is not None and received < length:
+            return "Truncated page of %d of %d bytes" % (received, length)
+        if self.truncated_html and "html" in (content_type or "") and b"</html>" not in tail.lower():
+            return "Truncated page"
+
+        return None
+
+    def get_delay(self, attempt: int, retry_after: str = None) -> float:
+        """Returns seconds before retry
+
+        :param attempt: Number of failed attempt from 0
+        :param retry_after: Retry-After of response, seconds or date
+
+        :type attempt: int
+        :type retry_after: str
+
+        :return: Seconds
+        :rtype: float
+        """
+
+        if retry_after:
+            try:
+                delay: float = float(retry_after)
+            except ValueError:
+                from email.utils import parsedate_to_datetime
+
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+
+            if delay is not None:
+                return min(max(delay, 0.0), self.max_delay)
+
+        return uniform(0, min(self.max_delay, self.backoff * 2 ** attempt))
+
+
+RETRY_DEFAULT: RetryPolicy = RetryPolicy()
+
+
+def check_deadline(wait: float = 0.0) -> float:
+    """Returns seconds left until the deadline of the current call, None if it has no deadline
+
+    :param wait: Seconds which are going to be spent before the next request
+    :type wait: float
+
+    :return: Seconds
+    :rtype: float
+
+    :raises DeadlineExceededError: The deadline is over or comes before the wait ends
+    """
+
+    deadline: float = _deadline.get()
+
+    if deadline is None:
+        return None
+
+    remaining: float = deadline - monotonic()
+
+    if remaining <= wait:
+        raise DeadlineExceededError("Deadline is exceeded by %.3f s" % (wait - remaining))
+
+    return remaining
+
+
+def get_timeout(timeout: Union[float, Tuple[float, float]]) -> Union[float, Tuple[float, float]]:
+    """Returns timeout of request shortened to the seconds left until the deadline of the current call
+
+    :param timeout: Timeout of requests, seconds or seconds of connect and read
+    :type timeout: Union[float, Tuple[float, float]]
+
+    :return: Timeout
+    :rtype: Union[float, Tuple[float, float]]
+
+    :raises DeadlineExceededError: The deadline is over
+    """
+
+    remaining: float = check_deadline()
+
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(remaining if part is None else min(part, remaining) for part in timeout)
+
+    return min(timeout, remaining)
+
+
+def _set_deadline(seconds: float):
+    """Sets deadline of the current call, an earlier deadline of the enclosing call is kept"""
+
+    deadline: float = monotonic() + seconds
+    current: float = _deadline.get()
+
+    return _deadline.set(deadline if current is None else min(deadline, current))
+
+
+def _iterate(deadline: float, iterator):
+    """Yields items of iterator with the deadline of the call which created it"""
+
+    try:
+        while True:
+            token = _deadline.set(deadline)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _deadline.reset(token)
+            yield item
+    finally:
+        iterator.close()
+
+
+async def _aiterate(deadline: float, iterator):
+    """Yields items of async iterator with the deadline of the call which created it"""
+
+    try:
+        while True:
+            token = _deadline.set(deadline)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _deadline.reset(token)
+            yield item
+    finally:
+        await iterator.aclose()
+
+
+def bounded(function: Callable) -> Callable:
+    """Adds keyword argument deadline to method: seconds for the whole call including all of its requests,
+    generators are bounded until exhausted, no deadline if None. The argument is added to the signature
+    of the method, so help() shows it, requests of the call raise DeadlineExceededError when it is over
+
+    :param function: Method
+    :type function: Callable
+
+    :return: Bounded method
+    :rtype: Callable
+
+    :Example:
+
+    >>> from lms_synergy_library import limits
+    >>> get_page = limits.bounded(lambda url: limits.check_deadline())
+    >>> get_page("/", deadline=5) <= 5
+    True
+    """
+
+    if isasyncgenfunction(function):
+        @wraps(function)
+        def wrapper(*args, deadline: float = None, **kwargs):
+            if deadline is None:
+                return function(*args, **kwargs)
+
+            token = _set_deadline(deadline)
+            try:
+                return _aiterate(_deadline.get(), function(*args, **kwargs))
+            finally:
+                _deadline.reset(token)
+
+    elif iscoroutinefunction(function):
+        @wraps(function)
+        async def wrapper(*args, deadline: float = None, **kwargs):
+            if deadline is None:
+                return await function(*args, **kwargs)
+
+            token = _set_deadline(deadline)
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                _deadline.reset(token)
+
+    else:
+        @wraps(function)
+        def wrapper(*args, deadline: float = None, **kwargs):
+            if deadline is None:
+                return function(*args, **kwargs)
+
+            token = _set_deadline(deadline)
+            try:
+                result = function(*args, **kwargs)
+                current: float = _deadline.get()
+            finally:
+                _deadline.reset(token)
+
+            if isinstance(result, GeneratorType):
+                return _iterate(current, result)
+            if isinstance(result, AsyncGeneratorType):
+                return _aiterate(current, result)
+
+            return result
+
+    try:
+        signature: Signature = _signature(function)
+    except (TypeError, ValueError):
+        return wrapper
+
+    parameters: list = [parameter for parameter in signature.parameters.values() if parameter.name != "deadline"]
+    position: int = next(
+        (index for index, parameter in enumerate(parameters) if parameter.kind == Parameter.VAR_KEYWORD),
+        len(parameters)
+    )
+    parameters.insert(position, Parameter("deadline", Parameter.KEYWORD_ONLY, default=None, annotation=float))
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+
+    return wrapper
+
+
+def bound_methods(cls: type) -> type:
+    """Adds keyword argument deadline of bounded() to public methods of class, properties are left as they are
+
+    :param cls: Class
+    :type cls: type
+
+    :return: Class
+    :rtype: type
+    """
+
+    for name, value in list(vars(cls).items()):
+        if not name.startswith("_") and callable(value) and not isinstance(value, (type, staticmethod, classmethod)):
+            setattr(cls, name, bounded(value))
+
+    return cls
@@ -1,14 +1,43 @@
-from requests import Session
-from bs4 import BeautifulSoup as bs
-from fake_useragent import UserAgent
-from .utils import clean_data, SoupLms
-from .exceptions import LanguageNotFoundError, UserIsNotTeacherError, UserIsNotStudentError
-from .constants import URL_LOGIN, URLS_LANGUAGES, URL
-from typing import Dict, List
+from collections import deque
+from contextvars import copy_context
+from itertools import islice
+from random import choice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Set, Tuple, Union
+from . import limits, tracing
+from .store import SessionStore, hash_credentials, check_credentials
+from .limits import TokenBucket, RetryPolicy, RETRY_DEFAULT
+from .records import Mark, Notification, Message, Event, Lesson, Discipline, Curator, get_curators_from_rows,\
+     get_events_from_disciplines, get_lessons_from_schedule, get_records_from_rows
+from .exceptions import LanguageNotFoundError, UserIsNotTeacherError, UserIsNotStudentError, DatasetNotFoundError,\
+     DeadlineExceededError, ParserNotFoundError
+from .constants import URL, URL_LOGIN, URLS_LANGUAGES, USER_AGENTS, TIMEOUT, PAGE_SIZE_NOTIFY, PAGE_SIZE_NOTIFY_PROBE,\
+     PARSERS, MIRROR_DATASETS
+
+if TYPE_CHECKING:
+    from requests import Response
+    from requests.adapters import HTTPAdapter
+    from bs4 import BeautifulSoup as bs
+    from .utils import PageSnapshots, LmsSession
+    from .mirror import Mirror
 
 
 class LMS:
-    session: Session = None
+    """Client of one account of LMS
+
+    Every public method also takes the keyword argument deadline: seconds for the whole call, including
+    retries, waits of rate limiters and pages fetched by threads. Generators are bounded until exhausted.
+    DeadlineExceededError is raised when it is over.
+
+    >>> from lms_synergy_library import LMS
+    >>> lms = LMS(login="demo", password="demo")
+    >>> marks = lms.get_marks(deadline=10)
+    """
+
+    _session: "LmsSession" = None
+    _snapshots: "PageSnapshots" = None
+    _parser: str = None
+    _checked: bool = True
+    _page_size_notify: int = None
     type_user: str = None
 
     def __init__(
@@ -18,6 +47,17 @@ class LMS:
         proxy: dict = None,
         headers: dict = None,
         language: str = "en",
+        snapshot_ttl: float = 5.0,
+        max_workers: int = 4,
+        parser: str = "auto",
+        adapter: "HTTPAdapter" = None,
+        store: SessionStore = None,
+        lazy: bool = False,
+        rate_limit: float = None,
+        limiter: TokenBucket = None,
+        retry: RetryPolicy = RETRY_DEFAULT,
+        timeout: Union[float, Tuple[float, float]] = TIMEOUT,
+        page_size: int = None,
     ) -> None:
         """Init LMS
 
@@ -26,12 +66,34 @@ class LMS:
         :param proxy: Proxy
         :param headers: Headers
         :param language: Language
+        :param snapshot_ttl: Seconds during which getters of one page share a single fetch, 0 disables it
+        :param max_workers: Maximum amount of pages fetched concurrently
+        :param parser: Parser backend, "auto" picks lxml if it is installed and html.parser otherwise
+        :param adapter: Adapter with connection pool shared between clients, each client owns its own if None
+        :param store: Store of sessions, a saved session of the same password is restored and checked on the first use
+        :param lazy: Sign in on the first call or in connect() instead of in the constructor
+        :param rate_limit: Maximum requests per second of this client, unlimited if None
+        :param limiter: Rate limiter shared with other clients, e.g. of all accounts
+        :param retry: Retry policy of every request, None disables retries and detection of error pages
+        :param timeout: Timeout of every request, seconds or seconds of connect and read
+        :param page_size: Notifications per page, if None a large page is requested and the size of the server is kept
 
         :type login: str
         :type password: str
         :type proxy: dict
         :type headers: dict
         :type language: str
+        :type snapshot_ttl: float
+        :type max_workers: int
+        :type parser: str
+        :type adapter: requests.adapters.HTTPAdapter
+        :type store: SessionStore
+        :type lazy: bool
+        :type rate_limit: float
+        :type limiter: TokenBucket
+        :type retry: RetryPolicy
+        :type timeout: Union[float, Tuple[float, float]]
+        :type page_size: int
 
         :return: None
         :rtype: None
@@ -52,8 +114,26 @@ class LMS:
         if language not in URLS_LANGUAGES:
             raise LanguageNotFoundError("No such language %s" % language)
         self.language = language
+        self.snapshot_ttl = snapshot_ttl
+        self.max_workers = max_workers
+        if parser not in PARSERS:
+            raise ParserNotFoundError("No such parser %s" % parser)
+        self.parser_backend = parser
+        self.adapter = adapter
+        self.store = store
+        self.limiters: Tuple[TokenBucket, ...] = tuple(
+            bucket for bucket in (TokenBucket(rate_limit) if rate_limit else None, limiter) if bucket is not None
+        )
+        self.retry = retry
+        self.timeout = timeout
+        self.page_size = page_size
+
+        state: dict = store.load(login) if store else None
 
-        self.__sign()
+        if state and check_credentials(state, login, password):
+            self.__restore(state)
+        elif not lazy:
+            self.__sign()
 
     def __del__(self) -> None:
         """Close session
@@ -68,11 +148,26 @@ class LMS:
         >>> del lms
         """
 
-        if self.session:
-            self.session.close()
+        self.close()
+
+    def close(self) -> None:
+        """Close session
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> lms.close()
+        """
+
+        if self._session:
+            self._session.close()
 
     def __sign(self) -> None:
-        """Auth
+        """Auth, type of user, name and counters are read from the landing page of login
 
         :return: None
         :rtype: None
@@ -84,18 +179,152 @@ class LMS:
         >>> lms._LMS__sign()
         """
 
+        from .utils import FRAGMENT_HEADER, SoupLms, LmsSession
+
         headers: dict = (
-            self.headers if self.headers else {"User-Agent": UserAgent().random}
+            self.headers if self.headers else {"User-Agent": choice(USER_AGENTS)}
         )
         proxies: dict = self.proxy if self.proxy else {}
 
         data: dict = {"popupUsername": self.login, "popupPassword": self.password}
 
-        self.session = Session()
-        self.session.headers.update(headers)
-        self.session.post(URL_LOGIN, data=data, proxies=proxies)
-        self.session.get(URLS_LANGUAGES[self.language], proxies=proxies)
-        self.type_user = self.get_type_user()
+        self.snapshots.clear()
+        self._checked = True
+        self._session = LmsSession(self.parser, self.adapter, self.limiters, self.retry, self.timeout)
+        self._session.headers.update(headers)
+        response: Response = self._session.post(URL_LOGIN, data=data, proxies=proxies)
+        response = SoupLms.set_language(self._session, self.language, self.cookies, proxies) or response
+
+        soup: bs = SoupLms.make_soup(self._session, response.text, FRAGMENT_HEADER)
+        self.snapshots.put(URL, self.language, soup)
+        self.type_user = SoupLms.get_type_user_from_soup(soup)
+        self.__save()
+
+    def __restore(self, state: dict) -> None:
+        """Restore saved session without requests, it is checked on the first use
+
+        :param state: State of session
+        :type state: dict
+
+        :return: None
+        :rtype: None
+        """
+
+        from .utils import LmsSession
+
+        headers: dict = (
+            self.headers if self.headers else {"User-Agent": state["user_agent"]}
+        )
+
+        self.snapshots.clear()
+        self._checked = False
+        self._session = LmsSession(self.parser, self.adapter, self.limiters, self.retry, self.timeout)
+        self._session.headers.update(headers)
+        self._session.cookies.update(state["cookies"])
+        self._session.language = state["language"]
+        self.type_user = state["type_user"]
+
+    def __save(self) -> None:
+        """Save state of session to store
+
+        :return: None
+        :rtype: None
+        """
+
+        if self.store:
+            self.store.save(self.login, {
+                "cookies": self._session.cookies.get_dict(),
+                "language": self._session.language,
+                "type_user": self.type_user,
+                "user_agent": self._session.headers.get("User-Agent"),
+                "credentials": hash_credentials(self.login, self.password),
+            })
+
+    def connect(self) -> None:
+        """Sign in if it has not happened yet, a restored session is checked
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo", lazy=True)
+        >>> lms.connect()
+        >>> lms.type_user
+        'student'
+        """
+
+        from .utils import SoupLms
+
+        if self._session is None:
+            self.__sign()
+        elif not self._checked:
+            self._checked = True
+
+            soup: bs = SoupLms.get_soup_schedule(
+                session=self._session,
+                language=self.language,
+                cookies=self._session.cookies.get_dict(),
+                proxies=self.proxy,
+                snapshots=self.snapshots
+            )
+
+            if SoupLms.is_auth_from_soup(soup):
+                self.__save()
+            else:
+                self.snapshots.clear()
+                self.__sign()
+
+    @property
+    def parser(self) -> str:
+        """Returns tree builder of the parser backend, it is looked up on the first use
+
+        :return: Tree builder of BeautifulSoup
+        :rtype: str
+        """
+
+        from .utils import SoupLms
+
+        if self._parser is None:
+            self._parser = SoupLms.get_parser(self.parser_backend)
+
+        return self._parser
+
+    @property
+    def snapshots(self) -> "PageSnapshots":
+        """Returns parsed pages shared by getters, they are created on the first use
+
+        :return: Page snapshots
+        :rtype: PageSnapshots
+        """
+
+        from .utils import PageSnapshots
+
+        if self._snapshots is None:
+            self._snapshots = PageSnapshots(self.snapshot_ttl)
+
+        return self._snapshots
+
+    @property
+    def session(self) -> "LmsSession":
+        """Returns session, it is signed in on the first use if the client is lazy,
+        a restored session is checked on the first use and signed again if it has expired
+
+        :return: Session
+        :rtype: LmsSession
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> session = lms.session
+        """
+
+        if self._session is None or not self._checked:
+            self.connect()
+
+        return self._session
 
     def get_type_user(self) -> str:
         """Returns type user
@@ -111,34 +340,18 @@ class LMS:
         'student'
         """
 
+        from .utils import SoupLms
+
         if not self.type_user:
-            soup: bs = SoupLms.get_soup_schedule(
+            soup: bs = SoupLms.get_soup_header(
                 session=self.session,
                 language=self.language,
                 cookies=self.cookies,
-                proxies=self.proxy
+                proxies=self.proxy,
+                snapshots=self.snapshots
             )
 
-            all_roles: bs = soup.find("div", {"class": "drop-menu drop-select small"}).find("ul")
-            
-            drop_menu_label: bs = soup.find("div", {"id": "switch-accounts"}).find("div", {"class": "drop-menu-label"})
-            current_type_user: str = drop_menu_label.find("span", {"class": "title"}).text
-
-            roles: List[Dict[str, str]] = []
-
-            for li in all_roles.find_all("li"):
-                if li.find("b"):
-                    roles.append({"name": li.find("b").text.lower()})
-                elif li.find("a"):
-                    roles[-1]["type"] = li.find("a").text.lower()
-
-            for role in roles:
-                if role["name"] == current_type_user:
-                    self.type_user = role["type"]
-                    break
-
-            if not self.type_user:
-                self.type_user = roles[0]["name"]
+            self.type_user = SoupLms.get_type_user_from_soup(soup)
 
         return self.type_user
 
@@ -177,6 +390,42 @@ class LMS:
 
         self.session.cookies.update(cookies)
 
+    @property
+    def amount_requests(self) -> int:
+        """Returns amount of HTTP requests sent by the current session
+
+        :return: Amount requests
+        :rtype: int
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> amount_requests = lms.amount_requests
+        """
+
+        return self._session.amount_requests if self._session else 0
+
+    @property
+    def metrics(self) -> dict:
+        """Returns metrics of the current session
+
+        :return: Metrics
+        :rtype: dict
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo", parser="html.parser")
+        >>> lms.metrics["parser"]
+        'html.parser'
+        """
+
+        return {
+            "amount_requests": self.amount_requests,
+            "parser": self.parser,
+        }
+
     def verify(self) -> bool:
         """Verify auth
 
@@ -191,6 +440,8 @@ class LMS:
         True
         """
 
+        from .utils import SoupLms
+
         soup: bs = SoupLms.get_soup_schedule(
             session=self.session,
             language=self.language,
@@ -198,7 +449,185 @@ class LMS:
             proxies=self.proxy
         )
 
-        return soup.find("div", {"class": "user-name"}) is not None
+        return SoupLms.is_auth_from_soup(soup)
+
+    def _get_page_size(self, page_size: int = None, watermark: Union[str, Iterable[str]] = None) -> int:
+        """Returns notifications per page: the given size, the size of client, the size of the site for syncs
+        with watermark which usually stop on the first page, or the size the server gave before
+
+        :param page_size: Notifications per page
+        :param watermark: Watermark of sync
+
+        :type page_size: int
+        :type watermark: Union[str, Iterable[str]]
+
+        :return: Notifications per page
+        :rtype: int
+        """
+
+        if page_size:
+            return page_size
+        if self.page_size:
+            return self.page_size
+        if watermark:
+            return PAGE_SIZE_NOTIFY
+
+        return self._page_size_notify if self._page_size_notify else PAGE_SIZE_NOTIFY_PROBE
+
+    def _iter_pages(
+        self,
+        get_soup: Callable[..., "bs"],
+        get_from_soup: Callable[["bs"], list],
+        max_workers: int = None,
+        page_size: int = None,
+    ) -> Iterator[dict]:
+        """Yields rows of all pages in order of pages, the amount of pages is read from the first page
+        and up to max_workers next pages are fetched ahead by threads
+
+        :param get_soup: Method of SoupLms which returns soup of page
+        :param get_from_soup: Method of SoupLms which returns rows from soup
+        :param max_workers: Maximum amount of pages fetched concurrently, max_workers of client if None
+        :param page_size: Rows per page requested from the server, a smaller full first page is the size it gives
+
+        :type get_soup: Callable
+        :type get_from_soup: Callable
+        :type max_workers: int
+        :type page_size: int
+
+        :return: Rows
+        :rtype: Iterator[dict]
+        """
+
+        from concurrent.futures import ThreadPoolExecutor
+        from .utils import SoupLms
+
+        options: dict = {"page_size": page_size} if page_size else {}
+
+        def get_page(page: int) -> list:
+            soup: bs = get_soup(
+                session=self.session,
+                language=self.language,
+                cookies=self.cookies,
+                proxies=self.proxy,
+                page=page,
+                **options
+            )
+            rows: list = get_from_soup(soup)
+            soup.decompose()
+
+            return rows
+
+        soup: bs = get_soup(
+            session=self.session,
+            language=self.language,
+            cookies=self.cookies,
+            proxies=self.proxy,
+            page=1,
+            **options
+        )
+        amount_pages: int = SoupLms.get_amount_pages_from_soup(soup)
+        pages: Iterator[int] = iter(range(2, amount_pages + 1))
+        amount_rows: int = SoupLms.get_amount_rows_from_soup(soup) if page_size and amount_pages > 1 else None
+        rows: list = get_from_soup(soup)
+        soup.decompose()
+
+        if amount_rows and amount_rows < page_size:
+            self._page_size_notify = amount_rows
+
+        yield from rows
+
+        max_workers = max_workers if max_workers else self.max_workers
+
+        if max_workers <= 1:
+            for page in pages:
+                yield from get_page(page)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: deque = deque(
+                executor.submit(copy_context().run, get_page, page) for page in islice(pages, max_workers)
+            )
+
+            try:
+                while futures:
+                    rows = futures.popleft().result()
+                    page: int = next(pages, None)
+
+                    if page is not None:
+                        futures.append(executor.submit(copy_context().run, get_page, page))
+
+                    yield from rows
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @staticmethod
+    def _sync_notify(notify: Iterator[dict], watermark: Union[str, Iterable[str]]) -> dict:
+        """Returns notifications until the first seen one and the new watermark, the rest pages are not fetched
+
+        :param notify: Notifications newest first
+        :param watermark: Key of the newest seen notification or keys of seen notifications
+
+        :type notify: Iterator[dict]
+        :type watermark: Union[str, Iterable[str]]
+
+        :return: New notifications and key of the newest notification
+        :rtype: dict
+        """
+
+        from .utils import SoupLms
+
+        seen: Set[str] = SoupLms.get_seen_keys(watermark)
+        new: list = []
+        newest: str = None
+
+        try:
+            for row in notify:
+                key: str = SoupLms.get_key_notify(row)
+
+                if newest is None:
+                    newest = key
+                if key in seen:
+                    break
+
+                new.append(row)
+        finally:
+            notify.close()
+
+        return {"notify": new, "watermark": newest if newest else watermark}
+
+    def _get_events_discipline(self, discipline: dict) -> dict:
+        """Returns events of discipline, errors are returned instead of raised
+
+        :param discipline: Discipline from get_disciplines
+        :type discipline: dict
+
+        :return: Events of discipline
+        :rtype: dict
+        """
+
+        from .utils import SoupLms
+
+        try:
+            soup: bs = SoupLms.get_soup_events(
+                session=self.session,
+                language=self.language,
+                cookies=self.cookies,
+                proxies=self.proxy,
+                url=discipline["url"]
+            )
+
+            events: dict = SoupLms.get_events_from_soup(soup)
+        except DeadlineExceededError:
+            raise
+        except Exception as error:
+            events: dict = {
+                "current_grade": "-",
+                "events": [],
+                "error": "%s: %s" % (type(error).__name__, error)
+            }
+
+        return {discipline["title"]: events}
 
     def get_name(self) -> str:
         """Returns name
@@ -214,16 +643,17 @@ class LMS:
         'Student Demonstratsionnyiy'
         """
 
-        soup: bs = SoupLms.get_soup_schedule(
+        from .utils import SoupLms
+
+        soup: bs = SoupLms.get_soup_header(
             session=self.session,
             language=self.language,
             cookies=self.cookies,
-            proxies=self.proxy
+            proxies=self.proxy,
+            snapshots=self.snapshots
         )
 
-        name: str = soup.find("div", {"class": "user-name"}).text
-
-        return clean_data.remove_many_spaces(name)
+        return SoupLms.get_name_from_soup(soup)
 
     def get_amount_messages(self) -> int:
         """Returns amount messages
@@ -239,11 +669,14 @@ class LMS:
         0
         """
 
-        soup: bs = SoupLms.get_soup_schedule(
+        from .utils import SoupLms
+
+        soup: bs = SoupLms.get_soup_header(
             session=self.session,
             language=self.language,
             cookies=self.cookies,
-            proxies=self.proxy
+            proxies=self.proxy,
+            snapshots=self.snapshots
         )
 
         return SoupLms.get_amount_messages_from_soup(
@@ -264,11 +697,14 @@ class LMS:
         0
         """
 
-        soup: bs = SoupLms.get_soup_schedule(
+        from .utils import SoupLms
+
+        soup: bs = SoupLms.get_soup_header(
             session=self.session,
             language=self.language,
             cookies=self.cookies,
-            proxies=self.proxy
+            proxies=self.proxy,
+            snapshots=self.snapshots
         )
 
         return SoupLms.get_amount_notify_from_soup(
@@ -290,27 +726,22 @@ class LMS:
         >>> # 0 - if user is teacher and amount unverified work is 0
         """
 
+        from .utils import SoupLms
+
         if self.type_user not in ["teacher", "преподаватель"]:
             raise UserIsNotTeacherError("User is not teacher")
 
-        soup: bs = SoupLms.get_soup_schedule(
+        soup: bs = SoupLms.get_soup_header(
             session=self.session,
             language=self.language,
             cookies=self.cookies,
-            proxies=self.proxy
+            proxies=self.proxy,
+            snapshots=self.snapshots
         )
 
-        titles: dict = {
-            "ru": "Требуют проверки",
-            "en": "Require verification",
-        }
-
-        amount_unverified_work: str = soup.find("a", title=titles[self.language])
-
-        if amount_unverified_work is None:
-            return 0
-
-        return int(clean_data.remove_many_spaces(amount_unverified_work.text))
+        return SoupLms.get_amount_unverified_work_from_soup(
+            soup, self.language
+        )
 
     def get_info(self) -> dict:
         """Returns information about user
@@ -399,39 +830,17 @@ class LMS:
         >>> # }
         """
 
+        from .utils import SoupLms
+
         soup: bs = SoupLms.get_soup_schedule(
             session=self.session,
             language=self.language,
             cookies=self.cookies,
-            proxies=self.proxy
+            proxies=self.proxy,
+            snapshots=self.snapshots
         )
 
-        table: bs = soup.find("table", {"class": "table-list v-scrollable"})
-        shedule: dict = {}
-
-        for tr in table.find("tbody").find_all("tr"):
-            if len(tr.find_all("td")) == 1:
-                return shedule
-            if tr.find("th"):
-                date: str = clean_data.remove_many_spaces(tr.find("th").text)
-                shedule[date] = {}
-            else:
-                time: str = clean_data.remove_many_spaces(tr.find_all("td")[0].text)
-                name: str = clean_data.remove_many_spaces(tr.find_all("td")[1].text)
-                classroom: str = clean_data.remove_many_spaces(
-                    tr.find_all("td")[2].text
-                )
-                type_: str = clean_data.remove_many_spaces(tr.find_all("td")[3].text)
-                teacher: str = clean_data.remove_many_spaces(tr.find_all("td")[4].text)
-
-                shedule[date][time] = {
-                    "name": name,
-                    "classroom": classroom,
-                    "type": type_,
-                    "teacher": teacher,
-                }
-
-        return shedule
+        return SoupLms.get_student_schedule_from_soup(soup)
 
     def _get_teacher_schedule(self) -> dict:
         """Returns schedule for student
@@ -457,41 +866,17 @@ class LMS:
         >>> # }
         """
 
+        from .utils import SoupLms
+
         soup: bs = SoupLms.get_soup_schedule(
             session=self.session,
             language=self.language,
             cookies=self.cookies,
-            proxies=self.proxy
+            proxies=self.proxy,
+            snapshots=self.snapshots
         )
 
-        table: bs = soup.find("table", {"class": "table-list v-scrollable"})
-        shedule: dict = {}
-
-        for tr in table.find("tbody").find_all("tr"):
-            if len(tr.find_all("td")) == 1:
-                return shedule
-            if tr.find("th"):
-                date: str = clean_data.remove_many_spaces(tr.find("th").text)
-                shedule[date] = {}
-            else:
-                time: str = clean_data.remove_many_spaces(tr.find_all("td")[0].text)
-                name: str = clean_data.remove_many_spaces(tr.find_all("td")[1].text)
-                group: str = clean_data.remove_many_spaces(tr.find_all("td")[2].text)
-                classroom: str = clean_data.remove_many_spaces(
-                    tr.find_all("td")[3].text
-                )
-                type_lesson: str = clean_data.remove_many_spaces(
-                    tr.find_all("td")[4].text
-                )
-
-                shedule[date][time] = {
-                    "name": name,
-                    "group": group,
-                    "classroom": classroom,
-                    "type_lesson": type_lesson,
-                }
-
-        return shedule
+        return SoupLms.get_teacher_schedule_from_soup(soup)
 
     def get_news(self) -> list:
         """Returns news
@@ -515,6 +900,8 @@ class LMS:
         >>> # ]
         """
 
+        from .utils import SoupLms
+
         soup: bs = SoupLms.get_soup_news(
             session=self.session,
             language=self.language,
@@ -522,32 +909,7 @@ class LMS:
             proxies=self.proxy
         )
 
-        events_anons: bs = soup.find("div", {"class": "events-list rssNews"})
-
-        news: list = []
-
-        for event_anons in events_anons.find_all("div", {"class": "item"}):
-            title: str = clean_data.remove_many_spaces(
-                event_anons.find("h3").text
-            )
-            description: str = clean_data.remove_many_spaces(
-                event_anons.find("div", {"class": "awrap"}).text
-            )
-            date: str = clean_data.remove_many_spaces(
-                event_anons.find("div", {"class": "meta"}).text
-            )
-            link: str = event_anons.find("a", {"class": "more"})["href"]
-
-            news.append(
-                {
-                    "title": title,
-                    "description": description,
-                    "date": date,
-                    "link": link,
-                }
-            )
-
-        return news
+        return SoupLms.get_news_from_soup(soup)
 
     def get_disciplines(self) -> list:
         """Returns disciplines
@@ -571,6 +933,8 @@ class LMS:
         >>> # ]
         """
 
+        from .utils import SoupLms
+
         soup: bs = SoupLms.get_soup_disciplines(
             session=self.session,
             language=self.language,
@@ -578,42 +942,7 @@ class LMS:
             proxies=self.proxy
         )
 
-        disciplines: list = []
-
-        table = soup.find("tbody", {"class": "expanded"})
-
-        for tr in table.find_all("tr"):
-            if len(tr.find_all("td")) != 5:
-                continue
-            title: str = clean_data.remove_many_spaces(tr.find_all("td")[1].text)
-            typeOfControl: str = clean_data.remove_many_spaces(
-                tr.find_all("td")[2].text
-            )
-            currentScore: str = clean_data.remove_many_spaces(
-                tr.find_all("td")[3].text
-            )
-            if currentScore == "": currentScore = "-"
-
-            finalGrade: str = clean_data.remove_many_spaces(
-                tr.find_all("td")[4].text
-            )
-            if finalGrade == "": finalGrade = "-"
-            
-            url: str = tr.find_all("td")[1].find("a")
-            if url: url = "%s%s" % (URL, url["href"])
-            else: url = "-"
-
-            disciplines.append(
-                {
-                    "title": title,
-                    "typeOfControl": typeOfControl,
-                    "currentScore": currentScore,
-                    "finalGrade": finalGrade,
-                    "url": url
-                }
-            )
-        
-        return disciplines
+        return SoupLms.get_disciplines_from_soup(soup)
 
     def get_pesonal_curators(self) -> list:
         """Returns personal curators
@@ -636,6 +965,8 @@ class LMS:
         >>> # ]
         """
 
+        from .utils import SoupLms
+
         if self.type_user not in ["student", "студент"]:
             raise UserIsNotStudentError("User is not student")
 
@@ -643,41 +974,11 @@ class LMS:
             session=self.session,
             language=self.language,
             cookies=self.cookies,
-            proxies=self.proxy
+            proxies=self.proxy,
+            snapshots=self.snapshots
         )
 
-        curator_main: bs = soup.find("div", {"id": "curatorMain"})
-        curator_list: bs = curator_main.find("ul", {"class": "curatorList"})
-        personal_curators: list = []
-
-        if curator_list is None: return []
-
-        for li in curator_list.find_all("li"):
-            name: str = li.find("span", {"class": "curatorName"}).text
-            phones: list = []
-            emails: list = []
-
-            phone_icons = li.find_all('i', {'class': ['icon-helpdesk']})
-            email_icon = li.find('i', {'class': ['icon-mail']})
-
-            for icon in phone_icons:
-                phone = icon.find_next_sibling(string=True).strip()
-                phones.append(phone)
-
-            if email_icon:
-                email_link = email_icon.find_next_sibling('a')
-                email = email_link.get('href').replace('mailto:', '').strip()
-                emails.append(email)
-
-            personal_curators.append(
-                {
-                    "name": name,
-                    "phones": phones,
-                    "emails": emails
-                }
-            )
-
-        return personal_curators
+        return SoupLms.get_curators_from_soup(soup, "curatorMain")
 
     def get_tutors(self) -> list:
         """Returns tutors
@@ -700,6 +1001,8 @@ class LMS:
         >>> # ]
         """
 
+        from .utils import SoupLms
+
         if self.type_user not in ["student", "студент"]:
             raise UserIsNotStudentError("User is not student")
 
@@ -707,45 +1010,41 @@ class LMS:
             session=self.session,
             language=self.language,
             cookies=self.cookies,
-            proxies=self.proxy
+            proxies=self.proxy,
+            snapshots=self.snapshots
         )
 
-        curator_main: bs = soup.find("div", {"id": "curators"})
-        curator_list: bs = curator_main.find("ul", {"class": "curatorList"})
-        tutors: list = []
+        return SoupLms.get_curators_from_soup(soup, "curators")
 
-        if curator_list is None: return []
+    def iter_notify(self, page_size: int = None) -> Iterator[dict]:
+        """Yields notifications as pages are parsed, stopping early does not fetch the rest pages
 
-        for li in curator_list.find_all("li"):
-            name: str = li.find("span", {"class": "curatorName"}).text
-            phones: list = []
-            emails: list = []
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
 
-            phone_icons = li.find_all('i', {'class': ['icon-helpdesk']})
-            email_icon = li.find('i', {'class': ['icon-mail']})
+        :return: Notifications
+        :rtype: Iterator[dict]
 
-            for icon in phone_icons:
-                phone = icon.find_next_sibling(string=True).strip()
-                phones.append(phone)
+        :Example:
 
-            if email_icon:
-                email_link = email_icon.find_next_sibling('a')
-                email = email_link.get('href').replace('mailto:', '').strip()
-                emails.append(email)
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> for notify in lms.iter_notify():
+        ...     break
+        """
 
-            tutors.append(
-                {
-                    "name": name,
-                    "phones": phones,
-                    "emails": emails
-                }
-            )
+        from .utils import SoupLms
 
-        return tutors
+        return self._iter_pages(
+            SoupLms.get_soup_notify, SoupLms.get_notify_from_soup, page_size=self._get_page_size(page_size)
+        )
 
-    def get_notify(self) -> list:
+    def get_notify(self, page_size: int = None) -> list:
         """Returns notifications
 
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
         :return: Notifications
         :rtype: list
 
@@ -766,48 +1065,69 @@ class LMS:
         >>> # ]
         """
 
-        amount_pages: int = SoupLms.get_amount_pages_notify(
-            self.session, self.language, self.cookies, self.proxy
+        return list(self.iter_notify(page_size))
+
+    def sync_notify(self, watermark: Union[str, Iterable[str]] = None, page_size: int = None) -> dict:
+        """Returns notifications newer than watermark and the new watermark,
+        pages are read newest first and reading stops at the first seen notification
+
+        :param watermark: Key of the newest seen notification or keys of seen notifications, all are new if None
+        :param page_size: Notifications per page, the size of the site if None and watermark is given
+
+        :type watermark: Union[str, Iterable[str]]
+        :type page_size: int
+
+        :return: New notifications in order of pages and key of the newest notification
+        :rtype: dict
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> sync = lms.sync_notify()
+        >>> sync = lms.sync_notify(sync["watermark"])
+        >>> sync["notify"]
+        []
+        """
+
+        from .utils import SoupLms
+
+        notify: Iterator[dict] = self._iter_pages(
+            SoupLms.get_soup_notify, SoupLms.get_notify_from_soup, 1 if watermark else None,
+            self._get_page_size(page_size, watermark)
         )
-        notify: list = []
 
-        for page in range(1, amount_pages):
-            soup: bs = SoupLms.get_soup_notify(
-                session=self.session,
-                language=self.language,
-                cookies=self.cookies,
-                proxies=self.proxy,
-                page=page
-            )
+        return self._sync_notify(notify, watermark)
 
-            table: bs = soup.find("table", {"class": "table-list dataTable"})
-
-            for tr in table.find("tbody").find_all("tr"):
-                if len(tr.find_all("td")) == 1:
-                    return notify
-                if tr.find_all("td")[4].text[-1] == "0":
-                    continue
-                discipline: str = tr.find_all("td")[0].text
-                teacher: str = tr.find_all("td")[1].text
-                event: str = tr.find_all("td")[2].text
-                current_score: str = tr.find_all("td")[3].text
-                message: str = tr.find_all("td")[4].text
-
-                notify.append(
-                    {
-                        "discipline": discipline,
-                        "teacher": teacher,
-                        "event": event,
-                        "current_score": current_score,
-                        "message": message
-                    }
-                )
-
-        return notify
-
-    def get_notify_archive(self) -> list:
+    def iter_notify_archive(self, page_size: int = None) -> Iterator[dict]:
+        """Yields notifications archive as pages are parsed, stopping early does not fetch the rest pages
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications archive
+        :rtype: Iterator[dict]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> for notify in lms.iter_notify_archive():
+        ...     break
+        """
+
+        from .utils import SoupLms
+
+        return self._iter_pages(
+            SoupLms.get_soup_notify_archive, SoupLms.get_notify_from_soup, page_size=self._get_page_size(page_size)
+        )
+
+    def get_notify_archive(self, page_size: int = None) -> list:
         """Returns notifications archive
 
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
         :return: Notifications archive
         :rtype: list
 
@@ -828,44 +1148,63 @@ class LMS:
         >>> # ]
         """
 
-        amount_pages: int = SoupLms.get_amount_pages_notify_archive(
-            self.session, self.language, self.cookies, self.proxy
+        return list(self.iter_notify_archive(page_size))
+
+    def sync_notify_archive(self, watermark: Union[str, Iterable[str]] = None, page_size: int = None) -> dict:
+        """Returns notifications archive newer than watermark and the new watermark,
+        pages are read newest first and reading stops at the first seen notification
+
+        :param watermark: Key of the newest seen notification or keys of seen notifications, all are new if None
+        :param page_size: Notifications per page, the size of the site if None and watermark is given
+
+        :type watermark: Union[str, Iterable[str]]
+        :type page_size: int
+
+        :return: New notifications archive in order of pages and key of the newest notification
+        :rtype: dict
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> sync = lms.sync_notify_archive()
+        >>> sync = lms.sync_notify_archive(sync["watermark"])
+        >>> sync["notify"]
+        []
+        """
+
+        from .utils import SoupLms
+
+        notify: Iterator[dict] = self._iter_pages(
+            SoupLms.get_soup_notify_archive, SoupLms.get_notify_from_soup, 1 if watermark else None,
+            self._get_page_size(page_size, watermark)
         )
-        notify_archive: list = []
 
-        for page in range(1, amount_pages):
-            soup: bs = SoupLms.get_soup_notify_archive(
-                session=self.session,
-                language=self.language,
-                cookies=self.cookies,
-                proxies=self.proxy,
-                page=page
-            )
+        return self._sync_notify(notify, watermark)
+
+    def iter_unread_messages(self) -> Iterator[dict]:
+        """Yields unread messages as pages are parsed, stopping early does not fetch the rest pages
+
+        :return: Unread messages
+        :rtype: Iterator[dict]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> for message in lms.iter_unread_messages():
+        ...     break
+        """
+
+        from .utils import SoupLms
+
+        for soup in SoupLms.iter_soup_messages_unread(
+            self.session, self.language, self.cookies, self.proxy
+        ):
+            messages: list = SoupLms.get_unread_messages_from_soup(soup)
+            soup.decompose()
 
-            table: bs = soup.find("table", {"class": "table-list dataTable"})
-
-            for tr in table.find("tbody").find_all("tr"):
-                if len(tr.find_all("td")) == 1:
-                    return notify_archive
-                if tr.find_all("td")[4].text[-1] == "0":
-                    continue
-                discipline: str = tr.find_all("td")[0].text
-                teacher: str = tr.find_all("td")[1].text
-                event: str = tr.find_all("td")[2].text
-                current_score: str = tr.find_all("td")[3].text
-                message: str = tr.find_all("td")[4].text
-
-                notify_archive.append(
-                    {
-                        "discipline": discipline,
-                        "teacher": teacher,
-                        "event": event,
-                        "current_score": current_score,
-                        "message": message
-                    }
-                )
-
-        return notify_archive
+            yield from messages
 
     def get_unread_messages(self) -> list:
         """Returns unread messages
@@ -889,49 +1228,35 @@ class LMS:
         >>> # ]
         """
 
-        messages: list = []
+        return list(self.iter_unread_messages())
 
-        amount_pages: int = SoupLms.get_amount_pages_messages_unread(
-            self.session, self.language, self.cookies, self.proxy
-        )
+    def iter_marks(self) -> Iterator[dict]:
+        """Yields marks, the journal page is freed before the first mark
+
+        :return: Marks
+        :rtype: Iterator[dict]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> for mark in lms.iter_marks():
+        ...     break
+        """
 
-        if amount_pages < 1:
-            return messages
+        from .utils import SoupLms
 
-        for page in range(1, amount_pages):
-            soup: bs = SoupLms.get_soup_messages_unread(
+        soup: bs = SoupLms.get_soup_journal(
                 session=self.session,
                 language=self.language,
                 cookies=self.cookies,
                 proxies=self.proxy,
-                page=page
-            )
+        )
+        marks: list = SoupLms.get_marks_from_soup(soup)
+        soup.decompose()
+
+        yield from marks
 
-            table: bs = soup.find("table", {"class", "dataTable decorateTable table-list"})
-
-            for tr in table.find("tbody").find_all("tr"):
-                sender_name: str = clean_data.remove_many_spaces(
-                    tr.find_all("td")[1].text
-                )
-                subject: str = clean_data.remove_many_spaces(
-                    tr.find_all("td")[2].text
-                )
-                url: str = "%s%s" % (URL, tr.find_all("td")[2].find("a")["href"])
-                date: str = clean_data.remove_many_spaces(
-                    tr.find_all("td")[4].text
-                )
-
-                messages.append(
-                    {
-                        "sender_name": sender_name,
-                        "subject": subject,
-                        "date": date,
-                        "url": url
-                    }
-                )
-
-        return messages
-    
     def get_marks(self) -> list:
         """Returns marks
 
@@ -957,42 +1282,8 @@ class LMS:
         >>> # ]
         """
 
-        soup: bs = SoupLms.get_soup_journal(
-                session=self.session,
-                language=self.language,
-                cookies=self.cookies,
-                proxies=self.proxy,
-        )
-        
-        table: bs = soup.find("table", {"class": "table-list dataTable"})
-        marks: list = []
+        return list(self.iter_marks())
 
-        for tr in table.find_all("tr", {"id": "entryId"}):
-            if len(tr.find_all("td")) == 1:
-                return marks
-            else:
-                discipline: str = clean_data.remove_many_spaces(tr.find_all("td")[0].text)
-                type_discipline: str = clean_data.remove_many_spaces(tr.find_all("td")[1].text)
-                teacher: str = clean_data.remove_many_spaces(tr.find_all("td")[2].text)
-                date_discipline: str = clean_data.remove_many_spaces(tr.find_all("td")[3].text)
-                time_discipline: str = clean_data.remove_many_spaces(tr.find_all("td")[4].text)
-                mark: str = clean_data.remove_many_spaces(tr.find_all("td")[5].text)
-                hours: str = clean_data.remove_many_spaces(tr.find_all("td")[6].text)
-
-                marks.append(
-                    {
-                        "discipline": discipline,
-                        "type_discipline": type_discipline,
-                        "teacher": teacher,
-                        "date_discipline": date_discipline,
-                        "time_discipline": time_discipline,
-                        "mark": mark,
-                        "hours": hours
-                    }
-                )
-
-        return marks
-    
     def get_events(self):
         """Returns event
 
@@ -1021,55 +1312,219 @@ class LMS:
         >>> #       },
         >>> #   },       
         >>> # ]
+        >>> # a discipline whose page failed to load or parse is returned as
+        >>> # {"discipline": {"current_grade": "-", "events": [], "error": "Error"}}
         """
 
-        disciplines = self.get_disciplines()
-        info_disciplines = []
+        from concurrent.futures import ThreadPoolExecutor
 
-        for discipline in disciplines:
-            if discipline["url"] == "-":
-                continue
-            soup: bs = SoupLms.get_soup_events(
-                session=self.session,
-                language=self.language,
-                cookies=self.cookies,
-                proxies=self.proxy,
-                url=discipline["url"]
-            )
+        disciplines: list = [
+            discipline for discipline in self.get_disciplines() if discipline["url"] != "-"
+        ]
 
-            table: bs = soup.find("table", {"class": "table-list"})
-            events: list = []
-
-            for tr in table.find("tbody").find_all("tr"):
-                if len(tr.find_all("td")) == 1:
-                    continue
-                name: str = clean_data.remove_many_spaces(tr.find_all("td")[0].text)
-                access: str = clean_data.remove_many_spaces(tr.find_all("td")[1].text)
-                max_grade: str = clean_data.remove_many_spaces(tr.find_all("td")[2].text)
-                result: str = clean_data.remove_many_spaces(tr.find_all("td")[3].text)
-                if result == "": result = "-"
-                url: str = tr.find_all("td")[0].find("a")
-                if url: url = "%s%s" % (URL, url["href"])
-                else: url = "-"
-
-                events.append(
-                    {
-                        "name": name,
-                        "access": access,
-                        "max_grade": max_grade,
-                        "result": result,
-                        "url": url
-                    }
-                )
-            
-            current_grade = table.find("tfoot").find_all("td")
-
-            info_disciplines.append(
-                {
-                    discipline["title"]: {
-                        "current_grade": clean_data.remove_many_spaces(current_grade[-1].text), 
-                        "events": events
-                    },
-                }
-            )
-        return info_disciplines
+        if self.max_workers > 1 and len(disciplines) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures: list = [
+                    executor.submit(copy_context().run, self._get_events_discipline, discipline)
+                    for discipline in disciplines
+                ]
+
+                return [future.result() for future in futures]
+
+        return [self._get_events_discipline(discipline) for discipline in disciplines]
+
+    def get_schedule_records(self) -> List[Lesson]:
+        """Returns schedule as lessons as records
+
+        :return: Lessons
+        :rtype: List[Lesson]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> lessons = lms.get_schedule_records()
+        >>> # lessons[0].name, lessons[0].to_dict()
+        """
+
+        return get_lessons_from_schedule(self.get_schedule())
+
+    def get_disciplines_records(self) -> List[Discipline]:
+        """Returns disciplines as records
+
+        :return: Disciplines
+        :rtype: List[Discipline]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> disciplines = lms.get_disciplines_records()
+        >>> # disciplines[0].title, disciplines[0].to_dict()
+        """
+
+        return get_records_from_rows(Discipline, self.get_disciplines())
+
+    def get_pesonal_curators_records(self) -> List[Curator]:
+        """Returns personal curators as records
+
+        :return: Personal curators
+        :rtype: List[Curator]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> curators = lms.get_pesonal_curators_records()
+        >>> # curators[0].phones, curators[0].to_dict()
+        """
+
+        return get_curators_from_rows(self.get_pesonal_curators())
+
+    def get_tutors_records(self) -> List[Curator]:
+        """Returns tutors as records
+
+        :return: Tutors
+        :rtype: List[Curator]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> tutors = lms.get_tutors_records()
+        >>> # tutors[0].emails, tutors[0].to_dict()
+        """
+
+        return get_curators_from_rows(self.get_tutors())
+
+    def get_notify_records(self, page_size: int = None) -> List[Notification]:
+        """Returns notifications as records
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications
+        :rtype: List[Notification]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> notify = lms.get_notify_records()
+        >>> # notify[0].message, notify[0].to_dict()
+        """
+
+        return get_records_from_rows(Notification, self.iter_notify(page_size))
+
+    def get_notify_archive_records(self, page_size: int = None) -> List[Notification]:
+        """Returns notifications archive as records
+
+        :param page_size: Notifications per page, the size of client or the size the server gives if None
+        :type page_size: int
+
+        :return: Notifications archive
+        :rtype: List[Notification]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> notify_archive = lms.get_notify_archive_records()
+        >>> # notify_archive[0].message, notify_archive[0].to_dict()
+        """
+
+        return get_records_from_rows(Notification, self.iter_notify_archive(page_size))
+
+    def get_unread_messages_records(self) -> List[Message]:
+        """Returns unread messages as records
+
+        :return: Unread messages
+        :rtype: List[Message]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> messages = lms.get_unread_messages_records()
+        >>> # messages[0].subject, messages[0].to_dict()
+        """
+
+        return get_records_from_rows(Message, self.iter_unread_messages())
+
+    def get_marks_records(self) -> List[Mark]:
+        """Returns marks as records
+
+        :return: Marks
+        :rtype: List[Mark]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> marks = lms.get_marks_records()
+        >>> # marks[0].mark, marks[0].to_dict()
+        """
+
+        return get_records_from_rows(Mark, self.iter_marks())
+
+    def get_events_records(self) -> List[Event]:
+        """Returns events of all disciplines as records, a discipline whose page failed has no events
+
+        :return: Events
+        :rtype: List[Event]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS
+        >>> lms = LMS(login="demo", password="demo")
+        >>> events = lms.get_events_records()
+        >>> # events[0].max_grade, events[0].to_dict()
+        """
+
+        return get_events_from_disciplines(self.get_events())
+
+    def sync_mirror(self, mirror: "Mirror", datasets: Tuple[str, ...] = MIRROR_DATASETS) -> dict:
+        """Sync datasets of account to local mirror, notifications are fetched only until the saved ones
+
+        :param mirror: Mirror
+        :param datasets: Datasets: marks, notify, notify_archive, unread_messages, events, schedule
+
+        :type mirror: Mirror
+        :type datasets: Tuple[str, ...]
+
+        :return: Amount of synced rows of every dataset
+        :rtype: dict
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS, Mirror
+        >>> lms = LMS(login="demo", password="demo")
+        >>> mirror = Mirror()
+        >>> amounts = lms.sync_mirror(mirror, ("marks", "schedule"))
+        """
+
+        for dataset in datasets:
+            if dataset not in MIRROR_DATASETS:
+                raise DatasetNotFoundError("No such dataset %s" % dataset)
+
+        amounts: dict = {}
+
+        for dataset in datasets:
+            if dataset == "marks":
+                amounts[dataset] = mirror.upsert_marks(self.login, self.get_marks())
+            elif dataset in ("notify", "notify_archive"):
+                archive: bool = dataset == "notify_archive"
+                sync: Callable[..., dict] = self.sync_notify_archive if archive else self.sync_notify
+                notify: list = sync(mirror.get_keys_notify(self.login, archive))["notify"]
+                amounts[dataset] = mirror.upsert_notify(self.login, notify, archive)
+            elif dataset == "unread_messages":
+                amounts[dataset] = mirror.upsert_unread_messages(self.login, self.get_unread_messages())
+            elif dataset == "events":
+                amounts[dataset] = mirror.upsert_events(self.login, self.get_events())
+            elif dataset == "schedule":
+                amounts[dataset] = mirror.upsert_schedule(self.login, self.get_schedule())
+
+        return amounts
+
+
+tracing.trace_methods(limits.bound_methods(LMS))
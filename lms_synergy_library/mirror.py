@@ -0,0 +1,503 @@
+import sqlite3
+from threading import Event, Lock, Thread
+from time import time
+from typing import Dict, Iterable, List, Set, Tuple
+from .utils import SoupLms
+from .constants import MIRROR_DATASETS
+
+
+TABLES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "marks": (
+        ("discipline", "TEXT"),
+        ("type_discipline", "TEXT"),
+        ("teacher", "TEXT"),
+        ("date_discipline", "TEXT"),
+        ("time_discipline", "TEXT"),
+        ("mark", "TEXT"),
+        ("hours", "TEXT"),
+    ),
+    "notify": (
+        ("archive", "INTEGER"),
+        ("discipline", "TEXT"),
+        ("teacher", "TEXT"),
+        ("event", "TEXT"),
+        ("current_score", "TEXT"),
+        ("message", "TEXT"),
+    ),
+    "messages": (
+        ("sender_name", "TEXT"),
+        ("subject", "TEXT"),
+        ("date", "TEXT"),
+        ("url", "TEXT"),
+    ),
+    "events": (
+        ("discipline", "TEXT"),
+        ("name", "TEXT"),
+        ("access", "TEXT"),
+        ("max_grade", "TEXT"),
+        ("result", "TEXT"),
+        ("url", "TEXT"),
+    ),
+    "grades": (
+        ("discipline", "TEXT"),
+        ("current_grade", "TEXT"),
+    ),
+    "schedule": (
+        ("date", "TEXT"),
+        ("time", "TEXT"),
+        ("name", "TEXT"),
+        ("classroom", "TEXT"),
+        ("type", "TEXT"),
+        ("teacher", "TEXT"),
+        ("group", "TEXT"),
+    ),
+}
+
+# columns after login of primary keys, a notification may be both in the list and in the archive
+PRIMARY_KEYS: Dict[str, Tuple[str, ...]] = {
+    "notify": ("archive", "key"),
+}
+
+INDEXES: Dict[str, Tuple[str, ...]] = {
+    "marks": ("discipline", "date_discipline", "teacher"),
+    "notify": ("discipline", "teacher"),
+    "messages": ("sender_name", "date"),
+    "events": ("discipline",),
+    "schedule": ("date", "name", "teacher"),
+}
+
+
+class Mirror:
+    """Local SQLite copy of marks, notifications, unread messages, events and schedule of accounts"""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Init mirror
+
+        :param path: Path of database
+        :type path: str
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS, Mirror
+        >>> mirror = Mirror()
+        >>> lms = LMS(login="demo", password="demo")
+        >>> amounts = lms.sync_mirror(mirror)
+        >>> marks = mirror.get_marks("demo", discipline="Mathematics")
+        """
+
+        self.path = path
+        self.errors: Dict[str, str] = {}
+        self._lock: Lock = Lock()
+        self._stop: Event = Event()
+        self._thread: Thread = None
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._connection:
+            for table, columns in TABLES.items():
+                self._connection.execute(
+                    'CREATE TABLE IF NOT EXISTS %s (login TEXT NOT NULL, key TEXT NOT NULL, %s, '
+                    'synced REAL NOT NULL, PRIMARY KEY (login, %s))'
+                    % (
+                        table, ", ".join('"%s" %s' % column for column in columns),
+                        ", ".join(PRIMARY_KEYS.get(table, ("key",)))
+                    )
+                )
+
+            for table, columns in INDEXES.items():
+                for column in columns:
+                    self._connection.execute(
+                        'CREATE INDEX IF NOT EXISTS %s_%s ON %s (login, "%s")' % (table, column, table, column)
+                    )
+
+    def _upsert(self, table: str, login: str, rows: Iterable[Tuple[str, dict]], synced: float) -> int:
+        columns: Tuple[str, ...] = tuple(name for name, _ in TABLES[table])
+        values: List[tuple] = [
+            (login, key, *(row[column] for column in columns), synced) for key, row in rows
+        ]
+
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO %s (login, key, %s, synced) VALUES (?, ?, %s, ?)'
+            % (table, ", ".join('"%s"' % column for column in columns), ", ".join("?" * len(columns))),
+            values,
+        )
+
+        return len(values)
+
+    def _prune(self, table: str, login: str, synced: float, kept: Dict[str, Iterable[str]] = None, **filters) -> None:
+        kept = {column: tuple(values) for column, values in (kept or {}).items() if values}
+        where: str = "".join(' AND "%s" = ?' % column for column in filters) + "".join(
+            ' AND "%s" NOT IN (%s)' % (column, ", ".join("?" * len(values))) for column, values in kept.items()
+        )
+
+        self._connection.execute(
+            "DELETE FROM %s WHERE login = ? AND synced < ?%s" % (table, where),
+            (login, synced, *filters.values(), *(value for values in kept.values() for value in values)),
+        )
+
+    def _select(self, table: str, login: str, columns: Tuple[str, ...], order: str = "rowid", **filters) -> List[dict]:
+        filters = {column: value for column, value in filters.items() if value is not None}
+        where: str = "".join(' AND "%s" = ?' % column for column in filters)
+
+        with self._lock:
+            rows: list = self._connection.execute(
+                'SELECT %s FROM %s WHERE login = ?%s ORDER BY %s'
+                % (", ".join('"%s"' % column for column in columns), table, where, order),
+                (login, *filters.values()),
+            ).fetchall()
+
+        return [dict(zip(columns, row)) for row in rows]
+
+    def upsert_marks(self, login: str, marks: List[dict]) -> int:
+        """Replace marks of account, marks which are no longer on the server are dropped
+
+        :param login: Login
+        :param marks: Marks from get_marks
+
+        :type login: str
+        :type marks: List[dict]
+
+        :return: Amount of marks
+        :rtype: int
+        """
+
+        synced: float = time()
+
+        with self._lock, self._connection:
+            amount: int = self._upsert(
+                "marks", login, ((SoupLms.get_key_from_row(mark), mark) for mark in marks), synced
+            )
+            self._prune("marks", login, synced)
+
+        return amount
+
+    def upsert_notify(self, login: str, notify: List[dict], archive: bool = False) -> int:
+        """Add new notifications of account, notifications are kept after they leave the server,
+        the same notification in the list and in the archive is kept as two rows
+
+        :param login: Login
+        :param notify: Notifications from get_notify or sync_notify
+        :param archive: True if notifications are from the archive
+
+        :type login: str
+        :type notify: List[dict]
+        :type archive: bool
+
+        :return: Amount of notifications
+        :rtype: int
+        """
+
+        rows: Iterable[Tuple[str, dict]] = (
+            (SoupLms.get_key_notify(row), {**row, "archive": int(archive)}) for row in notify
+        )
+
+        with self._lock, self._connection:
+            return self._upsert("notify", login, rows, time())
+
+    def upsert_unread_messages(self, login: str, messages: List[dict]) -> int:
+        """Replace unread messages of account, messages which have been read are dropped
+
+        :param login: Login
+        :param messages: Unread messages from get_unread_messages
+
+        :type login: str
+        :type messages: List[dict]
+
+        :return: Amount of messages
+        :rtype: int
+        """
+
+        synced: float = time()
+
+        with self._lock, self._connection:
+            amount: int = self._upsert(
+                "messages", login, ((SoupLms.get_key_from_row(message), message) for message in messages), synced
+            )
+            self._prune("messages", login, synced)
+
+        return amount
+
+    def upsert_events(self, login: str, events: List[dict]) -> int:
+        """Replace events of disciplines of account, disciplines which failed to load keep their previous events
+        and grades, disciplines which are no longer on the server are dropped
+
+        :param login: Login
+        :param events: Events from get_events
+
+        :type login: str
+        :type events: List[dict]
+
+        :return: Amount of events
+        :rtype: int
+        """
+
+        synced: float = time()
+        amount: int = 0
+        failed: Set[str] = set()
+
+        with self._lock, self._connection:
+            for discipline_events in events:
+                for discipline, events_discipline in discipline_events.items():
+                    if "error" in events_discipline:
+                        failed.add(discipline)
+                        continue
+
+                    rows: List[dict] = [{**event, "discipline": discipline} for event in events_discipline["events"]]
+                    amount += self._upsert(
+                        "events", login, ((SoupLms.get_key_from_row(row), row) for row in rows), synced
+                    )
+                    self._upsert(
+                        "grades", login,
+                        [(discipline, {"discipline": discipline, "current_grade": events_discipline["current_grade"]})],
+                        synced
+                    )
+
+            self._prune("events", login, synced, {"discipline": failed})
+            self._prune("grades", login, synced, {"discipline": failed})
+
+        return amount
+
+    def upsert_schedule(self, login: str, schedule: dict) -> int:
+        """Replace schedule of account, lessons which are no longer on the server are dropped
+
+        :param login: Login
+        :param schedule: Schedule from get_schedule
+
+        :type login: str
+        :type schedule: dict
+
+        :return: Amount of lessons
+        :rtype: int
+        """
+
+        rows: List[dict] = [
+            {
+                "date": date,
+                "time": time_lesson,
+                "name": lesson["name"],
+                "classroom": lesson["classroom"],
+                "type": lesson.get("type", lesson.get("type_lesson")),
+                "teacher": lesson.get("teacher", "-"),
+                "group": lesson.get("group", "-"),
+            }
+            for date, lessons in schedule.items()
+            for time_lesson, lesson in lessons.items()
+        ]
+        synced: float = time()
+
+        with self._lock, self._connection:
+            amount: int = self._upsert(
+                "schedule", login, ((SoupLms.get_key_from_row(row), row) for row in rows), synced
+            )
+            self._prune("schedule", login, synced)
+
+        return amount
+
+    def get_keys_notify(self, login: str, archive: bool = False) -> Set[str]:
+        """Returns keys of saved notifications of account, a watermark for sync_notify
+
+        :param login: Login
+        :param archive: True for notifications archive
+
+        :type login: str
+        :type archive: bool
+
+        :return: Keys
+        :rtype: Set[str]
+        """
+
+        with self._lock:
+            rows: list = self._connection.execute(
+                "SELECT key FROM notify WHERE login = ? AND archive = ?", (login, int(archive))
+            ).fetchall()
+
+        return {row[0] for row in rows}
+
+    def get_marks(self, login: str, discipline: str = None, teacher: str = None, date: str = None) -> List[dict]:
+        """Returns saved marks of account
+
+        :param login: Login
+        :param discipline: Discipline, any if None
+        :param teacher: Teacher, any if None
+        :param date: Date of lesson, any if None
+
+        :type login: str
+        :type discipline: str
+        :type teacher: str
+        :type date: str
+
+        :return: Marks
+        :rtype: List[dict]
+
+        :Example:
+
+        >>> from lms_synergy_library import Mirror
+        >>> mirror = Mirror()
+        >>> marks = mirror.get_marks("demo", teacher="Teacher Demonstratsionnyiy")
+        """
+
+        return self._select(
+            "marks", login, tuple(name for name, _ in TABLES["marks"]),
+            discipline=discipline, teacher=teacher, date_discipline=date
+        )
+
+    def get_notify(
+        self, login: str, archive: bool = False, discipline: str = None, teacher: str = None
+    ) -> List[dict]:
+        """Returns saved notifications of account, newest first
+
+        :param login: Login
+        :param archive: True for notifications archive
+        :param discipline: Discipline, any if None
+        :param teacher: Teacher, any if None
+
+        :type login: str
+        :type archive: bool
+        :type discipline: str
+        :type teacher: str
+
+        :return: Notifications
+        :rtype: List[dict]
+        """
+
+        return self._select(
+            "notify", login, tuple(name for name, _ in TABLES["notify"][1:]), "synced DESC, rowid",
+            archive=int(archive), discipline=discipline, teacher=teacher
+        )
+
+    def get_unread_messages(self, login: str, sender_name: str = None, date: str = None) -> List[dict]:
+        """Returns saved unread messages of account
+
+        :param login: Login
+        :param sender_name: Sender, any if None
+        :param date: Date, any if None
+
+        :type login: str
+        :type sender_name: str
+        :type date: str
+
+        :return: Unread messages
+        :rtype: List[dict]
+        """
+
+        return self._select(
+            "messages", login, tuple(name for name, _ in TABLES["messages"]), sender_name=sender_name, date=date
+        )
+
+    def get_events(self, login: str, discipline: str = None) -> List[dict]:
+        """Returns saved events of account, each with its discipline
+
+        :param login: Login
+        :param discipline: Discipline, any if None
+
+        :type login: str
+        :type discipline: str
+
+        :return: Events
+        :rtype: List[dict]
+        """
+
+        return self._select(
+            "events", login, tuple(name for name, _ in TABLES["events"]), discipline=discipline
+        )
+
+    def get_current_grades(self, login: str) -> Dict[str, str]:
+        """Returns saved current grades of disciplines of account
+
+        :param login: Login
+        :type login: str
+
+        :return: Current grade by discipline
+        :rtype: Dict[str, str]
+        """
+
+        return {
+            row["discipline"]: row["current_grade"]
+            for row in self._select("grades", login, ("discipline", "current_grade"))
+        }
+
+    def get_schedule(self, login: str, date: str = None, discipline: str = None, teacher: str = None) -> List[dict]:
+        """Returns saved lessons of account, a teacher's lessons have group instead of teacher
+
+        :param login: Login
+        :param date: Date as in get_schedule, any if None
+        :param discipline: Name of lesson, any if None
+        :param teacher: Teacher, any if None
+
+        :type login: str
+        :type date: str
+        :type discipline: str
+        :type teacher: str
+
+        :return: Lessons
+        :rtype: List[dict]
+        """
+
+        return self._select(
+            "schedule", login, tuple(name for name, _ in TABLES["schedule"]),
+            date=date, name=discipline, teacher=teacher
+        )
+
+    def _run(self, clients: tuple, interval: float, datasets: Tuple[str, ...]) -> None:
+        while True:
+            for client in clients:
+                try:
+                    client.sync_mirror(self, datasets)
+                    self.errors.pop(client.login, None)
+                except Exception as error:
+                    self.errors[client.login] = "%s: %s" % (type(error).__name__, error)
+
+            if self._stop.wait(interval):
+                return
+
+    def start(self, *clients, interval: float = 300.0, datasets: Tuple[str, ...] = MIRROR_DATASETS) -> None:
+        """Start syncing clients in a background thread every interval seconds,
+        the error of the last sync of every login is kept in errors
+
+        :param clients: Clients LMS
+        :param interval: Seconds between syncs
+        :param datasets: Datasets to sync
+
+        :type clients: LMS
+        :type interval: float
+        :type datasets: Tuple[str, ...]
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS, Mirror
+        >>> mirror = Mirror()
+        >>> mirror.start(LMS(login="demo", password="demo"), interval=600)
+        >>> mirror.stop()
+        """
+
+        self.stop()
+        self._stop.clear()
+        self._thread = Thread(target=self._run, args=(clients, interval, datasets), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background sync
+
+        :return: None
+        :rtype: None
+        """
+
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop background sync and close database
+
+        :return: None
+        :rtype: None
+        """
+
+        self.stop()
+        self._connection.close()
@@ -0,0 +1,222 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+from requests.adapters import HTTPAdapter
+from .lms_synergy_library import LMS
+from .limits import TokenBucket
+from .exceptions import PasswordMismatchError
+
+
+class LMSPool:
+    """Many accounts served over one shared connection pool with bounded concurrency"""
+
+    def __init__(
+        self, max_workers: int = 16, pool_maxsize: int = None, total_rate_limit: float = None, **options
+    ) -> None:
+        """Init pool
+
+        :param max_workers: Maximum amount of accounts served concurrently
+        :param pool_maxsize: Maximum amount of connections to the server, max_workers if None
+        :param total_rate_limit: Maximum requests per second of all accounts together, unlimited if None
+        :param options: Options of LMS for every account, pages of one account are fetched one by one by default
+
+        :type max_workers: int
+        :type pool_maxsize: int
+        :type total_rate_limit: float
+        :type options: dict
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMSPool
+        >>> pool = LMSPool(max_workers=8)
+        >>> results = pool.map("get_name", [("demo", "demo")])
+        >>> results[0]["result"]
+        'Student Demonstratsionnyiy'
+        """
+
+        self.max_workers = max_workers
+        self.options: dict = {"max_workers": 1, **options}
+        if total_rate_limit:
+            self.options["limiter"] = TokenBucket(total_rate_limit)
+        self.adapter = HTTPAdapter(pool_maxsize=pool_maxsize if pool_maxsize else max_workers, pool_block=True)
+        self.clients: Dict[str, LMS] = {}
+        self._lock: Lock = Lock()
+        self._login_locks: Dict[str, Lock] = {}
+
+    def __enter__(self) -> "LMSPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_client(self, login: str, password: str) -> LMS:
+        """Returns client of account, the account is logged in on the first call
+
+        :param login: Login
+        :param password: Password
+
+        :type login: str
+        :type password: str
+
+        :return: Client
+        :rtype: LMS
+
+        :raises PasswordMismatchError: The client of login was built with another password, release() it first
+        """
+
+        with self._lock:
+            client: LMS = self.clients.get(login)
+            if client is None:
+                login_lock: Lock = self._login_locks.setdefault(login, Lock())
+
+        if client is None:
+            # one client of account is built and signed in, other threads of the same login wait for it
+            with login_lock:
+                with self._lock:
+                    client = self.clients.get(login)
+
+                if client is None:
+                    try:
+                        client = LMS(login=login, password=password, adapter=self.adapter, **self.options)
+                    except Exception:
+                        with self._lock:
+                            if self._login_locks.get(login) is login_lock:
+                                del self._login_locks[login]
+                        raise
+
+                    with self._lock:
+                        self.clients[login] = client
+
+        if client.password != password:
+            raise PasswordMismatchError("Client of %s is signed in with another password" % login)
+
+        return client
+
+    def run(self, function: Callable[[LMS], object], accounts: Iterable[Tuple[str, str]]) -> List[dict]:
+        """Returns results of function for clients of accounts, errors are returned instead of raised,
+        up to max_workers accounts are read from accounts ahead
+
+        :param function: Function which takes client
+        :param accounts: Logins and passwords
+
+        :type function: Callable
+        :type accounts: Iterable[Tuple[str, str]]
+
+        :return: Login, result and error of every account in order of accounts
+        :rtype: List[dict]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMSPool
+        >>> pool = LMSPool()
+        >>> results = pool.run(lambda client: (client.get_name(), len(client.get_marks())), [("demo", "demo")])
+        >>> results[0]["error"]
+        """
+
+        def call(account: Tuple[str, str]) -> dict:
+            login, password = account
+
+            try:
+                return {"login": login, "result": function(self.get_client(login, password)), "error": None}
+            except Exception as error:
+                return {"login": login, "result": None, "error": "%s: %s" % (type(error).__name__, error)}
+
+        indexed: Iterator[Tuple[int, Tuple[str, str]]] = enumerate(accounts)
+        results: Dict[int, dict] = {}
+        pending: Dict[Future, int] = {}
+
+        # accounts are read and submitted as workers free up, not all at once
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                for index, account in islice(indexed, self.max_workers - len(pending)):
+                    pending[executor.submit(call, account)] = index
+
+                if not pending:
+                    return [results[index] for index in range(len(results))]
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+
+    def connect(self, accounts: Iterable[Tuple[str, str]]) -> List[dict]:
+        """Logs in accounts which are not logged in yet
+
+        :param accounts: Logins and passwords
+        :type accounts: Iterable[Tuple[str, str]]
+
+        :return: Login, type of user and error of every account
+        :rtype: List[dict]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMSPool
+        >>> pool = LMSPool()
+        >>> pool.connect([("demo", "demo")])
+        [{'login': 'demo', 'result': 'student', 'error': None}]
+        """
+
+        return self.run(lambda client: client.get_type_user(), accounts)
+
+    def map(self, method: str, accounts: Iterable[Tuple[str, str]], *args, **kwargs) -> List[dict]:
+        """Calls method of LMS for every account
+
+        :param method: Name of public method of LMS
+        :param accounts: Logins and passwords
+        :param args: Arguments of method
+        :param kwargs: Keyword arguments of method
+
+        :type method: str
+        :type accounts: Iterable[Tuple[str, str]]
+
+        :return: Login, result and error of every account in order of accounts
+        :rtype: List[dict]
+
+        :Example:
+
+        >>> from lms_synergy_library import LMSPool
+        >>> pool = LMSPool()
+        >>> marks = pool.map("get_marks", [("demo", "demo")])
+        """
+
+        if method.startswith("_") or not callable(getattr(LMS, method, None)):
+            raise AttributeError("LMS has no method %s" % method)
+
+        return self.run(lambda client: getattr(client, method)(*args, **kwargs), accounts)
+
+    def release(self, login: str) -> None:
+        """Close session of account and forget its client, the account is logged in again on the next call
+
+        :param login: Login
+        :type login: str
+
+        :return: None
+        :rtype: None
+        """
+
+        with self._lock:
+            client: LMS = self.clients.pop(login, None)
+            self._login_locks.pop(login, None)
+
+        if client is not None:
+            client.close()
+
+    def close(self) -> None:
+        """Close sessions of all accounts and the connection pool
+
+        :return: None
+        :rtype: None
+        """
+
+        with self._lock:
+            clients: list = list(self.clients.values())
+            self.clients.clear()
+            self._login_locks.clear()
+
+        for client in clients:
+            client.close()
+
+        self.adapter.close()
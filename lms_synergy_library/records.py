@@ -0,0 +1,185 @@
+"""Compact records of the typed getters, *_records methods of LMS and AsyncLMS
+
+A record is a named tuple: fields are read by name and it has no per-record dict of keys.
+to_dict() returns the row of the plain getter for marks, notifications, messages, disciplines and curators.
+Nested getters are flattened: an Event adds discipline and current_grade of its discipline, a Lesson adds
+date and time of the schedule and keeps type_lesson of teachers as type. Values which repeat across records
+of one call, such as disciplines, teachers and dates, are shared, so the records hold one string of each.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Tuple
+
+
+def _to_dict(record: tuple) -> dict:
+    return dict(zip(record._fields, record))
+
+
+class Mark(NamedTuple):
+    discipline: str
+    type_discipline: str
+    teacher: str
+    date_discipline: str
+    time_discipline: str
+    mark: str
+    hours: str
+
+    to_dict = _to_dict
+
+
+class Notification(NamedTuple):
+    discipline: str
+    teacher: str
+    event: str
+    current_score: str
+    message: str
+
+    to_dict = _to_dict
+
+
+class Message(NamedTuple):
+    sender_name: str
+    subject: str
+    date: str
+    url: str
+
+    to_dict = _to_dict
+
+
+class Discipline(NamedTuple):
+    title: str
+    typeOfControl: str
+    currentScore: str
+    finalGrade: str
+    url: str
+
+    to_dict = _to_dict
+
+
+class Curator(NamedTuple):
+    name: str
+    phones: Tuple[str, ...]
+    emails: Tuple[str, ...]
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "phones": list(self.phones), "emails": list(self.emails)}
+
+
+class Event(NamedTuple):
+    """Event of discipline with the current grade of the discipline"""
+
+    discipline: str
+    current_grade: str
+    name: str
+    access: str
+    max_grade: str
+    result: str
+    url: str
+
+    to_dict = _to_dict
+
+
+class Lesson(NamedTuple):
+    """Lesson of schedule, teacher is set for students and group for teachers"""
+
+    date: str
+    time: str
+    name: str
+    classroom: str
+    type: str
+    teacher: str = None
+    group: str = None
+
+    def to_dict(self) -> dict:
+        return {name: value for name, value in zip(self._fields, self) if value is not None}
+
+
+# fields of records whose values repeat across records and are shared
+REPEATED: Dict[type, FrozenSet[str]] = {
+    Mark: frozenset(Mark._fields),
+    Notification: frozenset(("discipline", "teacher", "event", "current_score")),
+    Message: frozenset(("sender_name", "date")),
+    Discipline: frozenset(("typeOfControl", "currentScore", "finalGrade")),
+    Event: frozenset(("discipline", "current_grade", "access", "max_grade", "result")),
+    Lesson: frozenset(Lesson._fields),
+}
+
+
+def get_records_from_rows(record: type, rows: Iterable[dict]) -> list:
+    """Returns records from rows of plain getter, equal values of repeated fields become one string
+
+    :param record: Type of record
+    :param rows: Rows
+
+    :type record: type
+    :type rows: Iterable[dict]
+
+    :return: Records
+    :rtype: list
+    """
+
+    fields: Tuple[str, ...] = record._fields
+    repeated: FrozenSet[str] = REPEATED.get(record, frozenset())
+    values: Dict[str, str] = {}
+    records: list = []
+
+    for row in rows:
+        record_values: list = []
+
+        for name in fields:
+            value: str = row.get(name)
+            if value is not None and name in repeated:
+                value = values.setdefault(value, value)
+            record_values.append(value)
+
+        records.append(record._make(record_values))
+
+    return records
+
+
+def get_curators_from_rows(curators: List[dict]) -> List[Curator]:
+    """Returns records of curators from get_pesonal_curators or get_tutors
+
+    :param curators: Curators
+    :type curators: List[dict]
+
+    :return: Curators
+    :rtype: List[Curator]
+    """
+
+    return [Curator(curator["name"], tuple(curator["phones"]), tuple(curator["emails"])) for curator in curators]
+
+
+def get_events_from_disciplines(disciplines: List[Dict[str, dict]]) -> List[Event]:
+    """Returns records of events from get_events, disciplines whose page failed have no events,
+    their errors are reported by get_events
+
+    :param disciplines: Events by title of discipline
+    :type disciplines: List[Dict[str, dict]]
+
+    :return: Events
+    :rtype: List[Event]
+    """
+
+    return get_records_from_rows(Event, (
+        {"discipline": title, "current_grade": events["current_grade"], **event}
+        for discipline in disciplines
+        for title, events in discipline.items()
+        for event in events["events"]
+    ))
+
+
+def get_lessons_from_schedule(schedule: Dict[str, Dict[str, dict]]) -> List[Lesson]:
+    """Returns records of lessons from get_schedule of student or teacher
+
+    :param schedule: Lessons by time by date
+    :type schedule: Dict[str, Dict[str, dict]]
+
+    :return: Lessons
+    :rtype: List[Lesson]
+    """
+
+    return get_records_from_rows(Lesson, (
+        {"date": date, "time": time, "type": lesson.get("type", lesson.get("type_lesson")), **lesson}
+        for date, lessons in schedule.items()
+        for time, lesson in lessons.items()
+    ))
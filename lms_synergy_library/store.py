@@ -0,0 +1,226 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from threading import Lock
+from time import time
+
+
+# iterations of PBKDF2 of credentials, a few milliseconds per login
+CREDENTIALS_ITERATIONS: int = 10000
+
+
+def hash_credentials(login: str, password: str, salt: str = None) -> str:
+    """Returns salted hash of credentials which is saved with the session instead of the password
+
+    :param login: Login
+    :param password: Password
+    :param salt: Salt in hex, a new random salt if None
+
+    :type login: str
+    :type password: str
+    :type salt: str
+
+    :return: Salt and hash in hex joined by $
+    :rtype: str
+    """
+
+    from hashlib import pbkdf2_hmac
+
+    salt = salt if salt else os.urandom(16).hex()
+    digest: bytes = pbkdf2_hmac(
+        "sha256", ("%s\0%s" % (login, password)).encode("utf-8"), bytes.fromhex(salt), CREDENTIALS_ITERATIONS
+    )
+
+    return "%s$%s" % (salt, digest.hex())
+
+
+def check_credentials(state: dict, login: str, password: str) -> bool:
+    """Returns True if saved state of session belongs to login and password
+
+    :param state: State of session
+    :param login: Login
+    :param password: Password
+
+    :type state: dict
+    :type login: str
+    :type password: str
+
+    :return: True or False
+    :rtype: bool
+    """
+
+    from hmac import compare_digest
+
+    credentials: str = state.get("credentials") or ""
+    salt: str = credentials.partition("$")[0]
+
+    try:
+        return bool(salt) and compare_digest(credentials, hash_credentials(login, password, salt))
+    except ValueError:
+        return False
+
+
+def _create_private(path: str) -> None:
+    """Creates empty file readable and writable only by owner if it does not exist"""
+
+    try:
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+    except FileExistsError:
+        pass
+
+
+class SessionStore(ABC):
+    """Saved sessions of accounts: cookies, language, type of user, user agent and hash of credentials by login,
+    a saved session is restored only for the same password, files of stores are readable only by owner
+    """
+
+    @abstractmethod
+    def load(self, login: str) -> dict:
+        """Returns saved state of session or None
+
+        :param login: Login
+        :type login: str
+
+        :return: State of session
+        :rtype: dict
+        """
+
+    @abstractmethod
+    def save(self, login: str, state: dict) -> None:
+        """Save state of session
+
+        :param login: Login
+        :param state: State of session
+
+        :type login: str
+        :type state: dict
+
+        :return: None
+        :rtype: None
+        """
+
+    @abstractmethod
+    def delete(self, login: str) -> None:
+        """Drop saved state of session
+
+        :param login: Login
+        :type login: str
+
+        :return: None
+        :rtype: None
+        """
+
+
+class FileSessionStore(SessionStore):
+    """Sessions saved in a JSON file readable only by owner, the file is replaced atomically on every save"""
+
+    def __init__(self, path: str) -> None:
+        """Init file session store
+
+        :param path: Path of JSON file
+        :type path: str
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS, FileSessionStore
+        >>> lms = LMS(login="demo", password="demo", store=FileSessionStore("sessions.json"))
+        """
+
+        self.path = path
+        self._lock: Lock = Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, states: dict) -> None:
+        path: str = "%s.%d.tmp" % (self.path, os.getpid())
+
+        with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as file:
+            json.dump(states, file)
+
+        os.replace(path, self.path)
+
+    def load(self, login: str) -> dict:
+        with self._lock:
+            return self._read().get(login)
+
+    def save(self, login: str, state: dict) -> None:
+        with self._lock:
+            states: dict = self._read()
+            states[login] = state
+            self._write(states)
+
+    def delete(self, login: str) -> None:
+        with self._lock:
+            states: dict = self._read()
+
+            if states.pop(login, None) is not None:
+                self._write(states)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions saved in a SQLite database readable only by owner"""
+
+    def __init__(self, path: str) -> None:
+        """Init SQLite session store
+
+        :param path: Path of database
+        :type path: str
+
+        :return: None
+        :rtype: None
+
+        :Example:
+
+        >>> from lms_synergy_library import LMS, SQLiteSessionStore
+        >>> lms = LMS(login="demo", password="demo", store=SQLiteSessionStore("sessions.db"))
+        """
+
+        self.path = path
+        self._lock: Lock = Lock()
+        if path != ":memory:":
+            _create_private(path)
+        import sqlite3
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions "
+                "(login TEXT PRIMARY KEY, state TEXT NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def load(self, login: str) -> dict:
+        with self._lock:
+            row: tuple = self._connection.execute(
+                "SELECT state FROM sessions WHERE login = ?", (login,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def save(self, login: str, state: dict) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sessions (login, state, updated) VALUES (?, ?, ?)",
+                (login, json.dumps(state), time()),
+            )
+
+    def delete(self, login: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM sessions WHERE login = ?", (login,))
+
+    def close(self) -> None:
+        """Close database
+
+        :return: None
+        :rtype: None
+        """
+
+        self._connection.close()
@@ -0,0 +1,397 @@
+"""Spans of API calls, HTTP requests, parsing and extraction, delivered to subscribers
+
+Nothing is measured while there are no subscribers, every hook is a single check of the list.
+
+    >>> from lms_synergy_library import LMS, tracing
+    >>> metrics = tracing.Metrics()
+    >>> tracing.subscribe(metrics)
+    >>> lms = LMS(login="demo", password="demo")
+    >>> marks = lms.get_marks()
+    >>> metrics.snapshot()["get_marks"]["requests"]
+    1
+    >>> tracing.unsubscribe(metrics)
+"""
+
+import json
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction
+from itertools import count
+from threading import Lock
+from time import perf_counter, time
+from types import AsyncGeneratorType, GeneratorType
+from typing import Callable, Dict, List, Tuple
+
+
+subscribers: list = []
+
+COUNTERS: Tuple[str, ...] = ("requests", "bytes", "network_ms", "parse_ms", "extract_ms")
+
+_current: ContextVar = ContextVar("lms_synergy_library_span", default=None)
+_ids = count(1)
+
+
+def subscribe(subscriber) -> None:
+    """Deliver every finished span to subscriber.on_span(span)
+
+    :param subscriber: Object with method on_span
+    :type subscriber: object
+
+    :return: None
+    :rtype: None
+    """
+
+    if subscriber not in subscribers:
+        subscribers.append(subscriber)
+
+
+def unsubscribe(subscriber) -> None:
+    """Stop delivering spans to subscriber
+
+    :param subscriber: Subscriber
+    :type subscriber: object
+
+    :return: None
+    :rtype: None
+    """
+
+    if subscriber in subscribers:
+        subscribers.remove(subscriber)
+
+
+class Span:
+    """Timed operation: call of API, HTTP request, parse or extract. Counters of a span include
+    requests, bytes and time of network, parsing and extraction of all nested spans"""
+
+    __slots__ = (
+        "name", "kind", "span_id", "trace_id", "parent", "attributes", "counters",
+        "start", "duration_ms", "error", "_started", "_token", "_lock",
+    )
+
+    def __init__(self, name: str, kind: str = "call", **attributes) -> None:
+        self.name = name
+        self.kind = kind
+        self.parent: Span = _current.get()
+        self.span_id: int = next(_ids)
+        self.trace_id: int = self.parent.trace_id if self.parent else self.span_id
+        self.attributes: dict = attributes
+        self.counters: Dict[str, float] = dict.fromkeys(COUNTERS, 0)
+        self.start: float = time()
+        self.duration_ms: float = None
+        self.error: str = None
+        self._started: float = perf_counter()
+        self._token = None
+        self._lock: Lock = Lock()
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _current.reset(self._token)
+        self.finish(exc_value)
+
+    def add(self, counters: Dict[str, float]) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                self.counters[name] += value
+
+    def finish(self, error: BaseException = None) -> None:
+        """Stop timer, add counters to enclosing spans and deliver span to subscribers
+
+        :param error: Error raised inside span
+        :type error: BaseException
+
+        :return: None
+        :rtype: None
+        """
+
+        self.duration_ms = (perf_counter() - self._started) * 1000
+        if error is not None:
+            self.error = "%s: %s" % (type(error).__name__, error)
+
+        counters: Dict[str, float] = {}
+        if self.kind == "http":
+            counters = {"requests": 1, "bytes": self.attributes.get("bytes", 0), "network_ms": self.duration_ms}
+        elif self.kind == "parse":
+            counters = {"parse_ms": self.duration_ms}
+        elif self.kind == "extract":
+            counters = {"extract_ms": self.duration_ms}
+
+        if counters:
+            self.add(counters)
+            parent: Span = self.parent
+            while parent is not None:
+                parent.add(counters)
+                parent = parent.parent
+
+        for subscriber in list(subscribers):
+            subscriber.on_span(self)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "start": self.start,
+            "duration_ms": round(self.duration_ms, 4) if self.duration_ms is not None else None,
+            "error": self.error,
+            "attributes": self.attributes,
+            "counters": {name: round(value, 4) for name, value in self.counters.items()},
+        }
+
+
+def _iterate(span: Span, iterator):
+    """Yields items of iterator inside span, the span ends with the iterator"""
+
+    error: BaseException = None
+
+    try:
+        while True:
+            token = _current.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _current.reset(token)
+            yield item
+    except BaseException as exception:
+        error = exception if not isinstance(exception, GeneratorExit) else None
+        raise
+    finally:
+        iterator.close()
+        span.finish(error)
+
+
+async def _aiterate(span: Span, iterator):
+    """Yields items of async iterator inside span, the span ends with the iterator"""
+
+    error: BaseException = None
+
+    try:
+        while True:
+            token = _current.set(span)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _current.reset(token)
+            yield item
+    except BaseException as exception:
+        error = exception if not isinstance(exception, GeneratorExit) else None
+        raise
+    finally:
+        await iterator.aclose()
+        span.finish(error)
+
+
+def traced(function: Callable) -> Callable:
+    """Runs every call of method of API in a span named after the method, generators are traced until exhausted
+
+    :param function: Method
+    :type function: Callable
+
+    :return: Traced method
+    :rtype: Callable
+    """
+
+    if isasyncgenfunction(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not subscribers:
+                return function(*args, **kwargs)
+            return _aiterate(Span(function.__name__), function(*args, **kwargs))
+
+    elif iscoroutinefunction(function):
+        @wraps(function)
+        async def wrapper(*args, **kwargs):
+            if not subscribers:
+                return await function(*args, **kwargs)
+            with Span(function.__name__):
+                return await function(*args, **kwargs)
+
+    else:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not subscribers:
+                return function(*args, **kwargs)
+
+            span: Span = Span(function.__name__)
+            token = _current.set(span)
+
+            try:
+                result = function(*args, **kwargs)
+            except BaseException as error:
+                span.finish(error)
+                raise
+            finally:
+                _current.reset(token)
+
+            if isinstance(result, GeneratorType):
+                return _iterate(span, result)
+            if isinstance(result, AsyncGeneratorType):
+                return _aiterate(span, result)
+
+            span.finish()
+
+            return result
+
+    return wrapper
+
+
+def extracted(function: Callable) -> Callable:
+    """Runs every call of extraction from soup in a span of kind extract
+
+    :param function: Function
+    :type function: Callable
+
+    :return: Traced function
+    :rtype: Callable
+    """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not subscribers:
+            return function(*args, **kwargs)
+        with Span(function.__name__, "extract"):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def trace_methods(cls: type) -> type:
+    """Traces public methods of class, properties are left as they are
+
+    :param cls: Class
+    :type cls: type
+
+    :return: Class
+    :rtype: type
+    """
+
+    for name, value in list(vars(cls).items()):
+        if not name.startswith("_") and callable(value) and not isinstance(value, (type, staticmethod, classmethod)):
+            setattr(cls, name, traced(value))
+
+    return cls
+
+
+class Histogram:
+    """Counts of values in buckets with bounds in milliseconds"""
+
+    BOUNDS: Tuple[float, ...] = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    __slots__ = ("buckets", "count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = [0] * (len(self.BOUNDS) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.min: float = None
+        self.max: float = None
+
+    def observe(self, value: float) -> None:
+        index: int = 0
+        while index < len(self.BOUNDS) and value > self.BOUNDS[index]:
+            index += 1
+
+        self.buckets[index] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 4),
+            "min": self.min,
+            "max": self.max,
+            "buckets": dict(zip([str(bound) for bound in self.BOUNDS] + ["inf"], self.buckets)),
+        }
+
+
+class Metrics:
+    """In-process counters and histograms of calls of API by name, and of HTTP requests, parsing and extraction"""
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._counters: Dict[str, Dict[str, float]] = {}
+        self._histograms: Dict[str, Dict[str, Histogram]] = {}
+
+    def on_span(self, span: Span) -> None:
+        key: str = span.name if span.kind == "call" else span.kind
+
+        with self._lock:
+            counters: Dict[str, float] = self._counters.get(key)
+            if counters is None:
+                counters = self._counters[key] = dict.fromkeys(("calls", "errors") + COUNTERS, 0)
+                self._histograms[key] = {"duration_ms": Histogram()}
+
+            counters["calls"] += 1
+            counters["errors"] += span.error is not None
+            for name, value in span.counters.items():
+                counters[name] += value
+
+            self._histograms[key]["duration_ms"].observe(span.duration_ms)
+
+    def snapshot(self) -> dict:
+        """Returns counters and histogram of duration of every call of API and kind of operation
+
+        :return: Metrics by name of call or kind: http, parse, extract
+        :rtype: dict
+        """
+
+        with self._lock:
+            return {
+                key: {
+                    **{name: round(value, 4) for name, value in counters.items()},
+                    **{name: histogram.to_dict() for name, histogram in self._histograms[key].items()},
+                }
+                for key, counters in self._counters.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+class JsonLinesExporter:
+    """Writes every finished span as a line of JSON to a file"""
+
+    def __init__(self, path: str, kinds: Tuple[str, ...] = ("call", "http", "parse", "extract")) -> None:
+        """Init exporter
+
+        :param path: Path of file, lines are appended
+        :param kinds: Kinds of exported spans
+
+        :type path: str
+        :type kinds: Tuple[str, ...]
+
+        :return: None
+        :rtype: None
+        """
+
+        self.path = path
+        self.kinds = kinds
+        self._lock: Lock = Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def on_span(self, span: Span) -> None:
+        if span.kind not in self.kinds:
+            return
+
+        line: str = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
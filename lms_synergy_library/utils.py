@@ -1,8 +1,19 @@
+import warnings
+from hashlib import sha1
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple, Union
 from requests import Response, Session
-from bs4 import BeautifulSoup as bs
+from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError, ContentDecodingError
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup as bs, SoupStrainer, Tag
+from bs4.builder import builder_registry
 from .constants import URL_EDUCATION, URL_NEWS, URL_SCHEDULE, URLS_LANGUAGES, URL_NOTIFY,\
-     URL_NOTIFY_ARCHIVE, URL_MESSAGES_UNREAD, URL, URL_JOURNAL
-from .exceptions import PageNotExist
+     URL_NOTIFY_ARCHIVE, URL_MESSAGES_UNREAD, URL, URL_JOURNAL, PARSERS, TIMEOUT,\
+     PAGE_SIZE_NOTIFY
+from .exceptions import PageNotExist, ParserNotFoundError, ServerError
+from .limits import TokenBucket, RetryPolicy, check_deadline, get_content_length, get_timeout
+from . import tracing
 
 
 class clean_data:
@@ -10,81 +21,648 @@ class clean_data:
     def remove_many_spaces(string):
         return " ".join(string.split())
 
+class Column:
+    """Column of table: index of cell, name of field, normalizer of text or extraction of link"""
+
+    __slots__ = ("index", "name", "normalize", "default", "link")
+
+    def __init__(
+        self,
+        index: int,
+        name: str,
+        normalize: Callable[[str], str] = clean_data.remove_many_spaces,
+        default: str = None,
+        link: bool = False,
+    ) -> None:
+        """Init column
+
+        :param index: Index of cell in row
+        :param name: Name of field
+        :param normalize: Normalizer of text of cell
+        :param default: Value of field if normalized text is empty
+        :param link: Field is the absolute url of the first link of cell, default if cell has no link
+
+        :type index: int
+        :type name: str
+        :type normalize: Callable
+        :type default: str
+        :type link: bool
+
+        :return: None
+        :rtype: None
+        """
+
+        self.index = index
+        self.name = name
+        self.normalize = normalize
+        self.default = default
+        self.link = link
+
+    def compile(self) -> Callable[[Tag], str]:
+        """Returns function which returns value of field from cell
+
+        :return: Function
+        :rtype: Callable
+        """
+
+        normalize: Callable[[str], str] = self.normalize
+        default: str = self.default
+
+        if self.link:
+            def get_value(cell: Tag) -> str:
+                link: Tag = cell.find("a")
+
+                return "%s%s" % (URL, link["href"]) if link else default
+        elif default is None:
+            def get_value(cell: Tag) -> str:
+                return normalize(cell.text)
+        else:
+            def get_value(cell: Tag) -> str:
+                return normalize(cell.text) or default
+
+        return get_value
+
+
+class TableSchema:
+    """Columns of table compiled into a single pass over cells of row"""
+
+    def __init__(self, *columns: Column) -> None:
+        """Init table schema
+
+        :param columns: Columns in order of fields of record
+        :type columns: Column
+
+        :return: None
+        :rtype: None
+        """
+
+        self.columns: Tuple[Column, ...] = columns
+        self._fields: tuple = tuple(
+            (column.name, column.index, column.compile()) for column in columns
+        )
+
+    def extract(self, cells: list) -> dict:
+        """Returns record from cells of row
+
+        :param cells: Cells of row
+        :type cells: list
+
+        :return: Record
+        :rtype: dict
+        """
+
+        return {name: get_value(cells[index]) for name, index, get_value in self._fields}
+
+
+SCHEMA_STUDENT_SCHEDULE: TableSchema = TableSchema(
+    Column(0, "time"),
+    Column(1, "name"),
+    Column(2, "classroom"),
+    Column(3, "type"),
+    Column(4, "teacher"),
+)
+SCHEMA_TEACHER_SCHEDULE: TableSchema = TableSchema(
+    Column(0, "time"),
+    Column(1, "name"),
+    Column(2, "group"),
+    Column(3, "classroom"),
+    Column(4, "type_lesson"),
+)
+SCHEMA_DISCIPLINES: TableSchema = TableSchema(
+    Column(1, "title"),
+    Column(2, "typeOfControl"),
+    Column(3, "currentScore", default="-"),
+    Column(4, "finalGrade", default="-"),
+    Column(1, "url", link=True, default="-"),
+)
+SCHEMA_NOTIFY: TableSchema = TableSchema(
+    Column(0, "discipline", str),
+    Column(1, "teacher", str),
+    Column(2, "event", str),
+    Column(3, "current_score", str),
+    Column(4, "message", str),
+)
+SCHEMA_MESSAGES_UNREAD: TableSchema = TableSchema(
+    Column(1, "sender_name"),
+    Column(2, "subject"),
+    Column(4, "date"),
+    Column(2, "url", link=True),
+)
+SCHEMA_MARKS: TableSchema = TableSchema(
+    Column(0, "discipline"),
+    Column(1, "type_discipline"),
+    Column(2, "teacher"),
+    Column(3, "date_discipline"),
+    Column(4, "time_discipline"),
+    Column(5, "mark"),
+    Column(6, "hours"),
+)
+SCHEMA_EVENTS: TableSchema = TableSchema(
+    Column(0, "name"),
+    Column(1, "access"),
+    Column(2, "max_grade"),
+    Column(3, "result", default="-"),
+    Column(0, "url", link=True, default="-"),
+)
+
+class PageSnapshots:
+    """Parsed pages shared by getters within a freshness window"""
+
+    def __init__(self, ttl: float = 5.0) -> None:
+        """Init page snapshots
+
+        :param ttl: Freshness window in seconds, 0 disables snapshots
+        :type ttl: float
+
+        :return: None
+        :rtype: None
+        """
+
+        self.ttl = ttl
+        self._pages: dict = {}
+
+    def get(self, url: str, language: str) -> bs:
+        """Returns fresh snapshot of page or None
+
+        :param url: Url
+        :param language: Language
+
+        :type url: str
+        :type language: str
+
+        :return: Soup page
+        :rtype: bs4.BeautifulSoup
+        """
+
+        snapshot: tuple = self._pages.get((url, language))
+
+        if snapshot is None or monotonic() - snapshot[0] > self.ttl:
+            return None
+
+        return snapshot[1]
+
+    def put(self, url: str, language: str, soup: bs) -> None:
+        """Save snapshot of page
+
+        :param url: Url
+        :param language: Language
+        :param soup: Soup page
+
+        :type url: str
+        :type language: str
+        :type soup: bs4.BeautifulSoup
+
+        :return: None
+        :rtype: None
+        """
+
+        if self.ttl > 0:
+            self._pages[(url, language)] = (monotonic(), soup)
+
+    def clear(self) -> None:
+        """Drop all snapshots
+
+        :return: None
+        :rtype: None
+        """
+
+        self._pages.clear()
+
+class LmsSession(Session):
+    """Session which remembers the language of the server session and counts requests"""
+
+    language: str = None
+    parser: str = "html.parser"
+    amount_requests: int = 0
+
+    def __init__(
+        self,
+        parser: str = "html.parser",
+        adapter: HTTPAdapter = None,
+        limiters: Tuple[TokenBucket, ...] = (),
+        retry: RetryPolicy = None,
+        timeout: Union[float, Tuple[float, float]] = TIMEOUT,
+    ) -> None:
+        """Init session
+
+        :param parser: Tree builder of BeautifulSoup used for pages of the session
+        :param adapter: Adapter with connection pool shared between sessions, the session owns its own if None
+        :param limiters: Rate limiters every request waits for, e.g. of the account and of all accounts
+        :param retry: Retry policy of a request, error pages are returned as they are if None
+        :param timeout: Timeout of every request, seconds or seconds of connect and read
+
+        :type parser: str
+        :type adapter: requests.adapters.HTTPAdapter
+        :type limiters: Tuple[TokenBucket, ...]
+        :type retry: RetryPolicy
+        :type timeout: Union[float, Tuple[float, float]]
+
+        :return: None
+        :rtype: None
+        """
+
+        super().__init__()
+        self.parser = parser
+        self.limiters = limiters
+        self.retry = retry
+        self.timeout = timeout
+        self._lock: Lock = Lock()
+        self._shared_adapter: HTTPAdapter = adapter
+
+        if adapter is not None:
+            self.mount("https://", adapter)
+            self.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close adapters owned by the session, a shared adapter stays open
+
+        :return: None
+        :rtype: None
+        """
+
+        for adapter in self.adapters.values():
+            if adapter is not self._shared_adapter:
+                adapter.close()
+
+    def request(self, method: str, url: str, *args, **kwargs) -> Response:
+        """Sends request after rate limiters allow it, retries idempotent requests by the retry policy
+        and counts every attempt, timeouts are shortened to the deadline of the current call
+
+        :param method: Method
+        :param url: Url
+
+        :type method: str
+        :type url: str
+
+        :return: Response
+        :rtype: requests.Response
+
+        :raises ServerError: Error page or connection error after the last attempt
+        :raises DeadlineExceededError: The deadline of the current call is over
+        """
+
+        timeout: Union[float, Tuple[float, float]] = kwargs.pop("timeout", self.timeout)
+        attempts: int = self.retry.get_attempts(method) if self.retry else 1
+        attempt: int = 0
+
+        while True:
+            for limiter in self.limiters:
+                delay: float = limiter.reserve()
+                if delay > 0:
+                    check_deadline(delay)
+                    sleep(delay)
+
+            try:
+                response: Response = self._send(method, url, *args, timeout=get_timeout(timeout), **kwargs)
+            except (ConnectionError, Timeout, ChunkedEncodingError, ContentDecodingError) as error:
+                check_deadline()
+                if self.retry is None:
+                    raise
+                if attempt + 1 >= attempts:
+                    raise ServerError("%s %s: %s" % (method.upper(), url, error)) from error
+                delay = self.retry.get_delay(attempt)
+            else:
+                if self.retry is None:
+                    return response
+
+                page_error: str = self.retry.get_error(
+                    response.status_code, response.headers.get("Content-Type"), response.content[-512:],
+                    get_content_length(response.headers), len(response.content)
+                )
+                if page_error is None:
+                    return response
+                if attempt + 1 >= attempts:
+                    raise ServerError("%s %s: %s" % (method.upper(), url, page_error))
+                delay = self.retry.get_delay(attempt, response.headers.get("Retry-After"))
+
+            attempt += 1
+            check_deadline(delay)
+            sleep(delay)
+
+    def _send(self, method: str, url: str, *args, **kwargs) -> Response:
+        with self._lock:
+            self.amount_requests += 1
+
+        if not tracing.subscribers:
+            return super().request(method, url, *args, **kwargs)
+
+        with tracing.Span(method.upper(), "http", url=url) as span:
+            response: Response = super().request(method, url, *args, **kwargs)
+            span.attributes["status"] = response.status_code
+            span.attributes["bytes"] = len(response.content)
+
+        return response
+
+class Fragment(SoupStrainer):
+    """Tags of a page which are parsed, everything outside them is skipped
+
+    A tag is described by name, None matches any name, and attributes.
+    A class attribute matches tags which have all of its classes,
+    True matches any value of an attribute.
+    """
+
+    def __init__(self, *tags: Tuple[str, dict]) -> None:
+        """Init fragment
+
+        :param tags: Names and attributes of tags
+        :type tags: Tuple[str, dict]
+
+        :return: None
+        :rtype: None
+        """
+
+        super().__init__()
+        self.tags: tuple = tags
+
+    @staticmethod
+    def _match_attr(key: str, expected, value) -> bool:
+        if value is None:
+            return False
+        if expected is True:
+            return True
+        if isinstance(value, list):
+            value = " ".join(value)
+        if key == "class":
+            return set(expected.split()) <= set(value.split())
+        return value == expected
+
+    def match_tag(self, name: str, attrs: dict) -> bool:
+        """Returns True if tag belongs to fragment
+
+        :param name: Name of tag
+        :param attrs: Attributes of tag
+
+        :type name: str
+        :type attrs: dict
+
+        :return: True or False
+        :rtype: bool
+        """
+
+        attrs = attrs if attrs else {}
+
+        for tag_name, tag_attrs in self.tags:
+            if tag_name is not None and tag_name != name:
+                continue
+            if all(self._match_attr(key, expected, attrs.get(key)) for key, expected in tag_attrs.items()):
+                return True
+
+        return False
+
+    def allow_tag_creation(self, nsprefix: str, name: str, attrs: dict) -> bool:
+        return self.match_tag(name, attrs)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+    def search_tag(self, markup_name: str = None, markup_attrs: dict = None):
+        # BeautifulSoup before 4.13 asks search_tag while parsing
+        return markup_name if self.match_tag(markup_name, markup_attrs) else None
+
+    @property
+    def excludes_everything(self) -> bool:
+        return not self.tags
+
+
+FRAGMENT_HEADER: Fragment = Fragment(
+    ("div", {"class": "user-name"}),
+    ("div", {"id": "switch-accounts"}),
+    ("div", {"class": "drop-menu drop-select small"}),
+    ("a", {"title": True}),
+)
+FRAGMENT_NEWS: Fragment = Fragment(("div", {"class": "events-list rssNews"}))
+FRAGMENT_DISCIPLINES: Fragment = Fragment(("tbody", {"class": "expanded"}))
+FRAGMENT_NOTIFY: Fragment = Fragment(
+    ("table", {"class": "table-list dataTable"}),
+    (None, {"class": "paginator"}),
+)
+FRAGMENT_MESSAGES_UNREAD: Fragment = Fragment(
+    ("table", {"class": "dataTable decorateTable table-list"}),
+    (None, {"class": "paginator"}),
+    ("a", {"title": True}),
+)
+FRAGMENT_JOURNAL: Fragment = Fragment(("table", {"class": "table-list dataTable"}))
+FRAGMENT_EVENTS: Fragment = Fragment(("table", {"class": "table-list"}))
+
 class SoupLms:
     @staticmethod
-    def get_soup_schedule(session: Session, language: str, cookies: dict, proxies: dict) -> bs:
+    def get_parser(parser: str) -> str:
+        """Returns first installed tree builder of parser backend
+
+        :param parser: Parser backend, one of PARSERS
+        :type parser: str
+
+        :return: Tree builder of BeautifulSoup
+        :rtype: str
+        """
+
+        if parser not in PARSERS:
+            raise ParserNotFoundError("No such parser %s" % parser)
+
+        for builder in PARSERS[parser]:
+            if builder_registry.lookup(builder) is not None:
+                return builder
+
+    @staticmethod
+    def make_soup(session: Session, markup: str, fragment: Fragment = None) -> bs:
+        """Returns soup of markup built by parser of session
+
+        :param session: Session
+        :param markup: Markup
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
+
+        :type session: Session
+        :type markup: str
+        :type fragment: Fragment
+
+        :return: Soup
+        :rtype: bs4.BeautifulSoup
+        """
+
+        parser: str = getattr(session, "parser", "html.parser")
+
+        if not tracing.subscribers:
+            return bs(markup, parser, parse_only=fragment)
+
+        with tracing.Span("make_soup", "parse", parser=parser, bytes=len(markup), fragment=fragment is not None):
+            return bs(markup, parser, parse_only=fragment)
+
+    @staticmethod
+    def set_language(session: Session, language: str, cookies: dict, proxies: dict) -> Response:
+        """Switches language of the server session if it differs, returns response of the switch or None
+
+        :param session: Session
+        :param language: Language
+        :param cookies: Cookies
+        :param proxies: Proxies
+
+        :type session: Session
+        :type language: str
+        :type cookies: dict
+        :type proxies: dict
+
+        :return: Response
+        :rtype: requests.Response
+        """
+
+        if getattr(session, "language", None) == language:
+            return None
+
+        response: Response = session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        session.language = language
+
+        return response
+
+    @classmethod
+    def get_soup_schedule(
+        cls, session: Session, language: str, cookies: dict, proxies: dict, snapshots: PageSnapshots = None
+    ) -> bs:
         """Returns soup schedule
 
         :param session: Session
         :param language: Language
         :param cookies: Cookies
         :param proxies: Proxies
+        :param snapshots: Page snapshots, the page is fetched again if None
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
+        :type snapshots: PageSnapshots
 
         :return: Soup schedule
         :rtype: bs4.BeautifulSoup
         """
 
-        session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        if snapshots is not None:
+            soup: bs = snapshots.get(URL_SCHEDULE, language)
+            if soup is not None:
+                return soup
+
+        cls.set_language(session, language, cookies, proxies)
 
         response: Response = session.get(URL_SCHEDULE, cookies=cookies, proxies=proxies)
 
-        return bs(response.text, "html.parser")
+        soup: bs = cls.make_soup(session, response.text)
 
-    @staticmethod
-    def get_soup_news(session: Session, language: str, cookies: dict, proxies: dict) -> bs:
+        if snapshots is not None:
+            snapshots.put(URL_SCHEDULE, language, soup)
+
+        return soup
+
+    @classmethod
+    def get_soup_header(
+        cls, session: Session, language: str, cookies: dict, proxies: dict, snapshots: PageSnapshots = None
+    ) -> bs:
+        """Returns soup with header of pages: name, role switcher and counters,
+        the landing page of login while its snapshot is fresh and the schedule otherwise
+
+        :param session: Session
+        :param language: Language
+        :param cookies: Cookies
+        :param proxies: Proxies
+        :param snapshots: Page snapshots, the schedule is fetched again if None
+
+        :type session: Session
+        :type language: str
+        :type cookies: dict
+        :type proxies: dict
+        :type snapshots: PageSnapshots
+
+        :return: Soup header
+        :rtype: bs4.BeautifulSoup
+        """
+
+        if snapshots is not None:
+            soup: bs = snapshots.get(URL, language)
+            if soup is not None:
+                return soup
+
+        return cls.get_soup_schedule(session, language, cookies, proxies, snapshots)
+
+    @classmethod
+    def get_soup_news(
+        cls, session: Session, language: str, cookies: dict, proxies: dict,
+        fragment: Fragment = FRAGMENT_NEWS
+    ) -> bs:
         """Returns soup news
 
         :param session: Session
         :param language: Language
         :param cookies: Cookies
         :param proxies: Proxies
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
+        :type fragment: Fragment
 
         :return: Soup news
         :rtype: bs4.BeautifulSoup
         """
 
-        session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        cls.set_language(session, language, cookies, proxies)
 
         response: Response = session.get(URL_NEWS, cookies=cookies, proxies=proxies)
 
-        return bs(response.text, "html.parser")
+        return cls.make_soup(session, response.text, fragment)
 
-    @staticmethod
-    def get_soup_disciplines(session: Session, language: str, cookies: dict, proxies: dict) -> bs:
+    @classmethod
+    def get_soup_disciplines(
+        cls, session: Session, language: str, cookies: dict, proxies: dict,
+        fragment: Fragment = FRAGMENT_DISCIPLINES
+    ) -> bs:
         """Returns soup discipline
 
         :param session: Session
         :param language: Language
         :param cookies: Cookies
         :param proxies: Proxies
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
+        :type fragment: Fragment
 
         :return: Soup discipline
         :rtype: bs4.BeautifulSoup
         """
 
-        session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        cls.set_language(session, language, cookies, proxies)
 
         response: Response = session.get(URL_EDUCATION, cookies=cookies, proxies=proxies)
 
-        return bs(response.text, "html.parser")
+        return cls.make_soup(session, response.text, fragment)
 
     @staticmethod
-    def get_soup_notify(session: Session, language: str, cookies: dict, proxies: dict, page: int = 1) -> bs:
+    def get_url_notify(page: int, page_size: int = PAGE_SIZE_NOTIFY) -> str:
+        """Returns url of notifications page
+
+        :param page: Page
+        :param page_size: Notifications per page
+
+        :type page: int
+        :type page_size: int
+
+        :return: Url
+        :rtype: str
+        """
+
+        if page < 1:
+            raise PageNotExist("Page does not exist: %s?page=%d&pageSize=%d" % (URL_NOTIFY, page, page_size))
+
+        return "%s?page=%d&pageSize=%d" % (URL_NOTIFY, page, page_size)
+
+    @classmethod
+    def get_soup_notify(
+        cls, session: Session, language: str, cookies: dict, proxies: dict, page: int = 1,
+        fragment: Fragment = FRAGMENT_NOTIFY, page_size: int = PAGE_SIZE_NOTIFY
+    ) -> bs:
         """Returns soup notifications
 
         :param session: Session
@@ -92,63 +670,85 @@ class SoupLms:
         :param cookies: Cookies
         :param proxies: Proxies
         :param page: Page
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
+        :param page_size: Notifications per page
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
         :type page: int
+        :type fragment: Fragment
+        :type page_size: int
 
         :return: Soup notifications
         :rtype: bs4.BeautifulSoup
         """
 
-        if page < 1:
-            raise PageNotExist("Page does not exist: %s?page=%d&pageSize=10" % (URL_NOTIFY, page))
+        url: str = cls.get_url_notify(page, page_size)
 
-        session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        cls.set_language(session, language, cookies, proxies)
 
-        response: Response = session.get(
-            "%s?page=%d&pageSize=10" % (URL_NOTIFY, page),
-            cookies=cookies,
-            proxies=proxies
-        )
+        response: Response = session.get(url, cookies=cookies, proxies=proxies)
 
-        return bs(response.text, "html.parser")
+        return cls.make_soup(session, response.text, fragment)
 
     @classmethod
-    def get_amount_pages_notify(cls, session: Session, language: str, cookies: dict, proxies: dict) -> int:
+    def get_amount_pages_notify(
+        cls, session: Session, language: str, cookies: dict, proxies: dict, page_size: int = PAGE_SIZE_NOTIFY
+    ) -> int:
         """Returns amount pages notify
 
         :param session: Session
         :param language: Language
         :param cookies: Cookies
         :param proxies: Proxies
+        :param page_size: Notifications per page
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
+        :type page_size: int
 
         :return: Amount pages notify
         :rtype: int
+
+        Deprecated: pages are counted by LMS.iter_notify while they are read
         """
 
+        warnings.warn("get_amount_pages_notify is deprecated, use LMS.iter_notify", DeprecationWarning, 2)
+
         soup: bs = cls.get_soup_notify(
-            session, language, cookies, proxies
+            session, language, cookies, proxies, page_size=page_size
         )
 
-        paginator_links: bs = soup.select('.paginator a')
+        return cls.get_amount_pages_from_soup(soup)
 
-        if paginator_links:
-            amount_pages: int = int(paginator_links[-2].text)
-        else:
-            amount_pages: int = 1
+    @staticmethod
+    def get_url_notify_archive(page: int, page_size: int = PAGE_SIZE_NOTIFY) -> str:
+        """Returns url of notifications archive page
 
-        return amount_pages
+        :param page: Page
+        :param page_size: Notifications per page
 
-    @staticmethod
-    def get_soup_notify_archive(session: Session, language: str, cookies: dict, proxies: dict, page: int = 1) -> bs:
+        :type page: int
+        :type page_size: int
+
+        :return: Url
+        :rtype: str
+        """
+
+        if page < 1:
+            raise PageNotExist("Page does not exist: %s?page=%d&pageSize=%d" % (URL_NOTIFY_ARCHIVE, page, page_size))
+
+        return "%s?page=%d&pageSize=%d" % (URL_NOTIFY_ARCHIVE, page, page_size)
+
+    @classmethod
+    def get_soup_notify_archive(
+        cls, session: Session, language: str, cookies: dict, proxies: dict, page: int = 1,
+        fragment: Fragment = FRAGMENT_NOTIFY, page_size: int = PAGE_SIZE_NOTIFY
+    ) -> bs:
         """Returns soup notifications archive
 
         :param session: Session
@@ -156,61 +756,64 @@ class SoupLms:
         :param cookies: Cookies
         :param proxies: Proxies
         :param page: Page
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
+        :param page_size: Notifications per page
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
         :type page: int
+        :type fragment: Fragment
+        :type page_size: int
 
         :return: Soup notifications archive
         :rtype: bs4.BeautifulSoup
         """
-        if page < 1:
-            raise PageNotExist("Page does not exist: %s?page=%d&pageSize=10" % (URL_NOTIFY_ARCHIVE, page))
+        url: str = cls.get_url_notify_archive(page, page_size)
 
-        session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        cls.set_language(session, language, cookies, proxies)
 
-        response: Response = session.get(
-            "%s?page=%d&pageSize=10" % (URL_NOTIFY_ARCHIVE, page),
-            cookies=cookies,
-            proxies=proxies
-        )
+        response: Response = session.get(url, cookies=cookies, proxies=proxies)
 
-        return bs(response.text, "html.parser")
+        return cls.make_soup(session, response.text, fragment)
 
     @classmethod
-    def get_amount_pages_notify_archive(cls, session: Session, language: str, cookies: dict, proxies: dict) -> int:
+    def get_amount_pages_notify_archive(
+        cls, session: Session, language: str, cookies: dict, proxies: dict, page_size: int = PAGE_SIZE_NOTIFY
+    ) -> int:
         """Returns amount pages notify archive
 
         :param session: Session
         :param language: Language
         :param cookies: Cookies
         :param proxies: Proxies
+        :param page_size: Notifications per page
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
+        :type page_size: int
 
         :return: Amount pages notify archive
         :rtype: int
+
+        Deprecated: pages are counted by LMS.iter_notify_archive while they are read
         """
 
-        soup: bs = cls.get_soup_notify_archive(
-            session, language, cookies, proxies
+        warnings.warn(
+            "get_amount_pages_notify_archive is deprecated, use LMS.iter_notify_archive", DeprecationWarning, 2
         )
 
-        paginator_links: bs = soup.select('.paginator a')
-
-        if paginator_links:
-            amount_pages: int = int(paginator_links[-2].text)
-        else:
-            amount_pages: int = 1
+        soup: bs = cls.get_soup_notify_archive(
+            session, language, cookies, proxies, page_size=page_size
+        )
 
-        return amount_pages
+        return cls.get_amount_pages_from_soup(soup)
 
     @staticmethod
+    @tracing.extracted
     def get_amount_messages_from_soup(soup: bs, language: str) -> int:
         """Returns amount messages from soup
 
@@ -237,6 +840,7 @@ class SoupLms:
         return int(clean_data.remove_many_spaces(amount_messages.text))
 
     @staticmethod
+    @tracing.extracted
     def get_amount_notify_from_soup(soup: bs, language: str) -> int:
         """Returns amount notifications from soup
 
@@ -263,35 +867,506 @@ class SoupLms:
         return int(clean_data.remove_many_spaces(amount_notifications.text))
 
     @staticmethod
-    def get_soup_messages_unread(session: Session, language: str, cookies: dict, proxies: dict, page: int = 1) -> bs:
+    @tracing.extracted
+    def get_amount_unverified_work_from_soup(soup: bs, language: str) -> int:
+        """Returns amount unverified work from soup
+
+        :param soup: Soup
+        :param language: Language
+
+        :type soup: bs4.BeautifulSoup
+        :param language: Language
+
+        :return: Amount unverified work from soup
+        :rtype: int
+        """
+
+        titles: dict = {
+            "ru": "Требуют проверки",
+            "en": "Require verification",
+        }
+
+        amount_unverified_work: str = soup.find("a", title=titles[language])
+
+        if amount_unverified_work is None:
+            return 0
+
+        return int(clean_data.remove_many_spaces(amount_unverified_work.text))
+
+    @staticmethod
+    @tracing.extracted
+    def get_amount_pages_from_soup(soup: bs) -> int:
+        """Returns amount pages from paginator of soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Amount pages
+        :rtype: int
+        """
+
+        paginator_links: bs = soup.select('.paginator a')
+
+        if paginator_links:
+            amount_pages: int = int(paginator_links[-2].text)
+        else:
+            amount_pages: int = 1
+
+        return amount_pages
+
+    @staticmethod
+    @tracing.extracted
+    def get_amount_rows_from_soup(soup: bs) -> int:
+        """Returns amount of rows the server put on the page of the list of soup, rows left out by the getters
+        such as notifications with zero score are counted too
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Amount rows
+        :rtype: int
+        """
+
+        table: bs = soup.find("table", {"class": "table-list dataTable"})
+
+        if table is None or table.find("tbody") is None:
+            return 0
+
+        return sum(1 for tr in table.find("tbody").find_all("tr") if len(tr.find_all("td")) > 1)
+
+    @staticmethod
+    @tracing.extracted
+    def get_next_link_from_soup(soup: bs) -> str:
+        """Returns url of next page from paginator of soup or None on the last page
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Url of next page
+        :rtype: str
+        """
+
+        paginator_links: bs = soup.select('.paginator a')
+
+        if not paginator_links or paginator_links[-1]["href"] == "javascript:void(0);":
+            return None
+
+        return "%s%s" % (URL, paginator_links[-1]["href"])
+
+    @staticmethod
+    @tracing.extracted
+    def is_auth_from_soup(soup: bs) -> bool:
+        """Returns True if soup is a page of an authorized user
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: True or False
+        :rtype: bool
+        """
+
+        return soup.find("div", {"class": "user-name"}) is not None
+
+    @staticmethod
+    @tracing.extracted
+    def get_type_user_from_soup(soup: bs) -> str:
+        """Returns type user from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Type user
+        :rtype: str
+        """
+
+        all_roles: bs = soup.find("div", {"class": "drop-menu drop-select small"}).find("ul")
+
+        drop_menu_label: bs = soup.find("div", {"id": "switch-accounts"}).find("div", {"class": "drop-menu-label"})
+        current_type_user: str = drop_menu_label.find("span", {"class": "title"}).text
+
+        roles: List[Dict[str, str]] = []
+
+        for li in all_roles.find_all("li"):
+            if li.find("b"):
+                roles.append({"name": li.find("b").text.lower()})
+            elif li.find("a"):
+                roles[-1]["type"] = li.find("a").text.lower()
+
+        for role in roles:
+            if role["name"] == current_type_user:
+                return role["type"]
+
+        return roles[0]["name"]
+
+    @staticmethod
+    @tracing.extracted
+    def get_name_from_soup(soup: bs) -> str:
+        """Returns name from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Name
+        :rtype: str
+        """
+
+        name: str = soup.find("div", {"class": "user-name"}).text
+
+        return clean_data.remove_many_spaces(name)
+
+    @staticmethod
+    @tracing.extracted
+    def get_student_schedule_from_soup(soup: bs) -> dict:
+        """Returns schedule for student from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Schedule
+        :rtype: dict
+        """
+
+        table: bs = soup.find("table", {"class": "table-list v-scrollable"})
+        shedule: dict = {}
+
+        for tr in table.find("tbody").find_all("tr"):
+            cells: list = tr.find_all("td")
+            if len(cells) == 1:
+                return shedule
+            if tr.find("th"):
+                date: str = clean_data.remove_many_spaces(tr.find("th").text)
+                shedule[date] = {}
+            else:
+                lesson: dict = SCHEMA_STUDENT_SCHEDULE.extract(cells)
+                shedule[date][lesson.pop("time")] = lesson
+
+        return shedule
+
+    @staticmethod
+    @tracing.extracted
+    def get_teacher_schedule_from_soup(soup: bs) -> dict:
+        """Returns schedule for teacher from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Schedule
+        :rtype: dict
+        """
+
+        table: bs = soup.find("table", {"class": "table-list v-scrollable"})
+        shedule: dict = {}
+
+        for tr in table.find("tbody").find_all("tr"):
+            cells: list = tr.find_all("td")
+            if len(cells) == 1:
+                return shedule
+            if tr.find("th"):
+                date: str = clean_data.remove_many_spaces(tr.find("th").text)
+                shedule[date] = {}
+            else:
+                lesson: dict = SCHEMA_TEACHER_SCHEDULE.extract(cells)
+                shedule[date][lesson.pop("time")] = lesson
+
+        return shedule
+
+    @staticmethod
+    @tracing.extracted
+    def get_news_from_soup(soup: bs) -> list:
+        """Returns news from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: News
+        :rtype: list
+        """
+
+        events_anons: bs = soup.find("div", {"class": "events-list rssNews"})
+
+        news: list = []
+
+        for event_anons in events_anons.find_all("div", {"class": "item"}):
+            title: str = clean_data.remove_many_spaces(
+                event_anons.find("h3").text
+            )
+            description: str = clean_data.remove_many_spaces(
+                event_anons.find("div", {"class": "awrap"}).text
+            )
+            date: str = clean_data.remove_many_spaces(
+                event_anons.find("div", {"class": "meta"}).text
+            )
+            link: str = event_anons.find("a", {"class": "more"})["href"]
+
+            news.append(
+                {
+                    "title": title,
+                    "description": description,
+                    "date": date,
+                    "link": link,
+                }
+            )
+
+        return news
+
+    @staticmethod
+    @tracing.extracted
+    def get_disciplines_from_soup(soup: bs) -> list:
+        """Returns disciplines from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Disciplines
+        :rtype: list
+        """
+
+        disciplines: list = []
+
+        table = soup.find("tbody", {"class": "expanded"})
+
+        for tr in table.find_all("tr"):
+            cells: list = tr.find_all("td")
+            if len(cells) != 5:
+                continue
+
+            disciplines.append(SCHEMA_DISCIPLINES.extract(cells))
+
+        return disciplines
+
+    @staticmethod
+    @tracing.extracted
+    def get_curators_from_soup(soup: bs, block_id: str) -> list:
+        """Returns curators of block from soup
+
+        :param soup: Soup
+        :param block_id: Id of block, "curatorMain" for personal curators or "curators" for tutors
+
+        :type soup: bs4.BeautifulSoup
+        :type block_id: str
+
+        :return: Curators
+        :rtype: list
+        """
+
+        curator_main: bs = soup.find("div", {"id": block_id})
+        curator_list: bs = curator_main.find("ul", {"class": "curatorList"})
+        curators: list = []
+
+        if curator_list is None: return []
+
+        for li in curator_list.find_all("li"):
+            name: str = li.find("span", {"class": "curatorName"}).text
+            phones: list = []
+            emails: list = []
+
+            phone_icons = li.find_all('i', {'class': ['icon-helpdesk']})
+            email_icon = li.find('i', {'class': ['icon-mail']})
+
+            for icon in phone_icons:
+                phone = icon.find_next_sibling(string=True).strip()
+                phones.append(phone)
+
+            if email_icon:
+                email_link = email_icon.find_next_sibling('a')
+                email = email_link.get('href').replace('mailto:', '').strip()
+                emails.append(email)
+
+            curators.append(
+                {
+                    "name": name,
+                    "phones": phones,
+                    "emails": emails
+                }
+            )
+
+        return curators
+
+    @staticmethod
+    @tracing.extracted
+    def get_notify_from_soup(soup: bs) -> list:
+        """Returns notifications of one page from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Notifications
+        :rtype: list
+        """
+
+        table: bs = soup.find("table", {"class": "table-list dataTable"})
+        notify: list = []
+
+        for tr in table.find("tbody").find_all("tr"):
+            cells: list = tr.find_all("td")
+            if len(cells) == 1:
+                return notify
+            if cells[4].text[-1] == "0":
+                continue
+
+            notify.append(SCHEMA_NOTIFY.extract(cells))
+
+        return notify
+
+    @staticmethod
+    def get_key_from_row(row: dict) -> str:
+        """Returns key of row, a hash of its fields
+
+        :param row: Row
+        :type row: dict
+
+        :return: Key
+        :rtype: str
+        """
+
+        return sha1("\x1f".join(str(row[field]) for field in sorted(row)).encode()).hexdigest()
+
+    @classmethod
+    def get_key_notify(cls, notify: dict) -> str:
+        """Returns key of notification, a hash of its fields
+
+        :param notify: Notification
+        :type notify: dict
+
+        :return: Key
+        :rtype: str
+        """
+
+        return cls.get_key_from_row(notify)
+
+    @staticmethod
+    def get_seen_keys(watermark: Union[str, Iterable[str]]) -> Set[str]:
+        """Returns set of keys of seen notifications from watermark
+
+        :param watermark: Key of the newest seen notification or keys of seen notifications
+        :type watermark: Union[str, Iterable[str]]
+
+        :return: Keys
+        :rtype: Set[str]
+        """
+
+        if not watermark:
+            return set()
+        if isinstance(watermark, str):
+            return {watermark}
+
+        return set(watermark)
+
+    @staticmethod
+    @tracing.extracted
+    def get_unread_messages_from_soup(soup: bs) -> list:
+        """Returns unread messages of one page from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Unread messages
+        :rtype: list
+        """
+
+        table: bs = soup.find("table", {"class", "dataTable decorateTable table-list"})
+
+        return [SCHEMA_MESSAGES_UNREAD.extract(tr.find_all("td")) for tr in table.find("tbody").find_all("tr")]
+
+    @staticmethod
+    @tracing.extracted
+    def get_marks_from_soup(soup: bs) -> list:
+        """Returns marks from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Marks
+        :rtype: list
+        """
+
+        table: bs = soup.find("table", {"class": "table-list dataTable"})
+        marks: list = []
+
+        for tr in table.find_all("tr", {"id": "entryId"}):
+            cells: list = tr.find_all("td")
+            if len(cells) == 1:
+                return marks
+
+            marks.append(SCHEMA_MARKS.extract(cells))
+
+        return marks
+
+    @staticmethod
+    @tracing.extracted
+    def get_events_from_soup(soup: bs) -> dict:
+        """Returns events of discipline from soup
+
+        :param soup: Soup
+        :type soup: bs4.BeautifulSoup
+
+        :return: Current grade and events of discipline
+        :rtype: dict
+        """
+
+        table: bs = soup.find("table", {"class": "table-list"})
+        events: list = []
+
+        for tr in table.find("tbody").find_all("tr"):
+            cells: list = tr.find_all("td")
+            if len(cells) == 1:
+                continue
+
+            events.append(SCHEMA_EVENTS.extract(cells))
+
+        current_grade = table.find("tfoot").find_all("td")
+
+        return {
+            "current_grade": clean_data.remove_many_spaces(current_grade[-1].text),
+            "events": events
+        }
+
+    @staticmethod
+    def get_url_messages_unread(page: int) -> str:
+        """Returns url of unread messages page
+
+        :param page: Page
+        :type page: int
+
+        :return: Url
+        :rtype: str
+        """
+
+        if page < 1:
+            raise PageNotExist("Page does not exist: %s/page/%d" % (URL_MESSAGES_UNREAD, page))
+
+        return "%s/page/%d" % (URL_MESSAGES_UNREAD, page)
+
+    @classmethod
+    def get_soup_messages_unread(
+        cls, session: Session, language: str, cookies: dict, proxies: dict, page: int = 1,
+        fragment: Fragment = FRAGMENT_MESSAGES_UNREAD
+    ) -> bs:
         """Return soup unread messages
 
         :param session: Session
         :param language: Language
         :param cookies: Cookies
         :param proxies: Proxies
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
+        :type fragment: Fragment
 
         :return: Soup unread messages
         :rtype: bs4.BeautifulSoup
         """
 
-        if page < 1:
-            raise PageNotExist("Page does not exist: %s/page/%d" % (URL_MESSAGES_UNREAD, page))
+        url: str = cls.get_url_messages_unread(page)
 
-        session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        cls.set_language(session, language, cookies, proxies)
 
-        response: Response = session.get(
-            "%s/page/%d" % (URL_MESSAGES_UNREAD, page),
-            cookies=cookies,
-            proxies=proxies
-        )
+        response: Response = session.get(url, cookies=cookies, proxies=proxies)
 
-        return bs(response.text, "html.parser")
+        return cls.make_soup(session, response.text, fragment)
 
     @classmethod
     def get_amount_pages_messages_unread(cls, session: Session, language: str, cookies: dict, proxies: dict) -> int:
@@ -309,68 +1384,90 @@ class SoupLms:
 
         :return: Amount pages unread messages
         :rtype: int
+
+        Deprecated: pages are counted by LMS.iter_unread_messages while they are read
         """
 
-        soup: bs = cls.get_soup_messages_unread(
-            session, language, cookies, proxies
+        warnings.warn(
+            "get_amount_pages_messages_unread is deprecated, use LMS.iter_unread_messages", DeprecationWarning, 2
         )
 
-        amount_msg: int = cls.get_amount_messages_from_soup(
-            soup, language
-        )
+        return sum(1 for _ in cls.iter_soup_messages_unread(session, language, cookies, proxies))
 
-        if amount_msg < 1:
-            return 0
+    @classmethod
+    def iter_soup_messages_unread(
+        cls, session: Session, language: str, cookies: dict, proxies: dict,
+        fragment: Fragment = FRAGMENT_MESSAGES_UNREAD
+    ) -> Iterator[bs]:
+        """Yields soup of every unread messages page following the paginator, each page is fetched once
 
-        amount_pages: int = 1
+        :param session: Session
+        :param language: Language
+        :param cookies: Cookies
+        :param proxies: Proxies
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
 
-        paginator_links: bs = soup.select('.paginator a')
+        :type session: Session
+        :type language: str
+        :type cookies: dict
+        :type proxies: dict
+        :type fragment: Fragment
 
-        if not paginator_links:
-            return 1
+        :return: Soup unread messages of every page
+        :rtype: Iterator[bs4.BeautifulSoup]
+        """
 
-        next_link: str = "%s%s" % (URL, paginator_links[-1]["href"])
-        end_link: str = "%sjavascript:void(0);" % URL
+        soup: bs = cls.get_soup_messages_unread(
+            session, language, cookies, proxies, fragment=fragment
+        )
 
-        while (next_link != end_link):
-            amount_pages += 1
+        if cls.get_amount_messages_from_soup(soup, language) < 1:
+            return
 
-            response: Response = session.get(
-                "%s%s" % (URL, paginator_links[-1]["href"]),
-                cookies=cookies,
-                proxies=proxies
-            )
-            soup = bs(response.content, 'html.parser')
-            paginator_links: bs = soup.select('.paginator a')
-            next_link = "%s%s" % (URL, paginator_links[-1]["href"])
+        next_link: str = cls.get_next_link_from_soup(soup)
 
-        return amount_pages
-    
-    @staticmethod
-    def get_soup_journal(session: Session, language: str, cookies: dict, proxies: dict) -> bs:
+        yield soup
+
+        while next_link:
+            response: Response = session.get(next_link, cookies=cookies, proxies=proxies)
+            soup = cls.make_soup(session, response.text, fragment)
+            next_link = cls.get_next_link_from_soup(soup)
+
+            yield soup
+
+    @classmethod
+    def get_soup_journal(
+        cls, session: Session, language: str, cookies: dict, proxies: dict,
+        fragment: Fragment = FRAGMENT_JOURNAL
+    ) -> bs:
         """ Returns journal
 
         :param session: Session
         :param language: Language
         :param cookies: Cookies
         :param proxies: Proxies
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
+        :type fragment: Fragment
 
         :return: Journal page
         :rtype: bs4.BeautifulSoup
         """
-        session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        cls.set_language(session, language, cookies, proxies)
 
         response: Response = session.get(URL_JOURNAL, cookies=cookies, proxies=proxies)
 
-        return bs(response.text, "html.parser")
+        return cls.make_soup(session, response.text, fragment)
     
-    @staticmethod
-    def get_soup_events(session: Session, language: str, cookies: dict, proxies: dict, url: str) -> bs:
+    @classmethod
+    def get_soup_events(
+        cls, session: Session, language: str, cookies: dict, proxies: dict, url: str,
+        fragment: Fragment = FRAGMENT_EVENTS
+    ) -> bs:
         """ Returns soup events
 
         :param session: Session
@@ -378,19 +1475,21 @@ class SoupLms:
         :param cookies: Cookies
         :param proxies: Proxies
         :param url: Url
+        :param fragment: Fragment of page to parse, the whole page is parsed if None
 
         :type session: Session
         :type language: str
         :type cookies: dict
         :type proxies: dict
         :type url: str
+        :type fragment: Fragment
 
         :return: Soup events
         :rtype: bs4.BeautifulSoup
         """
         
-        session.get(URLS_LANGUAGES[language], cookies=cookies, proxies=proxies)
+        cls.set_language(session, language, cookies, proxies)
 
         response: Response = session.get(url, cookies=cookies, proxies=proxies)
 
-        return bs(response.text, "html.parser")
+        return cls.make_soup(session, response.text, fragment)
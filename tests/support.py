@@ -0,0 +1,34 @@
+"""Stand-in of LMS from benchmarks/server.py shared by the offline tests
+
+The stand-in is started on a free port when this module is imported, before the package is imported,
+because the url of the server is read from LMS_SYNERGY_URL once by constants.py. Options of the stand-in
+are changed by tests with stand_in_options().
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from threading import Thread
+
+ROOT: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [ROOT, os.path.join(ROOT, "benchmarks")]
+
+import server
+
+STAND_IN = server.serve(0)
+Thread(target=STAND_IN.serve_forever, daemon=True).start()
+os.environ["LMS_SYNERGY_URL"] = "http://127.0.0.1:%d" % STAND_IN.server_address[1]
+
+
+@contextmanager
+def stand_in_options(**options):
+    """Serves pages of the stand-in with options of StandInOptions while the block runs"""
+
+    handler: type = STAND_IN.RequestHandlerClass
+    previous: server.StandInOptions = handler.options
+    handler.options = server.StandInOptions(**options)
+
+    try:
+        yield handler.options
+    finally:
+        handler.options = previous
@@ -0,0 +1,39 @@
+import unittest
+
+from support import stand_in_options
+from lms_synergy_library import LMS, AsyncLMS
+
+
+class AsyncUnreadMessagesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_get_unread_messages(self):
+        with stand_in_options(rows=4, pages_amount=3):
+            messages: list = LMS(login="user", password="password").get_unread_messages()
+
+            async with AsyncLMS(login="user", password="password") as lms:
+                self.assertEqual(await lms.get_unread_messages(), messages)
+
+        self.assertEqual(len(messages), 12)
+
+    async def test_iter_unread_messages(self):
+        with stand_in_options(rows=4, pages_amount=3):
+            async with AsyncLMS(login="user", password="password") as lms:
+                messages: list = []
+
+                async for message in lms.iter_unread_messages():
+                    messages.append(message)
+                    if len(messages) == 5:
+                        break
+
+                requests: int = lms.amount_requests
+
+            async with AsyncLMS(login="user", password="password") as lms:
+                all_messages: list = [message async for message in lms.iter_unread_messages()]
+                all_requests: int = lms.amount_requests
+
+        self.assertEqual(messages, all_messages[:5])
+        # the third page is not fetched after break
+        self.assertEqual(requests, all_requests - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
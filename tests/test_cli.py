@@ -0,0 +1,133 @@
+import io
+import json
+import os
+import unittest
+from contextlib import redirect_stderr
+from tempfile import TemporaryDirectory
+
+from support import stand_in_options
+from lms_synergy_library import cli, columns
+from lms_synergy_library.exceptions import ServerError
+
+
+class CliTest(unittest.TestCase):
+    def setUp(self):
+        self.directory: TemporaryDirectory = TemporaryDirectory()
+        self.accounts: str = os.path.join(self.directory.name, "accounts.csv")
+
+        with open(self.accounts, "w", encoding="utf-8") as file:
+            file.write("login,password\nuser1,password1\n# user3,password3\nuser2,password2\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_cli(self, *argv: str) -> tuple:
+        """Returns exit code and report of the command"""
+
+        stderr: io.StringIO = io.StringIO()
+
+        with redirect_stderr(stderr):
+            code: int = cli.main(list(argv))
+
+        return code, json.loads(stderr.getvalue())
+
+    def test_jsonl(self):
+        output: str = os.path.join(self.directory.name, "rows.jsonl")
+
+        with stand_in_options(rows=3, pages_amount=2, max_page_size=3):
+            code, report = self.run_cli(self.accounts, "-d", "marks", "-d", "notify", "-o", output)
+
+        with open(output, encoding="utf-8") as file:
+            rows: list = [json.loads(line) for line in file]
+
+        self.assertEqual(code, 0)
+        self.assertEqual(report["accounts"], 2)
+        self.assertEqual(report["failures"], [])
+        self.assertEqual(report["rows"], len(rows))
+        self.assertEqual(
+            sorted({(row["login"], row["dataset"]) for row in rows}),
+            [("user1", "marks"), ("user1", "notify"), ("user2", "marks"), ("user2", "notify")]
+        )
+        self.assertEqual(sum(1 for row in rows if row["login"] == "user1" and row["dataset"] == "notify"), 6)
+
+    def test_jsonl_accounts(self):
+        accounts: str = os.path.join(self.directory.name, "accounts.jsonl")
+        output: str = os.path.join(self.directory.name, "rows.jsonl")
+
+        with open(accounts, "w", encoding="utf-8") as file:
+            file.write('{"login": "user1", "password": "password1"}\n\n')
+
+        with stand_in_options(rows=3):
+            code, report = self.run_cli(accounts, "-d", "marks", "-o", output)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(report["accounts"], 1)
+
+    @unittest.skipIf(columns.pyarrow is None, "requires pyarrow")
+    def test_parquet(self):
+        output: str = os.path.join(self.directory.name, "dump")
+
+        with stand_in_options(rows=3, disciplines=2):
+            code, report = self.run_cli(
+                self.accounts, "-d", "marks", "-d", "events", "--format", "parquet", "-o", output
+            )
+
+        marks = columns.pyarrow.parquet.read_table(os.path.join(output, "marks.parquet"))
+        events = columns.pyarrow.parquet.read_table(os.path.join(output, "events.parquet"))
+
+        self.assertEqual(code, 0)
+        self.assertEqual(report["rows"], marks.num_rows + events.num_rows)
+        self.assertEqual(sorted(set(marks.column("login").to_pylist())), ["user1", "user2"])
+        self.assertEqual(marks.column_names, ["login"] + list(cli.Mark._fields))
+
+    def test_failed_accounts(self):
+        output: str = os.path.join(self.directory.name, "rows.jsonl")
+
+        with stand_in_options(error_rate=1.0):
+            code, report = self.run_cli(self.accounts, "-d", "marks", "-o", output)
+
+        self.assertEqual(code, 1)
+        self.assertEqual(report["failed_accounts"], 2)
+        self.assertEqual([failure["dataset"] for failure in report["failures"]], [None, None])
+        self.assertIn("ServerError", report["failures"][0]["errors"][0])
+
+    def test_failed_datasets(self):
+        output: str = os.path.join(self.directory.name, "rows.jsonl")
+
+        with stand_in_options(latency=200, rows=3):
+            code, report = self.run_cli(self.accounts, "-d", "marks", "--deadline", "0.05", "-o", output)
+
+        self.assertEqual(code, 1)
+        self.assertEqual(report["failed_accounts"], 2)
+        self.assertEqual({failure["dataset"] for failure in report["failures"]}, {"marks"})
+        self.assertIn("DeadlineExceededError", report["failures"][0]["errors"][0])
+
+    def test_failed_dataset_counts_written_rows(self):
+        class Client:
+            login: str = "user"
+            amount_requests: int = 0
+
+            def iter_marks(self):
+                yield {"mark": "5"}
+                yield {"mark": "4"}
+                raise ServerError("Status 500")
+
+        output: io.StringIO = io.StringIO()
+        writer: cli.JsonLinesWriter = cli.JsonLinesWriter(output)
+
+        result: dict = cli.export_account(Client(), ["marks"], writer)
+
+        self.assertEqual(result["rows"], 2)
+        self.assertEqual(len(output.getvalue().splitlines()), 2)
+        self.assertEqual(result["errors"], {"marks": ["ServerError: Status 500"]})
+        self.assertEqual(writer.get_amount("marks", "user"), 2)
+
+    def test_parquet_needs_directory(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as raised:
+            cli.main([self.accounts, "--format", "parquet"])
+
+        self.assertEqual(raised.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from lms_synergy_library import columns
+from lms_synergy_library.columns import Columns, get_columns_marks
+
+MARKS: list = [
+    {"discipline": "Math", "type_discipline": "lecture", "teacher": "Teacher", "date_discipline": "01.02.23",
+     "time_discipline": "09:55", "mark": "5", "hours": "2"},
+    {"discipline": "Art", "type_discipline": "lecture", "teacher": "Teacher", "date_discipline": "02.02.23",
+     "time_discipline": "09:55", "mark": "-", "hours": "2"},
+]
+
+
+@unittest.skipIf(columns.pyarrow is None or columns.np is None, "requires numpy and pyarrow")
+class ParquetTest(unittest.TestCase):
+    def setUp(self):
+        self.columns: Columns = get_columns_marks({"user": MARKS})
+
+    def test_to_parquet(self):
+        with TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "marks.parquet")
+            self.columns.to_parquet(path)
+            table = columns.pyarrow.parquet.read_table(path)
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.column("discipline").to_pylist(), ["Math", "Art"])
+
+    def test_to_parquet_without_pyarrow(self):
+        with mock.patch.object(columns, "pyarrow", None):
+            with self.assertRaisesRegex(ImportError, "require pyarrow"):
+                self.columns.to_parquet("marks.parquet")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from inspect import signature
+
+from support import STAND_IN, stand_in_options
+from lms_synergy_library import LMS
+from lms_synergy_library.exceptions import DeadlineExceededError
+from lms_synergy_library.limits import check_deadline
+
+
+class DeadlineTest(unittest.TestCase):
+    """Pages fetched ahead by threads and events of disciplines fetched by threads share the deadline of the call,
+    the stand-in answers in a second, so the deadline is over while the threads wait for the second round"""
+
+    def setUp(self):
+        self.lms: LMS = LMS(login="user", password="password")
+
+    def assertExceeds(self, call, requests: int):
+        """Asserts that call raises DeadlineExceededError after the stand-in received requests"""
+
+        handler: type = STAND_IN.RequestHandlerClass
+        received: int = handler.amount_requests
+
+        with self.assertRaises(DeadlineExceededError):
+            call(1.5)
+
+        self.assertEqual(handler.amount_requests - received, requests)
+        self.assertIsNone(check_deadline())
+
+    def test_signature(self):
+        parameters = signature(LMS.get_notify).parameters
+
+        self.assertEqual(list(parameters), ["self", "page_size", "deadline"])
+        self.assertIsNone(parameters["deadline"].default)
+
+    def test_get_notify(self):
+        with stand_in_options(latency=1000, rows=5, pages_amount=6, max_page_size=5):
+            # the first page and pages 2-5 fetched ahead, page 6 is never requested
+            self.assertExceeds(lambda deadline: self.lms.get_notify(deadline=deadline), 5)
+
+    def test_iter_notify(self):
+        with stand_in_options(latency=1000, rows=5, pages_amount=6, max_page_size=5):
+            notify: list = []
+
+            def iterate(deadline: float) -> None:
+                for row in self.lms.iter_notify(deadline=deadline):
+                    notify.append(row)
+
+            self.assertExceeds(iterate, 5)
+
+        # rows of the first page are yielded before the threads fail
+        self.assertEqual(len(notify), 5)
+
+    def test_get_events(self):
+        with stand_in_options(latency=1000, disciplines=4):
+            # the study plan and the pages of 4 disciplines
+            self.assertExceeds(lambda deadline: self.lms.get_events(deadline=deadline), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
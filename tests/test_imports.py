@@ -0,0 +1,25 @@
+import subprocess
+import sys
+import unittest
+
+from support import ROOT
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_lazy_client_loads_no_http_or_parser(self):
+        code: str = (
+            "import sys\n"
+            "from lms_synergy_library import LMS\n"
+            "LMS(lazy=True)\n"
+            "print(sorted({'requests', 'bs4', 'concurrent.futures'} & set(sys.modules)))\n"
+        )
+
+        output: str = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+
+        self.assertEqual(output.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+
+from support import stand_in_options
+from lms_synergy_library import LMS, Mirror
+from lms_synergy_library.utils import SoupLms
+
+
+def mark(number: int, value: str = "5") -> dict:
+    return {
+        "discipline": "Discipline %d" % (number % 2), "type_discipline": "lecture", "teacher": "Teacher %d" % number,
+        "date_discipline": "0%d.02.23" % number, "time_discipline": "09:55", "mark": value, "hours": "2",
+    }
+
+
+def notification(number: int) -> dict:
+    return {
+        "discipline": "Discipline", "teacher": "Teacher", "event": "Event %d" % number, "current_score": "1",
+        "message": "Message %d" % number,
+    }
+
+
+def event(name: str) -> dict:
+    return {"name": name, "access": "open", "max_grade": "10", "result": "5", "url": "-"}
+
+
+class MirrorTest(unittest.TestCase):
+    def setUp(self):
+        self.mirror: Mirror = Mirror()
+
+    def tearDown(self):
+        self.mirror.close()
+
+    def test_upsert_marks_prunes_removed(self):
+        self.mirror.upsert_marks("user", [mark(1), mark(2), mark(3)])
+        self.mirror.upsert_marks("other", [mark(1)])
+        self.assertEqual(self.mirror.upsert_marks("user", [mark(2), mark(3, "4"), mark(4)]), 3)
+
+        self.assertEqual(
+            sorted(self.mirror.get_marks("user"), key=lambda row: row["teacher"]), [mark(2), mark(3, "4"), mark(4)]
+        )
+        self.assertEqual(self.mirror.get_marks("user", discipline="Discipline 0"), [mark(2), mark(4)])
+        self.assertEqual(self.mirror.get_marks("other"), [mark(1)])
+
+    def test_upsert_notify_keeps_old(self):
+        # pages list notifications newest first
+        self.mirror.upsert_notify("user", [notification(2), notification(1)])
+        self.mirror.upsert_notify("user", [notification(3), notification(2)])
+        self.mirror.upsert_notify("user", [notification(9)], archive=True)
+
+        self.assertEqual(self.mirror.get_notify("user"), [notification(3), notification(2), notification(1)])
+        self.assertEqual(self.mirror.get_notify("user", archive=True), [notification(9)])
+        self.assertEqual(len(self.mirror.get_keys_notify("user")), 3)
+
+    def test_upsert_notify_in_list_and_archive(self):
+        self.mirror.upsert_notify("user", [notification(2), notification(1)])
+        self.mirror.upsert_notify("user", [notification(1)], archive=True)
+        self.mirror.upsert_notify("user", [notification(3), notification(2)])
+
+        self.assertEqual(self.mirror.get_notify("user", archive=True), [notification(1)])
+        self.assertEqual(self.mirror.get_keys_notify("user", archive=True), {SoupLms.get_key_notify(notification(1))})
+        self.assertEqual(len(self.mirror.get_keys_notify("user")), 3)
+
+    def test_upsert_events_keeps_failed_discipline(self):
+        self.mirror.upsert_events("user", [
+            {"Math": {"current_grade": "10", "events": [event("Test 1"), event("Test 2")]}},
+            {"Art": {"current_grade": "7", "events": [event("Essay")]}},
+        ])
+        self.mirror.upsert_events("user", [
+            {"Math": {"current_grade": "15", "events": [event("Test 2"), event("Test 3")]}},
+            {"Art": {"current_grade": "-", "events": [], "error": "ServerError: Status 500"}},
+        ])
+
+        self.assertEqual(
+            [row["name"] for row in self.mirror.get_events("user", discipline="Math")], ["Test 2", "Test 3"]
+        )
+        self.assertEqual([row["name"] for row in self.mirror.get_events("user", discipline="Art")], ["Essay"])
+        self.assertEqual(self.mirror.get_current_grades("user"), {"Math": "15", "Art": "7"})
+
+    def test_upsert_events_drops_removed_discipline(self):
+        self.mirror.upsert_events("user", [
+            {"Math": {"current_grade": "10", "events": [event("Test 1")]}},
+            {"Art": {"current_grade": "7", "events": [event("Essay")]}},
+            {"Music": {"current_grade": "3", "events": [event("Concert")]}},
+        ])
+        self.mirror.upsert_events("other", [{"Art": {"current_grade": "9", "events": [event("Essay")]}}])
+        self.mirror.upsert_events("user", [
+            {"Math": {"current_grade": "15", "events": [event("Test 1")]}},
+            {"Music": {"current_grade": "-", "events": [], "error": "ServerError: Status 500"}},
+        ])
+
+        self.assertEqual(sorted(row["name"] for row in self.mirror.get_events("user")), ["Concert", "Test 1"])
+        self.assertEqual(self.mirror.get_current_grades("user"), {"Math": "15", "Music": "3"})
+        self.assertEqual(self.mirror.get_current_grades("other"), {"Art": "9"})
+
+    def test_sync_mirror(self):
+        with stand_in_options(rows=5, pages_amount=2, max_page_size=5):
+            lms: LMS = LMS(login="user", password="password")
+            # the stand-in serves the same notifications in the list and in the archive
+            first: dict = lms.sync_mirror(self.mirror)
+
+            requests: int = lms.amount_requests
+            second: dict = lms.sync_mirror(self.mirror, ("marks", "notify", "notify_archive"))
+            second_requests: int = lms.amount_requests - requests
+
+            self.assertEqual(self.mirror.get_marks("user"), lms.get_marks())
+            self.assertEqual(self.mirror.get_notify("user"), lms.get_notify())
+            self.assertEqual(self.mirror.get_notify("user", archive=True), lms.get_notify_archive())
+
+        self.assertEqual((first["notify"], first["notify_archive"]), (10, 10))
+        self.assertEqual(second, {"marks": first["marks"], "notify": 0, "notify_archive": 0})
+        # marks and the first page of the list and of the archive
+        self.assertEqual(second_requests, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from support import stand_in_options
+from lms_synergy_library import LMS, AsyncLMS
+from lms_synergy_library.utils import SoupLms, FRAGMENT_NOTIFY
+
+
+def get_scored_notify_from_soup(soup) -> list:
+    """Leaves out the first notification of every page as the getter leaves out notifications with zero score"""
+
+    return SoupLms.get_notify_from_soup(soup)[1:]
+
+
+class PageSizeTest(unittest.TestCase):
+    def test_probe_counts_served_rows(self):
+        with stand_in_options(rows=5, pages_amount=3, max_page_size=5):
+            lms: LMS = LMS(login="user", password="password")
+            notify: list = list(lms._iter_pages(
+                SoupLms.get_soup_notify, get_scored_notify_from_soup, page_size=lms._get_page_size()
+            ))
+
+        self.assertEqual(len(notify), 12)
+        self.assertEqual(lms._page_size_notify, 5)
+
+    def test_probe_of_one_page(self):
+        with stand_in_options(rows=5, pages_amount=1, max_page_size=5):
+            lms: LMS = LMS(login="user", password="password")
+            lms.get_notify()
+
+        self.assertIsNone(lms._page_size_notify)
+
+
+class AsyncPageSizeTest(unittest.IsolatedAsyncioTestCase):
+    async def test_probe_counts_served_rows(self):
+        with stand_in_options(rows=5, pages_amount=3, max_page_size=5):
+            async with AsyncLMS(login="user", password="password") as lms:
+                notify: list = [row async for row in lms._iter_pages(
+                    SoupLms.get_url_notify, get_scored_notify_from_soup, FRAGMENT_NOTIFY,
+                    page_size=lms._get_page_size()
+                )]
+
+        self.assertEqual(len(notify), 12)
+        self.assertEqual(lms._page_size_notify, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+import support  # noqa: F401, puts benchmarks on sys.path
+import pages
+from parse import BENCHMARKS, get_parsers
+from lms_synergy_library.utils import SoupLms, LmsSession
+
+
+class ParserParityTest(unittest.TestCase):
+    """Every getter extracts the same rows with every installed parser backend
+    and from the parsed fragment as from the whole page parsed by html.parser"""
+
+    def extract(self, parser: str, markup: str, fragment, get_from_soup):
+        session: LmsSession = LmsSession(parser)
+
+        try:
+            return get_from_soup(SoupLms.make_soup(session, markup, fragment))
+        finally:
+            session.close()
+
+    def test_parity(self):
+        for name, (fixture, build, fragment, get_from_soup) in BENCHMARKS.items():
+            markup: str = build(pages.SIZES["small"])
+            expected = self.extract("html.parser", markup, None, get_from_soup)
+
+            for parser in get_parsers():
+                with self.subTest(getter=name, parser=parser):
+                    self.assertEqual(self.extract(parser, markup, fragment, get_from_soup), expected)
+                    self.assertEqual(self.extract(parser, markup, None, get_from_soup), expected)
+
+    def test_rows_are_found(self):
+        markup: str = pages.journal(pages.SIZES["small"])
+
+        for parser in get_parsers():
+            with self.subTest(parser=parser):
+                marks: list = self.extract(parser, markup, BENCHMARKS["get_marks"][2], SoupLms.get_marks_from_soup)
+                self.assertEqual(len(marks), pages.SIZES["small"])
+
+
+if __name__ == "__main__":
+    unittest.main()
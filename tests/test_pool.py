@@ -0,0 +1,68 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from support import stand_in_options
+from lms_synergy_library import LMSPool
+from lms_synergy_library.exceptions import PasswordMismatchError, ServerError
+
+
+class PoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool: LMSPool = LMSPool(max_workers=4)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_get_client_once(self):
+        with stand_in_options(latency=50), ThreadPoolExecutor(max_workers=4) as executor:
+            clients: list = list(executor.map(lambda _: self.pool.get_client("user", "password"), range(8)))
+
+        self.assertTrue(all(client is clients[0] for client in clients))
+        self.assertEqual(list(self.pool.clients), ["user"])
+
+    def test_get_client_other_password(self):
+        self.pool.get_client("user", "password")
+
+        with self.assertRaises(PasswordMismatchError):
+            self.pool.get_client("user", "other")
+
+        self.pool.release("user")
+        self.assertEqual(self.pool.get_client("user", "other").password, "other")
+
+    def test_get_client_failed(self):
+        with stand_in_options(error_rate=1.0), self.assertRaises(ServerError):
+            self.pool.get_client("user", "password")
+
+        self.assertEqual((self.pool.clients, self.pool._login_locks), ({}, {}))
+        self.assertEqual(self.pool.get_client("user", "password").login, "user")
+
+    def test_run(self):
+        accounts: list = [("user%d" % number, "password") for number in range(6)]
+        pulled: list = []
+        ahead: list = []
+        lock: Lock = Lock()
+
+        def read_accounts():
+            for account in accounts:
+                with lock:
+                    pulled.append(account)
+                yield account
+
+        def function(client) -> str:
+            with lock:
+                ahead.append(len(pulled) - len(ahead))
+            return client.login.upper()
+
+        with stand_in_options(latency=20), LMSPool(max_workers=2) as pool:
+            results: list = pool.run(function, read_accounts())
+
+        self.assertEqual(
+            results, [{"login": login, "result": login.upper(), "error": None} for login, _ in accounts]
+        )
+        # accounts are read while workers free up, never more than max_workers ahead
+        self.assertLessEqual(max(ahead), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from threading import Lock, Thread
+
+from support import STAND_IN, stand_in_options
+from lms_synergy_library.exceptions import ServerError
+from lms_synergy_library.limits import RetryPolicy, get_content_length
+from lms_synergy_library.utils import LmsSession
+from lms_synergy_library.async_lms import AsyncLmsSession
+
+PAGE: bytes = b"<html><body>Page</body></html>"
+# a valid page without the closing tags and with a long trailing script
+PAGE_OPEN: bytes = b"<html><body>Page<script>" + b"/* comment */" * 100 + b"</script>"
+
+
+class TruncatingHandler(StreamRequestHandler):
+    """Promises a longer body than it sends and closes the connection for the first `truncated` requests"""
+
+    truncated: int = 0
+    page: bytes = PAGE
+
+    def handle(self) -> None:
+        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+            pass
+
+        server = self.server
+        with server.lock:
+            server.amount_requests += 1
+            truncate: bool = server.amount_requests <= self.truncated
+
+        headers: bytes = b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nConnection: close\r\n"
+        if truncate:
+            self.wfile.write(headers + b"Content-Length: %d\r\n\r\n" % len(self.page) + self.page[:10])
+        else:
+            self.wfile.write(headers + b"Content-Length: %d\r\n\r\n" % len(self.page) + self.page)
+
+
+def serve_truncating(truncated: int, page: bytes = PAGE) -> ThreadingTCPServer:
+    handler: type = type("Handler", (TruncatingHandler,), {"truncated": truncated, "page": page})
+    server: ThreadingTCPServer = ThreadingTCPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    server.lock = Lock()
+    server.amount_requests = 0
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self):
+        self.retry: RetryPolicy = RetryPolicy(attempts=3, backoff=0.5, max_delay=4.0)
+
+    def test_get_error(self):
+        self.assertEqual(self.retry.get_error(503, "text/html", b"</html>"), "Status 503")
+        self.assertEqual(self.retry.get_error(429, "application/json", b"{}"), "Status 429")
+        self.assertEqual(
+            self.retry.get_error(200, "text/html", b"<td>cut", 1000, 10), "Truncated page of 10 of 1000 bytes"
+        )
+        self.assertIsNone(self.retry.get_error(200, "text/html", b"<td>cut", 10, 10))
+        self.assertIsNone(self.retry.get_error(200, "text/html", b"<td>cut"))
+        self.assertIsNone(self.retry.get_error(200, "application/json", b"{}"))
+        self.assertIsNone(self.retry.get_error(404, "text/html", b"</html>", 1000, 10))
+
+    def test_get_error_truncated_html(self):
+        retry: RetryPolicy = RetryPolicy(truncated_html=True)
+
+        self.assertEqual(retry.get_error(200, "text/html", b"<td>cut"), "Truncated page")
+        self.assertIsNone(retry.get_error(200, "text/html; charset=utf-8", b"</BODY></HTML>\n"))
+        self.assertIsNone(retry.get_error(200, "application/json", b"{}"))
+
+    def test_get_content_length(self):
+        self.assertEqual(get_content_length({"Content-Length": "1000"}), 1000)
+        self.assertEqual(get_content_length({"Content-Length": "1000", "Content-Encoding": "identity"}), 1000)
+        self.assertIsNone(get_content_length({"Content-Length": "1000", "Content-Encoding": "gzip"}))
+        self.assertIsNone(get_content_length({"Content-Length": "-1"}))
+        self.assertIsNone(get_content_length({}))
+
+    def test_get_delay_backoff(self):
+        for attempt, bound in ((0, 0.5), (1, 1.0), (2, 2.0), (5, 4.0)):
+            delays: list = [self.retry.get_delay(attempt) for _ in range(200)]
+            self.assertTrue(all(0 <= delay <= bound for delay in delays))
+            self.assertGreater(max(delays), bound / 2)
+
+    def test_get_delay_retry_after(self):
+        date: str = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=3), usegmt=True)
+
+        self.assertEqual(self.retry.get_delay(0, "2"), 2.0)
+        self.assertEqual(self.retry.get_delay(0, "120"), 4.0)
+        self.assertEqual(self.retry.get_delay(0, "-1"), 0.0)
+        self.assertTrue(1.0 < self.retry.get_delay(0, date) <= 3.0)
+        self.assertTrue(0 <= self.retry.get_delay(0, "soon") <= 0.5)
+
+    def test_get_attempts(self):
+        self.assertEqual(self.retry.get_attempts("get"), 3)
+        self.assertEqual(self.retry.get_attempts("POST"), 1)
+
+
+class SessionRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.session: LmsSession = LmsSession(retry=RetryPolicy(attempts=3, backoff=0.01))
+        self.url: str = "http://127.0.0.1:%d" % STAND_IN.server_address[1]
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_error_pages_retried(self):
+        with stand_in_options(error_rate=1.0):
+            with self.assertRaisesRegex(ServerError, "Status 500"):
+                self.session.get(self.url + "/user/login")
+
+        self.assertEqual(self.session.amount_requests, 3)
+
+    def test_post_sent_once(self):
+        with stand_in_options(error_rate=1.0):
+            with self.assertRaisesRegex(ServerError, "POST .*Status 500"):
+                self.session.post(self.url + "/user/login", data={"popupUsername": "user"})
+
+        self.assertEqual(self.session.amount_requests, 1)
+
+    def test_truncated_body_retried(self):
+        server: ThreadingTCPServer = serve_truncating(2)
+        url: str = "http://127.0.0.1:%d/" % server.server_address[1]
+
+        try:
+            self.assertEqual(self.session.get(url).content, PAGE)
+            self.assertEqual(self.session.amount_requests, 3)
+
+            server.amount_requests = 0
+            with self.assertRaises(ServerError):
+                self.session.post(url)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+    def test_page_without_end_is_not_retried(self):
+        server: ThreadingTCPServer = serve_truncating(0, PAGE_OPEN)
+        url: str = "http://127.0.0.1:%d/" % server.server_address[1]
+
+        try:
+            self.assertEqual(self.session.get(url).content, PAGE_OPEN)
+            self.assertEqual(self.session.amount_requests, 1)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class AsyncSessionRetryTest(unittest.IsolatedAsyncioTestCase):
+    async def test_truncated_body_retried(self):
+        server: ThreadingTCPServer = serve_truncating(2)
+        url: str = "http://127.0.0.1:%d/" % server.server_address[1]
+        session: AsyncLmsSession = AsyncLmsSession({}, retry=RetryPolicy(attempts=3, backoff=0.01))
+
+        try:
+            self.assertEqual(await session.get(url), PAGE.decode())
+            self.assertEqual(session.amount_requests, 3)
+
+            server.amount_requests = 0
+            with self.assertRaises(ServerError):
+                await session.post(url)
+            self.assertEqual(session.amount_requests, 4)
+        finally:
+            await session.close()
+            server.shutdown()
+            server.server_close()
+
+    async def test_page_without_end_is_not_retried(self):
+        server: ThreadingTCPServer = serve_truncating(0, PAGE_OPEN)
+        url: str = "http://127.0.0.1:%d/" % server.server_address[1]
+        session: AsyncLmsSession = AsyncLmsSession({}, retry=RetryPolicy(attempts=3, backoff=0.01))
+
+        try:
+            self.assertEqual(await session.get(url), PAGE_OPEN.decode())
+            self.assertEqual(session.amount_requests, 1)
+        finally:
+            await session.close()
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
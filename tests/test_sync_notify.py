@@ -0,0 +1,72 @@
+import unittest
+
+from support import stand_in_options
+from lms_synergy_library import LMS
+from lms_synergy_library.utils import SoupLms
+
+
+def rows(amount: int) -> list:
+    return [
+        {"discipline": "Discipline", "teacher": "Teacher", "event": "Event %d" % number, "current_score": "1",
+         "message": "Message %d" % number}
+        for number in range(amount)
+    ]
+
+
+class SyncNotifyTest(unittest.TestCase):
+    def test_stops_at_watermark(self):
+        notify: list = rows(10)
+        pulled: list = []
+        closed: list = []
+
+        def iterate():
+            try:
+                for row in notify:
+                    pulled.append(row)
+                    yield row
+            finally:
+                closed.append(True)
+
+        sync: dict = LMS._sync_notify(iterate(), SoupLms.get_key_notify(notify[4]))
+
+        self.assertEqual(sync["notify"], notify[:4])
+        self.assertEqual(sync["watermark"], SoupLms.get_key_notify(notify[0]))
+        self.assertEqual(len(pulled), 5)
+        self.assertEqual(closed, [True])
+
+    def test_seen_keys(self):
+        notify: list = rows(6)
+        seen: list = [SoupLms.get_key_notify(row) for row in notify[2:]]
+
+        sync: dict = LMS._sync_notify((row for row in notify), seen)
+
+        self.assertEqual(sync["notify"], notify[:2])
+
+    def test_no_watermark_and_no_rows(self):
+        notify: list = rows(3)
+
+        self.assertEqual(LMS._sync_notify((row for row in notify), None)["notify"], notify)
+        self.assertEqual(LMS._sync_notify((row for row in []), "key"), {"notify": [], "watermark": "key"})
+
+    def test_second_sync_reads_first_page(self):
+        with stand_in_options(rows=10, pages_amount=5):
+            lms: LMS = LMS(login="user", password="password")
+            first: dict = lms.sync_notify()
+
+            requests: int = lms.amount_requests
+            second: dict = lms.sync_notify(first["watermark"])
+            second_requests: int = lms.amount_requests - requests
+
+            requests = lms.amount_requests
+            middle: dict = lms.sync_notify(SoupLms.get_key_notify(first["notify"][15]))
+            middle_requests: int = lms.amount_requests - requests
+
+        self.assertEqual(len(first["notify"]), 50)
+        self.assertEqual(second, {"notify": [], "watermark": first["watermark"]})
+        self.assertEqual(second_requests, 1)
+        self.assertEqual(middle["notify"], first["notify"][:15])
+        self.assertEqual(middle_requests, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()